@@ -1,7 +1,10 @@
 # cython: language_level=3
 import os
+import gzip
 from Bio import SeqIO
-from BioMetaDB.Accessories.ops import chunk
+from itertools import islice
+from Bio.SeqIO.FastaIO import SimpleFastaParser
+from Bio.SeqIO.QualityIO import FastqGeneralIterator
 from BioMetaDB.Indexers.index_extensions import IndexExtensions
 
 
@@ -67,14 +70,82 @@ class BioOps:
                 raise KeyError
 
     @staticmethod
-    def parse_large(str file_name, str data_type, int batch_size=10000):
+    def open_file(str file_name, str mode="r"):
+        """ Opens file for reading or writing, using gzip for files ending in .gz
+        Text modes ("r", "w", "a") open gzip files as text
+
+        :param file_name: (str)	Name of file
+        :param mode: (str)	Mode to open file in, default "r"
+        :return file:
         """
+        if file_name.endswith(".gz"):
+            if "b" not in mode and "t" not in mode:
+                mode += "t"
+            return gzip.open(file_name, mode)
+        return open(file_name, mode)
+
+    @staticmethod
+    def iter_records(str file_name, str data_type=None, bint tuples=False):
+        """ Generator yields records in fasta or fastq file one at a time, reading gzip files transparently
+        File is closed once all records are read, or when generator is closed
+
+        :param file_name:	(str)	Name of fasta or fastq file
+        :param data_type:	(str)	Fasta or fastq, determined from file extension if not passed
+        :param tuples:	(bool)	Yield lightweight (id, description, sequence) tuples instead of SeqRecord objects
+        """
+        cdef str title, seq
+        data_type = data_type or BioOps.get_type(file_name)
+        with BioOps.open_file(file_name) as R:
+            if not tuples:
+                yield from SeqIO.parse(R, data_type)
+            elif data_type == "fastq":
+                for title, seq, _ in FastqGeneralIterator(R):
+                    yield BioOps._title_to_id(title), title, seq
+            else:
+                for title, seq in SimpleFastaParser(R):
+                    yield BioOps._title_to_id(title), title, seq
+
+    @staticmethod
+    def iter_batches(str file_name, str data_type=None, int batch_size=10000, bint tuples=False):
+        """ Generator yields lists of at most batch_size records from fasta or fastq file
+
+        :param file_name:	(str)	Name of fasta or fastq file
+        :param data_type:	(str)	Fasta or fastq, determined from file extension if not passed
+        :param batch_size:	(int)	Number of records per batch, default 10000
+        :param tuples:	(bool)	Yield lightweight (id, description, sequence) tuples instead of SeqRecord objects
+        """
+        cdef list batch
+        record_iter = BioOps.iter_records(file_name, data_type, tuples)
+        try:
+            batch = list(islice(record_iter, batch_size))
+            while batch:
+                yield batch
+                batch = list(islice(record_iter, batch_size))
+        finally:
+            record_iter.close()
+
+    @staticmethod
+    def parse_large(str file_name, str data_type, int batch_size=10000):
+        """ Returns list of all records in file, reading batch_size records at a time
+        Use iter_records or iter_batches to process large files without loading all records
 
         :param file_name:	(str)	Name of fasta or fastq file
         :param data_type:	(str)	Fasta or fastq
         :param batch_size:	(int)	Size of batch for reading in, default 10000
         """
-        # Create iterator
-        record_iter = SeqIO.parse(open(file_name), data_type)
-        # Return complete records
-        return [list(batch) for batch in chunk(record_iter, batch_size)][0]
+        cdef list records = []
+        cdef list batch
+        for batch in BioOps.iter_batches(file_name, data_type, batch_size):
+            records.extend(batch)
+        return records
+
+    @staticmethod
+    def _title_to_id(title):
+        """ Protected method returns id portion of fasta/fastq title line, matching SeqRecord.id
+
+        :param title: (str)	Title line, without leading > or @
+        :return str:
+        """
+        if title == "":
+            return title
+        return title.split(None, 1)[0]
@@ -1,21 +1,23 @@
 #!/usr/bin/env python3
 
 import os
-import re
 from Bio import SeqIO
 import itertools as it
 from Bio.Seq import Seq
 from Bio.Alphabet import IUPAC
 from collections import Counter
 from BioMetaDB.Accessories.bio_ops import BioOps
+from BioMetaDB.Accessories.seq_extractor import SeqExtractor
 from BioMetaDB.Accessories.ops import read_until
 from BioMetaDB.Accessories.arg_parse import ArgParse
 from BioMetaDB.Indexers.index_mapper import IndexMapper
 from BioMetaDB.Indexers.index_mapper import IndexCreator
 from BioMetaDB.Indexers.index_mapper import IndexExtensions
+from BioMetaDB.Indexers.offset_index import OffsetIndex
 from BioMetaDB.Accessories.program_caller import ProgramCaller
 from BioMetaDB.Exceptions.get_exceptions import SequenceIdNotFoundError
 from BioMetaDB.Exceptions.get_exceptions import ImproperFormatIndexFileError
+from BioMetaDB.Exceptions.get_exceptions import ImproperFormatFastxFileError
 
 """
 Script handles file IO operations
@@ -23,54 +25,68 @@ Script handles file IO operations
 """
 
 
-def get_seq_from_file(file_name, seq_id):
+def get_seq_from_file(file_name, seq_id, list_file="None", regex=False):
     """ Locate sequence by ID/description (regex supported) and save to file
+    Ids/patterns may also be passed in a list file, and all are matched in a single pass through the file
+    Files with byte-offset index (see MAKEOFFSETIDX) are read directly at the location of requested IDs
 
     :param file_name: (str)	User-passed name of file
     :param seq_id: (str)	User-passed sequence id to get from file
+    :param list_file: (str)	File with list of sequence ids to get from file
+    :param regex: (bool)	Lines in list file are regex patterns
     """
     file_type = BioOps.get_type(file_name)
-    value_to_return = set()
-    seq_num = None
-    data = {}
-    try:
-        data = {record.id: record for record in BioOps.parse_large(file_name, file_type)}
-        value_to_return = data[seq_id]
-    # If value is not found in parsed file, try regex
-    except KeyError:
-        seq_num = 0
-        possible_seqs = list(data.keys())
-        possible_descriptions = {val.id: val.description for val in data.values()}
-        is_found = False
-        # Try each sequence to see if matches regex
-        for seq in possible_seqs:
-            found = re.search(seq_id, seq)
-            if found:
-                value_to_return.add(data[seq])
-                is_found = True
-                seq_num += 1
-        # Also check description to see for regex matches
-        for _id, desc in possible_descriptions.items():
-            found = re.search(seq_id, desc)
-            if found:
-                value_to_return.add(data[_id])
-                is_found = True
-                seq_num += 1
-        if not is_found:
-            print("Could not locate %s in %s" % (seq_id, file_name))
-            raise SequenceIdNotFoundError(seq_id)
-    file_name = os.path.splitext(file_name)[0]
-    # Write found sequence to file
-    out_file = "{}.{}".format(seq_id, file_name)
-    W = open(out_file, "w")
-    SeqIO.write(value_to_return, out_file, file_type)
-    W.close()
-    if not seq_num:
-        print(" Sequence {} copied from file {} to {}".format(seq_id, file_name, out_file))
+    extractor = (SeqExtractor.from_list_file(list_file, regex) if list_file != "None" else SeqExtractor())
+    exclusive_id = None
+    # Single id is matched exactly if possible, otherwise as regex
+    if seq_id is not None:
+        extractor = SeqExtractor(extractor.ids | {seq_id},
+                                 ([extractor.pattern.pattern] if extractor.pattern is not None else []) + [seq_id])
+        if list_file == "None":
+            exclusive_id = seq_id
+    request = (seq_id if seq_id is not None else os.path.basename(list_file))
+    # Write found sequences to file
+    out_file = "{}.{}".format(request, os.path.splitext(file_name)[0])
+    seq_num = _get_seqs_from_offset_index(file_name, out_file, file_type, extractor, exclusive_id)
+    if seq_num is None:
+        seq_num = extractor.extract(file_name, out_file, file_type, exclusive_id)
+    if seq_num == 0:
+        os.remove(out_file)
+        print("Could not locate %s in %s" % (request, file_name))
+        raise SequenceIdNotFoundError(request)
+    if exclusive_id is not None and seq_num == 1:
+        print(" Sequence {} copied from file {} to {}".format(request, file_name, out_file))
     else:
         print("{} sequence(s) copied from file {} to {}".format(seq_num, file_name, out_file))
 
 
+def _get_seqs_from_offset_index(file_name, out_file, file_type, extractor, exclusive_id):
+    """ Writes requested sequences using byte-offset index of file, if index exists and can answer request
+    Returns number of sequences written, or None if file must be searched
+
+    :param file_name: (str)	Name of fastx file
+    :param out_file: (str)	Name of file to write
+    :param file_type: (str)	Fasta or fastq
+    :param extractor: (SeqExtractor)	Requested ids and patterns
+    :param exclusive_id: (str)	Single id requested
+    :return int:
+    """
+    if not OffsetIndex.is_indexed(file_name):
+        return None
+    with OffsetIndex(file_name) as index:
+        if exclusive_id is not None and exclusive_id in index:
+            ids = [exclusive_id]
+        elif extractor.pattern is None:
+            # Read in file order
+            ids = sorted((_id for _id in extractor.ids if _id in index), key=lambda _id: index.entries[_id].offset)
+        else:
+            return None
+        with open(out_file, "w") as W:
+            for record in index.get_many(ids):
+                SeqIO.write(record, W, file_type)
+    return len(ids)
+
+
 def get_seqs_from_file(file_name, number):
     """ Retrieve a number of sequences from a file
 
@@ -78,12 +94,23 @@ def get_seqs_from_file(file_name, number):
     :param number: (str)	User-passed number, list or numbers, or range to get
     """
     indices_to_get = _translate_number_string_to_interval(number)
-    to_return = []
+    wanted = set(indices_to_get)
+    found = {}
     data_type = BioOps.get_type(file_name)
-    data = BioOps.parse_large(file_name, data_type)
+    records = BioOps.iter_records(file_name, data_type)
+    # Read only as far as the last requested record
+    try:
+        for index, record in enumerate(records):
+            if index in wanted:
+                found[index] = record
+                if len(found) == len(wanted):
+                    break
+    finally:
+        records.close()
+    if len(found) != len(wanted):
+        raise IndexError(number)
     # Build list of values to return based on user-passed indices (list, range, or value)
-    for index in indices_to_get:
-        to_return.append(data[index])
+    to_return = [found[index] for index in indices_to_get]
     # Write found sequence to file
     out_file = "selected.{}".format(file_name)
     W = open(out_file, "w")
@@ -132,16 +159,13 @@ def get_by_directory(directory):
         _file, ext = os.path.splitext(file)
         fullpath_old = os.path.join(directory, file)
         # Get all records in file
-        records_in_file = BioOps.parse_large(fullpath_old, data_type)
-        # Rename ids based on file name, add number to end to distinguish
-        num = 0
-        for record in records_in_file:
-            record.id += "_" + _file + "_" + str(num)
-            num += 1
+        records_in_file = BioOps.iter_records(fullpath_old, data_type)
         # Write renamed version of file to .tmp directory
+        # Rename ids based on file name, add number to end to distinguish
         fullpath_new = os.path.join(new_location, _file + ext)
         with open(fullpath_new, "w") as O:
-            SeqIO.write(records_in_file, O, data_type)
+            SeqIO.write(_rename_records(records_in_file, lambda record, num: record.id + "_" + _file + "_" + str(num)),
+                        O, data_type)
 
 
 def get_by_file(file_name):
@@ -153,15 +177,22 @@ def get_by_file(file_name):
     new_location = file_name + ".tmp"
     # Parse data file
     data_type = BioOps.get_type(file_name)
-    records_in_file = BioOps.parse_large(file_name, data_type)
-    num = 0
-    for record in records_in_file:
-        # Rename sequence id based on file name and a number for uniqueness
-        record.id = file_name + "_" + str(num)
-        num += 1
+    records_in_file = BioOps.iter_records(file_name, data_type)
     # Write sequences to new file
+    # Rename sequence id based on file name and a number for uniqueness
     with open(new_location, "w") as O:
-        SeqIO.write(records_in_file, O, data_type)
+        SeqIO.write(_rename_records(records_in_file, lambda record, num: file_name + "_" + str(num)), O, data_type)
+
+
+def _rename_records(records, new_id):
+    """ Generator yields records renamed using function of record and its number in file
+
+    :param records: (Iterator[SeqRecord])	Records to rename
+    :param new_id: (Callable[[SeqRecord, int], str])	Returns new id for record
+    """
+    for num, record in enumerate(records):
+        record.id = new_id(record, num)
+        yield record
 
 
 def get_t_to_u(file_name):
@@ -206,11 +237,19 @@ def reverse_complement_file(file_name):
     :param file_name: (str)	Name of file
     """
     data_type = BioOps.get_type(file_name)
-    records_in_file = BioOps.parse_large(file_name, data_type)
-    for record in records_in_file:
+    records_in_file = BioOps.iter_records(file_name, data_type)
+    SeqIO.write(_reverse_complement_records(records_in_file), "tmp." + file_name, data_type)
+
+
+def _reverse_complement_records(records):
+    """ Generator yields reverse complemented records
+
+    :param records: (Iterator[SeqRecord])
+    """
+    for record in records:
         record.reverse_complement()
         record.id += ".revComp"
-    SeqIO.write(records_in_file, "tmp." + file_name, data_type)
+        yield record
 
 
 def remove_ambiguity_from_file(file_name):
@@ -218,10 +257,22 @@ def remove_ambiguity_from_file(file_name):
 
     :param file_name: (str)	Name of file to edit
     """
-    data = []
     data_type = BioOps.get_type(file_name)
-    records_in_file = BioOps.parse_large(file_name, data_type)
-    for record in records_in_file:
+    records_in_file = BioOps.iter_records(file_name, data_type)
+    # Records are written to temporary file, which then replaces file being edited
+    directory, _file = os.path.split(file_name)
+    tmp_file_name = os.path.join(directory, "tmp." + _file)
+    with BioOps.open_file(tmp_file_name, "w") as W:
+        SeqIO.write(_remove_ambiguity_from_records(records_in_file), W, data_type)
+    os.replace(tmp_file_name, file_name)
+
+
+def _remove_ambiguity_from_records(records):
+    """ Generator yields records with ambiguous characters removed from sequence
+
+    :param records: (Iterator[SeqRecord])
+    """
+    for record in records:
         # Build new sequence
         new_seq = ""
         for val in record.seq:
@@ -234,8 +285,7 @@ def remove_ambiguity_from_file(file_name):
         # Default to protein otherwise
         except:
             record.seq = Seq(new_seq, IUPAC.unambiguous_rna)
-        data.append(record)
-    SeqIO.write(data, file_name, data_type)
+        yield record
 
 
 def summarize_file(file_name, view):
@@ -250,7 +300,7 @@ def summarize_file(file_name, view):
     # File to read
     record_metadata = {}
     num_records = 0
-    R = open(file_name, "rb")
+    R = BioOps.open_file(file_name, "rb")
     # Collect file data
     data = []
     if data_type == "fasta":
@@ -365,6 +415,22 @@ def make_file_index(file_name):
     IndexCreator.create_from_fastx(file_name)
 
 
+def make_offset_index(file_name):
+    """ Create byte-offset index of fastx file, for retrieving sequences without reading entire file
+
+    :param file_name: (str)	Name of fastx file to index, plain or compressed with bgzip
+    """
+    OffsetIndex.create(file_name)
+
+
+def bgzip_file(file_name):
+    """ Compress file with bgzip, allowing records in compressed file to be indexed
+
+    :param file_name: (str)	Name of file to compress, plain or compressed with gzip
+    """
+    print(" %s compressed to %s" % (file_name, OffsetIndex.bgzip(file_name)))
+
+
 def make_list_index(file_name):
     """ Creates simple index using simple list
 
@@ -458,6 +524,10 @@ if __name__ == '__main__':
          {"help": "Number of lines for which to skip indexing operation (default 0)", "default": "0"}],
         [["-c", "--comment"],
          {"help": "Comma-separated comment values indicating lines to retain but not parse", "default": "#"}],
+        [["-l", "--list_file"],
+         {"help": "File with list of sequence ids to get", "default": "None"}],
+        [["-r", "--regex"],
+         {"help": "Treat lines in list file as regex patterns", "default": False, "action": "store_true"}],
     ]
     programs = {
         "ID": get_seq_from_file,
@@ -470,6 +540,8 @@ if __name__ == '__main__':
         "REMOVEAMB": remove_ambiguity_from_file,
         "SUMMARIZE": summarize_file,
         "MAKEIDX": make_file_index,
+        "MAKEOFFSETIDX": make_offset_index,
+        "BGZIP": bgzip_file,
         "MAKEDIRIDX": make_dir_index,
         "MAKELISTIDX": make_list_index,
         "IDXTOFX": make_fastx_indexed,
@@ -477,7 +549,7 @@ if __name__ == '__main__':
         "IDXTODIR": rename_files_in_dir_using_index,
     }
     flags = {
-        "ID": ("file_name", "seq_id"),
+        "ID": ("file_name", "seq_id", "list_file", "regex"),
         "NUM": ("file_name", "number"),
         "RDIR": ("directory",),
         "RFILE": ("file_name",),
@@ -487,6 +559,8 @@ if __name__ == '__main__':
         "REMOVEAMB": ("file_name",),
         "SUMMARIZE": ("file_name", "view"),
         "MAKEIDX": ("file_name",),
+        "MAKEOFFSETIDX": ("file_name",),
+        "BGZIP": ("file_name",),
         "MAKEDIRIDX": ("directory",),
         "MAKELISTIDX": ("file_name",),
         "IDXTOFX": ("file_name",),
@@ -501,9 +575,10 @@ if __name__ == '__main__':
         IOError: "File path does not exist",
         TypeError: "Incorrect sequence type in file",
         ImproperFormatIndexFileError: "File is not in .imidx format",
+        ImproperFormatFastxFileError: "File cannot be indexed",
     }
     _help = {
-        "ID": "Program for getting a sequence from a file regex-matching request",
+        "ID": "Program for getting sequences from a file matching an id/regex, or a list of ids/regexes",
         "NUM": "Program for getting a sequence from a file by number, range, or list",
         "RDIR": "Program for renaming entire directory contents based on filenames",
         "RFILE": "Program for renaming sequences in a file based on filename",
@@ -513,6 +588,8 @@ if __name__ == '__main__':
         "REMOVEAMB": "Program removes ambiguous letters from sequence",
         "SUMMARIZE": "Program creates simple summary of sequences in file",
         "MAKEIDX": "Program creates index of fastx file",
+        "MAKEOFFSETIDX": "Program creates byte-offset index of fastx file, for fast retrieval by ID",
+        "BGZIP": "Program compresses file with bgzip, allowing compressed file to be offset indexed",
         "IDXTOFX": "Program converts fasta file to indexed version (or back!)",
         "IDXTOTSV": "Program converts tsv file to indexed version (or back!)",
         "IDXTODIR": "Program renames contents of directory using index values",
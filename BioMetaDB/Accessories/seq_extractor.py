@@ -0,0 +1,80 @@
+import re
+from Bio import SeqIO
+from BioMetaDB.Accessories.bio_ops import BioOps
+
+"""
+Script holds SeqExtractor, which copies records matching a set of ids and/or regex patterns from a fastx file
+Headers are checked against a single combined matcher, and matching records are written as they are found
+
+"""
+
+
+class SeqExtractor:
+    def __init__(self, ids=(), patterns=()):
+        """ Class matches records by exact id, or by searching id and description with any of a list of patterns
+
+        :param ids: (Iterable[str])     Exact ids to match
+        :param patterns: (Iterable[str])    Regex patterns, combined into one expression
+        """
+        self.ids = set(ids)
+        patterns = list(patterns)
+        self.pattern = (re.compile("|".join("(?:%s)" % pattern for pattern in patterns)) if patterns else None)
+
+    @staticmethod
+    def from_list_file(list_file, regex=False):
+        """ Returns SeqExtractor for newline-separated file of ids, or of patterns if regex is set
+
+        :param list_file: (str)     Path to list file
+        :param regex: (bool)    Lines in file are regex patterns
+        :return SeqExtractor:
+        """
+        with open(list_file, "r") as R:
+            values = [line.rstrip("\r\n") for line in R if line.rstrip("\r\n") != ""]
+        if regex:
+            return SeqExtractor(patterns=values)
+        return SeqExtractor(ids=values)
+
+    def matches(self, record):
+        """ Checks if record id is requested, or if its id or description match the combined pattern
+
+        :param record: (SeqRecord)
+        :return bool:
+        """
+        if record.id in self.ids:
+            return True
+        return self.pattern is not None and (self.pattern.search(record.id) is not None or
+                                             self.pattern.search(record.description) is not None)
+
+    def extract(self, file_name, out_file, data_type=None, exclusive_id=None):
+        """ Reads fastx file once, writing each matching record to out_file as it is found
+        When only exact ids are requested, reading stops once all ids have been found
+
+        :param file_name: (str)     Name of fastx file to read, may be gzipped
+        :param out_file: (str)  Name of file to write
+        :param data_type: (str)     Fasta or fastq, determined from file extension if not passed
+        :param exclusive_id: (str)  If a record with this exact id is found, output is only that record
+        :return int:    Number of records written
+        """
+        found = 0
+        data_type = data_type or BioOps.get_type(file_name)
+        ids_remaining = set(self.ids)
+        records = BioOps.iter_records(file_name, data_type)
+        try:
+            with open(out_file, "w") as W:
+                for record in records:
+                    if not self.matches(record):
+                        continue
+                    if record.id == exclusive_id:
+                        # Exact match replaces any records matched by pattern
+                        W.seek(0)
+                        W.truncate()
+                        SeqIO.write(record, W, data_type)
+                        return 1
+                    SeqIO.write(record, W, data_type)
+                    found += 1
+                    ids_remaining.discard(record.id)
+                    if self.pattern is None and not ids_remaining:
+                        break
+        finally:
+            records.close()
+        return found
@@ -1,27 +1,84 @@
 """
 Class for use by user - Build a DataTable and use this to update records and to write to a tsv
+Values are stored by column, with one list per column and an index of id: row
 
 """
 import os
+from collections.abc import MutableMapping
 
 
-class Data:
-    """ Data node for building objects with key:value attributes
+# Marks cells of a column that were never set for a record
+_UNSET = object()
+
+
+class RowData(MutableMapping):
+    """ Live key:value mapping of the attributes set for a single record of an UpdateData object
 
     """
-    def __init__(self, _id=""):
+    __slots__ = ("_parent", "_id")
+
+    def __init__(self, parent, _id):
+        self._parent = parent
         self._id = _id
-        self.data = {}
+
+    def __getitem__(self, key):
+        column = self._parent.columns.get(key)
+        if column is None or column[self._parent._ids[self._id]] is _UNSET:
+            raise KeyError(key)
+        return column[self._parent._ids[self._id]]
+
+    def __setitem__(self, key, value):
+        self._parent._column(key)[self._parent._ids[self._id]] = value
+
+    def __delitem__(self, key):
+        column = self._parent.columns.get(key)
+        if column is None or column[self._parent._ids[self._id]] is _UNSET:
+            raise KeyError(key)
+        column[self._parent._ids[self._id]] = _UNSET
+
+    def __iter__(self):
+        row = self._parent._ids[self._id]
+        return iter([key for key, column in self._parent.columns.items() if column[row] is not _UNSET])
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class Data:
+    """ View of a single record of an UpdateData object, for getting and setting key:value attributes
+    Views hold the record's id, so they remain valid when other records are deleted
+
+    """
+    __slots__ = ("_parent", "_id")
+
+    def __init__(self, parent, _id):
+        object.__setattr__(self, "_parent", parent)
+        object.__setattr__(self, "_id", _id)
+
+    @property
+    def _row(self):
+        return self._parent._ids[self._id]
+
+    @property
+    def data(self):
+        """ Live mapping of attributes set for this record. Changes are stored in the UpdateData object
+
+        :return:
+        """
+        return RowData(self._parent, self._id)
 
     def _get(self):
         """ Returns a dictionary consisting of the item and its attributes
 
         :return:
         """
-        return self.data
+        return dict(self.data)
 
     def get(self):
-        return self._id, self.data
+        return self._id, self._get()
 
     def delattr(self, attr):
         """ Removes column of info storage
@@ -29,8 +86,9 @@ class Data:
         :param attr:
         :return:
         """
-        if attr in self.data.keys():
-            del self.data[attr]
+        column = self._parent.columns.get(attr)
+        if column is not None and column[self._row] is not _UNSET:
+            column[self._row] = _UNSET
             return True
         return False
 
@@ -39,10 +97,20 @@ class Data:
 
         :return:
         """
-        try:
-            return self.data[attr]
-        except KeyError:
-            raise AttributeError
+        column = self._parent.columns.get(attr)
+        row = self._parent._ids.get(self._id)
+        if column is None or row is None or column[row] is _UNSET:
+            raise AttributeError(attr)
+        return column[row]
+
+    def __setattr__(self, key, value):
+        """ Sets attribute in column, same as setattr
+
+        :param key:
+        :param value:
+        :return:
+        """
+        self.setattr(key, value)
 
     def setattr(self, key, value):
         """ Function sets key, value pair for this object
@@ -51,7 +119,7 @@ class Data:
         :param value:
         :return:
         """
-        self.data[key] = value
+        self._parent._column(key)[self._row] = value
 
 
 class UpdateData:
@@ -59,9 +127,11 @@ class UpdateData:
     def __init__(self):
         self.tsv = ""
         self.num_records = 0
-        self._header = set()
-        self.data = [Data(), ]
+        # Ids in row order, and id: row
+        self.ids = []
         self._ids = {}
+        # Column name: list of values, aligned with ids
+        self.columns = {}
 
     def __repr__(self):
         """ Calls get function for string representation
@@ -78,6 +148,26 @@ class UpdateData:
         """
         self.delcol(item)
 
+    @property
+    def data(self):
+        """ List of row views, in order of addition
+
+        :return:
+        """
+        return [Data(self, _id) for _id in self.ids]
+
+    def _column(self, col_name):
+        """ Protected method returns list of values for column, adding column if needed
+
+        :param col_name:
+        :return:
+        """
+        column = self.columns.get(col_name)
+        if column is None:
+            column = [_UNSET] * self.num_records
+            self.columns[col_name] = column
+        return column
+
     def add(self, _id):
         """ Method for adding a new id to the list. Automatically called when UpdateData is accessed for
         a non-existing id
@@ -85,14 +175,11 @@ class UpdateData:
         :param _id:
         :return:
         """
-        if self.num_records == 0:
-            self.data[0] = Data(_id=_id)
-            self.num_records = 1
-            self._ids[_id] = 0
-            return
-        self.data.append(Data(_id=_id))
+        self._ids[_id] = self.num_records
+        self.ids.append(_id)
         self.num_records += 1
-        self._ids[_id] = self.num_records - 1
+        for column in self.columns.values():
+            column.append(_UNSET)
 
     def delcol(self, col_name):
         """ Removes tracked column from UpdateData structure tracking
@@ -100,29 +187,57 @@ class UpdateData:
         :param col_name:
         :return:
         """
-        range_obj = range(0, len(self.data))
-        success = False
-        for i in range_obj:
-            success = self.data[i].delattr(col_name)
-        if not success:
+        if col_name not in self.columns.keys():
             raise KeyError("Column name not found")
+        self.columns.pop(col_name)
+
+    def setcol(self, col_name, values):
+        """ Sets all values of a column at once. Ids not yet present are added
+
+        :param col_name:
+        :param values: (Dict[str, object]|Sequence[object])    id: value, or one value for each id, in row order
+        :return:
+        """
+        if isinstance(values, dict):
+            for _id in values.keys():
+                if _id not in self._ids.keys():
+                    self.add(_id)
+            column = self._column(col_name)
+            for _id, value in values.items():
+                column[self._ids[_id]] = value
+            return
+        values = list(values)
+        assert len(values) == self.num_records, "Number of values must match number of records"
+        self.columns[col_name] = values
+
+    def getcol(self, col_name, default=None, start=0, stop=None):
+        """ Returns values of a column, in row order, with default for records where it was not set
+        Only rows from start to stop are returned, all rows by default
+
+        :param col_name:
+        :param default:
+        :param start: (int)
+        :param stop: (int)
+        :return:
+        """
+        column = self.columns.get(col_name)
+        if column is None:
+            return [default] * len(range(self.num_records)[start: stop])
+        return [default if value is _UNSET else value for value in column[start: stop]]
 
     def keys(self):
-        """ Returns the ids of all Data objects stored in the UpdateData object
+        """ Returns the names of all columns stored in the UpdateData object
 
         :return:
         """
-        for value in self.data:
-            for val in value.data.keys():
-                self._header.add(val)
-        return self._header
+        return set(self.columns.keys())
 
     def get(self):
         """ Return list of dictionaries, each composed of a Data object
 
         :return:
         """
-        return [{val._id: val._get()} for val in self.data]
+        return [{row._id: row._get()} for row in self.data]
 
     def __getitem__(self, item):
         """ Allows class to be indexed and searched
@@ -134,43 +249,40 @@ class UpdateData:
         # ID stored
         item_type = type(item)
         if item_type == str:
-            # Return matching record
-            _id = self._ids.get(item, None)
-            if _id is not None:
-                return self.data[_id]
             # Not found, add to data
-            self.add(item)
-            # Get newest added value
-            return self.data[-1]
+            if item not in self._ids.keys():
+                self.add(item)
+            return Data(self, item)
         elif item_type == int:
             assert item < self.num_records, "Index must be less than length"
-            return self.data[item]
+            return Data(self, self.ids[item])
         # Slice of indices
         elif item_type == slice:
-            if type(item.start) is None:
-                item.start = 0
-            if type(item.stop) is None:
-                item.stop = -1
-            if type(item.step) is None:
-                item.start = 1
-            return tuple(self.data[i] for i in range(item.start, item.stop, item.step))
+            return tuple(Data(self, _id) for _id in self.ids[item])
         raise TypeError("Unable to determine type")
 
-    def __add__(self, other):
+    def merge(self, other):
+        """ Adds rows and columns of other UpdateData object. Values set in other replace those in this object
+
+        :param other:
+        :return:
+        """
         assert type(other) == UpdateData, "Must combine two UpdateData objects"
-        for item in other.data:
-            _id = self._ids.get(item, None)
-            if _id is not None:
-                for key, val in item._get().items():
-                    self.data[_id].setattr(key, val)
-            else:
-                self.data.append(Data(_id=item._id))
-                self.num_records += 1
-                for key, val in item._get().items():
-                    self.data[-1].setattr(key, val)
-                self._ids[item._id] = self.num_records - 1
+        for _id in other.ids:
+            if _id not in self._ids.keys():
+                self.add(_id)
+        # Row in this object of each row in other
+        rows = [self._ids[_id] for _id in other.ids]
+        for col_name, other_column in other.columns.items():
+            column = self._column(col_name)
+            for row, value in zip(rows, other_column):
+                if value is not _UNSET:
+                    column[row] = value
         return self
 
+    def __add__(self, other):
+        return self.merge(other)
+
     def __delitem__(self, item):
         """ Delete item from list of stored data
 
@@ -179,29 +291,34 @@ class UpdateData:
         """
         if type(item) == int:
             assert item < self.num_records, "Index must be less than length"
-            del self.data[item]
-            self.num_records -= 1
+            self._delete_rows({range(self.num_records)[item]})
         # Slice of indices
         elif type(item) == slice:
-            if type(item.start) is None:
-                item.start = 0
-            if type(item.stop) is None:
-                item.stop = -1
-            if type(item.step) is None:
-                item.start = 1
-            for i in range(item.start, item.stop, item.step):
-                del self.data[i]
-                self.num_records -= 1
+            self._delete_rows(set(range(*item.indices(self.num_records))))
         # ID stored
         elif type(item) == str:
             # Delete matching record
             _id = self._ids.get(item, None)
             if _id is not None:
-                del self.data[_id]
-                self.num_records -= 1
+                self._delete_rows({_id})
                 return
             raise ValueError("Item id not found")
-        raise TypeError("Unable to determine type")
+        else:
+            raise TypeError("Unable to determine type")
+
+    def _delete_rows(self, rows):
+        """ Protected method removes rows from ids and from each column, rebuilding id index
+
+        :param rows: (Set[int])
+        :return:
+        """
+        keep = [i for i in range(self.num_records) if i not in rows]
+        self.ids = [self.ids[i] for i in keep]
+        for col_name in list(self.columns.keys()):
+            column = self.columns[col_name]
+            self.columns[col_name] = [column[i] for i in keep]
+        self._ids = {_id: i for i, _id in enumerate(self.ids)}
+        self.num_records = len(self.ids)
 
     def to_file(self, file_name, delim="\t", na_rep="None", _order=None, skip_header=False):
         """ Write entire results to tsv or csv file, filling in gaps as needed with na_rep
@@ -217,28 +334,25 @@ class UpdateData:
         """
         # Store name of file
         self.tsv = UpdateData._handle_filename(file_name)
-        W = open(self.tsv, "w")
         # Write tsv header
         if _order is None:
             header = list(self.keys())
         else:
             header = list(_order)
-        header_line = "ID\t"
-        if not skip_header:
-            for head in header:
-                header_line += head + "\t"
-            W.write(header_line[:-1] + "\n")
-        # Write data, filling in as needed
-        for data in self.data:
-            W.write(data._id)
-            for head in header:
-                val = data.data.get(head, None)
-                if val:
-                    W.write(delim + str(val))
-                else:
-                    W.write(delim + na_rep)
-            W.write("\n")
-        W.close()
+        columns = [self.columns.get(head, [_UNSET] * self.num_records) for head in header]
+        with open(self.tsv, "w") as W:
+            if not skip_header:
+                W.write("\t".join(["ID"] + header) + "\n")
+            # Write data, filling in as needed
+            for i in range(self.num_records):
+                W.write(self.ids[i])
+                for column in columns:
+                    val = column[i]
+                    if val is not _UNSET and val:
+                        W.write(delim + str(val))
+                    else:
+                        W.write(delim + na_rep)
+                W.write("\n")
 
     def delete_file(self):
         """ Removes tsv file stored as object attribute
@@ -296,11 +410,15 @@ class UpdateData:
                 continue
             line = _line.rstrip("\r\n").split(delim)
             line_len = len(line)
+            if line[0] not in initial_data._ids.keys():
+                initial_data.add(line[0])
+            row = initial_data._ids[line[0]]
             for i in range(1, line_len):
                 if line[i] == na_rep:
                     line[i] = None
                 if has_header:
-                    initial_data[line[0]].setattr(header[i], line[i])
+                    initial_data._column(header[i])[row] = line[i]
                 else:
-                    initial_data[line[0]].setattr(header + str(i), line[i])
+                    initial_data._column(header + str(i))[row] = line[i]
+        R.close()
         return initial_data
@@ -2,6 +2,7 @@ import os
 import glob
 from configparser import ConfigParser
 from BioMetaDB.Config.directory_manager import Directories
+from BioMetaDB.Models.sqlite_profile import SQLiteProfile
 from BioMetaDB.Exceptions.config_manager_exceptions import TableNameNotFoundError, MultipleTablesFoundError, \
     ConfigFileNotFound
 from BioMetaDB.Exceptions.config_manager_exceptions import ConfigAssertString
@@ -27,6 +28,7 @@ class ConfigKeys:
     rel_work_dir = "rel_work_dir"
     rel_db_dir = "rel_db_dir"
     rel_classes_dir = "rel_classes_dir"
+    indexed_columns = "indexed_columns"
     DATABASES = "DATABASES"
     db_name = "db_name"
 
@@ -48,12 +50,23 @@ class ConfigManager:
         self.db_file = config[ConfigKeys.TABLES_TO_DB][table_name] + ".db"
         self.db_dir = os.path.join(config[ConfigKeys.DATABASES][ConfigKeys.working_dir], Directories.DATABASE)
         self.table_dir = os.path.join(config[ConfigKeys.DATABASES][ConfigKeys.db_dir], table_name)
+        # Location stored for records of table, relative to project directory
+        self.table_location = ConfigManager.get_table_location(table_name)
         self.classes_file = os.path.join(config[ConfigKeys.DATABASES][ConfigKeys.working_dir], "classes", table_name + ".json")
         self.rel_work_dir = config[ConfigKeys.DATABASES][ConfigKeys.rel_work_dir]
         self.rel_db_dir = config[ConfigKeys.DATABASES][ConfigKeys.rel_db_dir]
         self.rel_classes_dir = config[table_name][ConfigKeys.rel_classes_dir]
         self.migrations_dir = config[ConfigKeys.DATABASES][ConfigKeys.migrations_dir]
         self.config_dir = config[ConfigKeys.DATABASES][ConfigKeys.config_dir]
+        self.indexed_columns = ConfigManager.get_indexed_columns(config, table_name)
+
+    def sqlite_profile(self, name=SQLiteProfile.DEFAULT):
+        """ Returns PRAGMA settings of performance profile for project database
+
+        :param name: (str)  Name of profile, see SQLiteProfile
+        :return Dict[str, str]:
+        """
+        return SQLiteProfile.get(self.config, name)
 
     def update_config_file(self, table_name):
         """ Creates updated table info in config file, writes new file
@@ -63,6 +76,7 @@ class ConfigManager:
         """
         self.config[table_name] = {
             ConfigKeys.rel_classes_dir: os.path.join(self.working_dir, Directories.CLASSES),
+            ConfigKeys.indexed_columns: ",".join(self.indexed_columns),
         }
         self.config[ConfigKeys.TABLES_TO_DB][table_name] = self.db_name
         with open(os.path.join(os.path.join(self.working_dir, Directories.CONFIG), self.db_name + ".ini"), "w") as W:
@@ -101,6 +115,28 @@ class ConfigManager:
         config.read(config_file)
         return config, config_file
 
+    @staticmethod
+    def get_table_location(table_name):
+        """ Returns location of table directory relative to project directory, as stored for each record
+
+        :param table_name: (str)
+        :return str:
+        """
+        return os.path.join(Directories.DATABASE, table_name)
+
+    @staticmethod
+    def get_indexed_columns(config, table_name):
+        """ Returns names of columns that are indexed in addition to _id, as set in the table's section of config file,
+        e.g. `indexed_columns = n50,total_length`
+
+        :param config: (Config)
+        :param table_name: (str)
+        :return Tuple[str]:
+        """
+        return tuple(column.strip().lower()
+                     for column in config[table_name].get(ConfigKeys.indexed_columns, "").split(",")
+                     if column.strip() != "")
+
     @staticmethod
     def get_name_by_alias(alias, config):
         for key in config[ConfigKeys.TABLES_TO_ALIAS].keys():
@@ -0,0 +1,163 @@
+import time
+from sqlalchemy import bindparam, select
+from BioMetaDB.Accessories.ops import print_if_not_silent
+
+"""
+Script holds BulkManager, which writes large sets of records to an existing table
+using set-based lookups and executemany-style inserts/updates
+
+"""
+
+
+class BulkManager:
+    BATCH_SIZE = 10000
+    B_ID = "b_id"
+
+    def __init__(self, table, batch_size=None, silent=False):
+        """ BulkManager buffers inserts and updates for a table and writes them in batches.
+        Caller is responsible for the transaction, e.g. `with engine.begin() as conn:`
+
+        :param table: (Table)       Reflected or generated SQLAlchemy table
+        :param batch_size: (int)    Number of rows per executemany call
+        :param silent: (bool)
+        """
+        self.table = table
+        self.batch_size = batch_size or BulkManager.BATCH_SIZE
+        self.silent = silent
+        self.inserted = 0
+        self.updated = 0
+        self._inserts = []
+        self._updates = []
+        self._update_stmt = self.table.update().where(self.table.c._id == bindparam(BulkManager.B_ID))
+        self._start = time.time()
+
+    def existing_ids(self, conn):
+        """ Collects all ids currently stored in the table in a single query
+
+        :param conn: (Connection)
+        :return Set[str]:
+        """
+        return set(row[0] for row in conn.execute(select([self.table.c._id])))
+
+    def insert(self, conn, values):
+        """ Buffers a new record for insertion
+
+        :param conn: (Connection)
+        :param values: (Dict[str, object])  Column name: value, must include _id
+        :return:
+        """
+        self._inserts.append(values)
+        if len(self._inserts) >= self.batch_size:
+            self._flush_inserts(conn)
+
+    def update(self, conn, _id, values):
+        """ Buffers new values for an existing record
+
+        :param conn: (Connection)
+        :param _id: (str)   Id of record to update
+        :param values: (Dict[str, object])  Column name: value
+        :return:
+        """
+        values[BulkManager.B_ID] = _id
+        self._updates.append(values)
+        if len(self._updates) >= self.batch_size:
+            self._flush_updates(conn)
+
+    def flush(self, conn):
+        """ Writes all remaining buffered rows
+
+        :param conn: (Connection)
+        :return:
+        """
+        self._flush_inserts(conn)
+        self._flush_updates(conn)
+
+    def set_table(self, conn, table):
+        """ Writes all buffered rows, then writes later rows to table, e.g. after its schema is changed
+
+        :param conn: (Connection)
+        :param table: (Table)
+        :return:
+        """
+        self.flush(conn)
+        self.table = table
+        self._update_stmt = self.table.update().where(self.table.c._id == bindparam(BulkManager.B_ID))
+
+    def report(self):
+        """ Prints total number of rows written and overall throughput
+
+        :return:
+        """
+        elapsed = time.time() - self._start
+        print_if_not_silent(self.silent, " ..%i record(s) written in %.2fs (%s)" % (
+            self.inserted + self.updated, elapsed, BulkManager._rate(self.inserted + self.updated, elapsed)))
+
+    @staticmethod
+    def drop_secondary_indexes(conn, table_name):
+        """ Drops all indexes on table other than those on _id, so that rows are written without maintaining them
+
+        :param conn: (Connection)
+        :param table_name: (str)
+        :return int:    Number of indexes dropped
+        """
+        names = [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = ? "
+                                                "AND sql IS NOT NULL", (table_name,)).fetchall()]
+        dropped = 0
+        for name in names:
+            if "_id" in (row[2] for row in conn.execute('PRAGMA index_info("%s")' % name).fetchall()):
+                continue
+            conn.execute('DROP INDEX "%s"' % name)
+            dropped += 1
+        return dropped
+
+    @staticmethod
+    def create_indexes(conn, table, columns):
+        """ Builds an index for each column of table that is present, each in a single pass over the stored rows
+
+        :param conn: (Connection)
+        :param table: (Table)
+        :param columns: (Iterable[str])     Names of columns to index
+        :return int:    Number of indexes created
+        """
+        created = 0
+        for column in columns:
+            if column == "_id" or column not in table.c.keys():
+                continue
+            conn.execute('CREATE INDEX IF NOT EXISTS "ix_%s_%s" ON "%s" ("%s")' % (table.name, column, table.name, column))
+            created += 1
+        return created
+
+    def _flush_inserts(self, conn):
+        if not self._inserts:
+            return
+        conn.execute(self.table.insert(), self._inserts)
+        self.inserted += len(self._inserts)
+        self._inserts = []
+        self._progress()
+
+    def _flush_updates(self, conn):
+        if not self._updates:
+            return
+        # Pending inserts are written first, so that updates may target records added in this batch
+        self._flush_inserts(conn)
+        conn.execute(self._update_stmt, self._updates)
+        self.updated += len(self._updates)
+        self._updates = []
+        self._progress()
+
+    def _progress(self):
+        print_if_not_silent(self.silent, " ..%i inserted, %i updated (%s)" % (
+            self.inserted, self.updated,
+            BulkManager._rate(self.inserted + self.updated, time.time() - self._start)))
+
+    @staticmethod
+    def _rate(num_rows, elapsed):
+        """ Protected method formats throughput string
+
+        :param num_rows: (int)
+        :param elapsed: (float) Seconds
+        :return str:
+        """
+        if elapsed <= 0:
+            return "n/a rows/sec"
+        return "%i rows/sec" % (num_rows / elapsed)
@@ -1,15 +1,17 @@
 # cython: language_level=3
 import os
 import json
-import shutil
 from datetime import datetime
 from string import punctuation
-from sqlalchemy.orm import mapper
 from sqlalchemy import Column, Table, Integer, String, MetaData
 from BioMetaDB.Models.models import BaseData
+from BioMetaDB.Models.registry import Registry
+from BioMetaDB.Models.sqlite_profile import SQLiteProfile
 from BioMetaDB.Accessories.bio_ops import BioOps
-from BioMetaDB.Models.functions import Record
 from BioMetaDB.DBManagers.type_mapper import TypeMapper
+from BioMetaDB.DBManagers.bulk_manager import BulkManager
+from BioMetaDB.DBManagers.ingest_manager import IngestManager
+from BioMetaDB.DBManagers.store_manager import StoreManager
 from BioMetaDB.Accessories.ops import print_if_not_silent
 from BioMetaDB.Config.directory_manager import Directories
 from BioMetaDB.DBManagers.update_manager import UpdateManager
@@ -69,133 +71,150 @@ class ClassManager:
 
     @staticmethod
     def populate_data_to_existing_table(str table_name, object count_table_object, object config, object genome_files_to_add, str directory_name,
-                                        bint silent, str alias=None):
-        """ Method will load data from CountTable into database
+                                        bint silent, str alias=None, int batch_size=BulkManager.BATCH_SIZE,
+                                        bint backup=False, bint bulk_load=True):
+        """ Method will load data from CountTableStream into database
+        Existing ids are gathered in a single query, and records are written using batched inserts/updates
+        within a single transaction. Data files are placed in the table directory by IngestManager while records are written
 
+        :param batch_size: (int)    Number of rows written per executemany call
+        :param backup: (bool)   Save copy of table data to migrations directory before schema changes
+        :param bulk_load: (bool)    Drop indexes other than _id before writing, and build indexes set in config after
         :param silent:
         :param directory_name:
         :param alias:
         :param genome_files_to_add:
-        :param count_table_object:
+        :param count_table_object: (CountTableStream)
         :param table_name:
         :param config: (object)  ConfigManager object
         :return:
         """
-        # cdef object engine, sess
-        cdef set ids_to_add
+        cdef set file_ids
         cdef set table_class_attrs_keys
         cdef set data_file_attrs_keys
+        cdef set existing_ids
         cdef dict combined_attrs
-        cdef list to_add = []
+        cdef dict values, column_types
+        cdef list row
         cdef int existing_records = 0
         cdef int new_records = 0
         cdef int new_records_no_files = 0
         cdef int new_records_no_data_type = 0
+        cdef dict widened = {}
         cdef str _id_
         cdef object metadata, UpdatedDBClass
         print_if_not_silent(silent, "\nPopulating schema")
         print_if_not_silent(silent, " ..Loading database")
-        engine = BaseData.get_engine(config.db_dir, config.db_name + ".db")
-        sess = BaseData.get_session_from_engine(engine)
-        print_if_not_silent(silent, " ..Collecting class data")
-        TableClass = ClassManager.get_class_orm(table_name, engine)
-        print_if_not_silent(silent, " ..Determining updates")
-        table_class_attrs_keys = set(ClassManager.correct_iterable(ClassManager.get_class_as_dict(config).keys()))
-        if count_table_object is not None:
-            data_file_attrs_keys = set(ClassManager.correct_iterable(
-                key for key in count_table_object.header if key not in ("", " ", "#")))
-        else:
-            data_file_attrs_keys = set()
-        # Get combined values for writing to final JSON file
-        try:
-            combined_attrs = {**ClassManager.correct_dict(ClassManager.get_class_as_dict(config)),
-                              **ClassManager.correct_dict(TypeMapper.get_translated_types(count_table_object,
-                                                                                          TypeMapper.py_type_to_string))}
-        except AttributeError:
-            combined_attrs = ClassManager.correct_dict(ClassManager.get_class_as_dict(config))
-        # Update manager
-        # Initialize with DB class name, ConfigManager instance
-        # Will create csv file of all existing data,
-        # If differences found between what is in database table and what is in datafile
-        if len(table_class_attrs_keys - data_file_attrs_keys) != 0 or len(data_file_attrs_keys - table_class_attrs_keys) != 0 :
-            print_if_not_silent(silent, "\n!! New column data detected, calling update manager !!")
-            update_manager = UpdateManager(config, ClassManager.get_class_as_dict(config), sess)
-            table_copy_csv = update_manager.create_table_copy(datetime.today().strftime("%Y%m%d"), TableClass, silent)
-            print_if_not_silent(silent, " ..Combining existing columns with new headers")
-            UpdatedDBClass, metadata = ClassManager.generate_class(config.table_name,
-                                                                   combined_attrs,
-                                                                   config.db_dir,
-                                                                   config.db_name,
-                                                                   config.table_dir)
-            ClassManager.write_class(combined_attrs, config.classes_file)
-            # config.update_config_file(table_name)
-            UpdateManager.delete_old_table_and_populate(engine, TableClass, UpdatedDBClass, table_copy_csv, table_name,
-                                                         sess, silent)
-            TableClass = UpdatedDBClass
-            print_if_not_silent(silent, " ..Complete!\n")
-        UserClass = type(alias or table_name, (Record,), {})
-        mapper(UserClass, TableClass)
+        # Profile in effect before load is restored afterwards, even if load fails
+        cdef object prior_profile = (BaseData.get_profile(config.db_dir, config.db_name + ".db") or
+                                     config.sqlite_profile())
+        engine = BaseData.get_engine(config.db_dir, config.db_name + ".db", config.sqlite_profile(SQLiteProfile.BULK))
         try:
-            corrected_header = ClassManager.correct_iterable(count_table_object.header)
-        except AttributeError:
-            corrected_header = None
-        print_if_not_silent(silent, "\nGathering data by record:")
-        # Or operation on sets to get all ids to add
-        try:
-            ids_to_add = set(count_table_object.file_contents.keys()) | \
-                         set([os.path.splitext(_file)[0] for _file in genome_files_to_add if _file != "" and os.path.splitext(_file)[1] == ".gz"])
-        except AttributeError:
-            ids_to_add = set(count_table_object.file_contents.keys())
-        if '' in ids_to_add:
-            ids_to_add.remove('')
-        for _id_ in ids_to_add:
-            print_if_not_silent(silent, " ...Checking for record %s" % _id_)
-            record = sess.query(UserClass).filter_by(_id=_id_).first()
-            if record:
-                print_if_not_silent(silent, " ....Record exists, updating with new values\n")
-                existing_records += 1
-                # Add values in the table that are already in the database class
-                if corrected_header:
-                    for attr in corrected_header:
-                        try:
-                            setattr(record, attr, count_table_object.get_at(_id_, corrected_header.index(attr)))
-                        except KeyError:
-                            setattr(record, attr, None)
+            print_if_not_silent(silent, " ..Collecting class data")
+            TableClass = ClassManager.get_class_orm(table_name, engine)
+            print_if_not_silent(silent, " ..Determining updates")
+            table_class_attrs_keys = set(ClassManager.correct_iterable(ClassManager.get_class_as_dict(config).keys()))
+            if count_table_object is not None:
+                data_file_attrs_keys = set(ClassManager.correct_iterable(
+                    key for key in count_table_object.header if key not in ("", " ", "#")))
             else:
-                if directory_name != "None":
-                    print_if_not_silent(silent, " ....Moving new record from %s to %s" % (directory_name,
-                                                                                          config.rel_db_dir))
-                    if os.path.isfile(os.path.join(directory_name, _id_)):
-                        shutil.copy(os.path.join(directory_name, _id_),
-                                    os.path.join(config.table_dir, _id_))
-                        new_records += 1
-                    elif os.path.isfile(os.path.join(directory_name, _id_ + ".gz")):
-                        shutil.copy(os.path.join(directory_name, _id_ + ".gz"),
-                                    os.path.join(config.table_dir, _id_ + ".gz"))
-                        new_records += 1
-                    else:
-                        new_records_no_files += 1
-                else:
-                    new_records_no_files += 1
-                db_object = UserClass()
-                print_if_not_silent(silent, " ....Setting values for record %s in database\n" % _id_)
-                setattr(db_object, "_id", _id_)
-                setattr(db_object, "location", os.path.join(config.db_dir, table_name))
-                try:
-                    setattr(db_object, "data_type", BioOps.get_type(_id_))
-                except KeyError:
-                    setattr(db_object, "data_type", "unknown")
-                    new_records_no_data_type += 1
-                if corrected_header:
-                    for attr in corrected_header:
-                        try:
-                            setattr(db_object, attr, count_table_object.get_at(_id_, corrected_header.index(attr)))
-                        except KeyError:
-                            setattr(record, attr, None)
-                to_add.append(db_object)
-        for val in to_add:
-            sess.add(val)
-        sess.commit()
+                data_file_attrs_keys = set()
+            # Get combined values for writing to final JSON file
+            try:
+                combined_attrs = {**ClassManager.correct_dict(ClassManager.get_class_as_dict(config)),
+                                  **ClassManager.correct_dict(TypeMapper.get_translated_types(count_table_object,
+                                                                                              TypeMapper.py_type_to_string))}
+            except AttributeError:
+                combined_attrs = ClassManager.correct_dict(ClassManager.get_class_as_dict(config))
+            # Update manager
+            # If differences found between what is in database table and what is in datafile,
+            # table schema is changed in place. Csv file of all existing data is created only if backup is requested
+            if len(table_class_attrs_keys - data_file_attrs_keys) != 0 or len(data_file_attrs_keys - table_class_attrs_keys) != 0 :
+                print_if_not_silent(silent, "\n!! New column data detected, calling update manager !!")
+                if backup:
+                    sess = BaseData.get_session_from_engine(engine)
+                    update_manager = UpdateManager(config, ClassManager.get_class_as_dict(config), sess)
+                    update_manager.create_table_copy(datetime.today().strftime("%Y%m%d"), TableClass, silent)
+                print_if_not_silent(silent, " ..Combining existing columns with new headers")
+                UpdatedDBClass, metadata = ClassManager.generate_class(config.table_name,
+                                                                       combined_attrs,
+                                                                       config.db_dir,
+                                                                       config.db_name,
+                                                                       config.table_dir,
+                                                                       indexed_columns=config.indexed_columns)
+                ClassManager.write_class(combined_attrs, config.classes_file)
+                # config.update_config_file(table_name)
+                UpdateManager.evolve_table(engine, TableClass, UpdatedDBClass, table_name, silent)
+                Registry.invalidate(engine)
+                TableClass = UpdatedDBClass
+                print_if_not_silent(silent, " ..Complete!\n")
+            try:
+                corrected_header = ClassManager.correct_iterable(count_table_object.header)
+                # Parse each column of the count table once, using the types stored for the table
+                column_types = {
+                    count_table_object.header[i]: TypeMapper.string_to_py_type.get(combined_attrs.get(corrected_header[i]), str)
+                    for i in range(len(corrected_header))
+                }
+            except AttributeError:
+                corrected_header = None
+                column_types = None
+            # Ids of fastx files that are being added
+            file_ids = set(os.path.splitext(_file)[0] for _file in genome_files_to_add
+                           if _file != "" and os.path.splitext(_file)[1] == ".gz")
+            print_if_not_silent(silent, "\nGathering data by record:")
+            bulk_manager = BulkManager(TableClass, batch_size, silent)
+            # Files are placed using settings in [INGEST] section of config file
+            ingest_manager = (IngestManager.from_config(config.config, directory_name, config.table_dir, silent)
+                              if directory_name != "None" else None)
+            # Single transaction for all inserts and updates, along with index changes
+            with BaseData.transaction(engine) as conn:
+                if bulk_load and BulkManager.drop_secondary_indexes(conn, table_name) > 0:
+                    print_if_not_silent(silent, " ..Dropped secondary indexes for bulk load")
+                # Single query to determine which records already exist
+                existing_ids = bulk_manager.existing_ids(conn)
+                print_if_not_silent(silent, " ..%i record(s) currently in table" % len(existing_ids))
+                if count_table_object is not None:
+                    # Count table is read in batches, so only one batch of rows is held in memory
+                    for batch in count_table_object.batches(column_types):
+                        # Columns with values beyond the type sample that did not fit their type are widened in the
+                        # schema before the batch is written, so stored values always match the declared type
+                        if count_table_object.widened != widened:
+                            widened = dict(count_table_object.widened)
+                            TableClass = ClassManager._widen_columns(conn, engine, TableClass, config, combined_attrs,
+                                                                     count_table_object.widened, silent)
+                            bulk_manager.set_table(conn, TableClass)
+                        for _id_, row in batch.rows():
+                            values = dict(zip(corrected_header, row))
+                            if _id_ in existing_ids:
+                                existing_records += 1
+                                bulk_manager.update(conn, _id_, values)
+                                continue
+                            new_records, new_records_no_files, new_records_no_data_type = ClassManager._add_new_record(
+                                bulk_manager, conn, _id_, values, config, ingest_manager,
+                                (new_records, new_records_no_files, new_records_no_data_type)
+                            )
+                            existing_ids.add(_id_)
+                # Records with files but without data in the count table
+                for _id_ in file_ids - existing_ids:
+                    new_records, new_records_no_files, new_records_no_data_type = ClassManager._add_new_record(
+                        bulk_manager, conn, _id_, {attr: None for attr in (corrected_header or ())}, config,
+                        ingest_manager, (new_records, new_records_no_files, new_records_no_data_type)
+                    )
+                bulk_manager.flush(conn)
+                # Records are only committed once all files are placed
+                if ingest_manager is not None:
+                    ingest_manager.finish()
+                    if ingest_manager.store is not None:
+                        StoreManager.add_refs(conn, table_name, ingest_manager.digests.items())
+                if bulk_load and config.indexed_columns:
+                    print_if_not_silent(silent, " ..Building %i index(es)" % BulkManager.create_indexes(
+                        conn, TableClass, config.indexed_columns))
+            bulk_manager.report()
+            if widened:
+                ClassManager.write_class(combined_attrs, config.classes_file)
+        finally:
+            # Connections opened after load use the settings in effect before it
+            BaseData.get_engine(config.db_dir, config.db_name + ".db", prior_profile)
         print_if_not_silent(silent, " %i existing record(s) updated" % existing_records)
         print_if_not_silent(silent, " %i new record(s) added" % new_records)
         print_if_not_silent(silent, " %i new record(s) without data files added" % new_records_no_files)
@@ -203,6 +222,77 @@ class ClassManager:
         print_if_not_silent(silent, "Complete!\n")
         return combined_attrs
 
+    @staticmethod
+    def _widen_columns(object conn, object engine, object TableClass, object config, dict combined_attrs,
+                       dict widened, bint silent):
+        """ Protected method changes type of columns widened while loading count table, updating combined_attrs
+        Stored booleans of columns widened to strings are rewritten as True/False, as they would be read from file
+
+        :param conn: (Connection)   Connection with open transaction
+        :param engine: (Engine)
+        :param TableClass: (Table)  Current table
+        :param config: (ConfigManager)
+        :param combined_attrs: (Dict[str, str])     Column name: type name, updated in place
+        :param widened: (Dict[str, type])   Column name in count table: type, as from CountTableStream.widened
+        :param silent: (bool)
+        :return Table:  Table with updated schema
+        """
+        cdef str head, name
+        cdef object UpdatedDBClass, metadata
+        cdef list bool_to_str = []
+        for head, py_type in widened.items():
+            name = ClassManager.correct_iterable([head])[0]
+            if combined_attrs.get(name) == TypeMapper.py_type_to_string[py_type]:
+                continue
+            print_if_not_silent(silent, " ..Column %s has values that are not %s, storing as %s" % (
+                name, combined_attrs.get(name), TypeMapper.py_type_to_string[py_type]))
+            if combined_attrs.get(name) == TypeMapper.py_type_to_string[bool] and py_type == str:
+                bool_to_str.append(name)
+            combined_attrs[name] = TypeMapper.py_type_to_string[py_type]
+        UpdatedDBClass, metadata = ClassManager.generate_class(config.table_name,
+                                                               combined_attrs,
+                                                               config.db_dir,
+                                                               config.db_name,
+                                                               config.table_dir,
+                                                               indexed_columns=config.indexed_columns)
+        UpdateManager.evolve(conn, TableClass, UpdatedDBClass, config.table_name, silent)
+        for name in bool_to_str:
+            conn.execute('UPDATE "%s" SET "%s" = CASE "%s" WHEN \'1\' THEN \'True\' WHEN \'0\' THEN \'False\' '
+                         'ELSE "%s" END' % (config.table_name, name, name, name))
+        Registry.invalidate(engine)
+        return UpdatedDBClass
+
+    @staticmethod
+    def _add_new_record(object bulk_manager, object conn, str _id, dict values, object config,
+                        object ingest_manager, tuple counts):
+        """ Protected method queues data file for a new record (if present) and buffers record for insertion
+
+        :param bulk_manager: (BulkManager)
+        :param conn: (Connection)
+        :param _id: (str)   Id of new record
+        :param values: (Dict[str, object])  Column name: value from count table
+        :param config: (object)  ConfigManager object
+        :param ingest_manager: (IngestManager)    Places files from directory with files to add, None if no directory
+        :param counts: (Tuple[int, int, int])   Running counts of new records, records without files,
+                                                and records without data type
+        :return Tuple[int, int, int]: Updated counts
+        """
+        cdef int new_records, new_records_no_files, new_records_no_data_type
+        new_records, new_records_no_files, new_records_no_data_type = counts
+        if ingest_manager is not None and ingest_manager.submit(_id):
+            new_records += 1
+        else:
+            new_records_no_files += 1
+        values["_id"] = _id
+        values["location"] = config.table_location
+        try:
+            values["data_type"] = BioOps.get_type(_id)
+        except KeyError:
+            values["data_type"] = "unknown"
+            new_records_no_data_type += 1
+        bulk_manager.insert(conn, values)
+        return new_records, new_records_no_files, new_records_no_data_type
+
     @staticmethod
     def write_class(dict data_types, str class_output_file):
         """ Member writes python class as json object to file for loading
@@ -228,13 +318,13 @@ class ClassManager:
     @staticmethod
     def get_class_orm(str table_name, object engine):
         """ Method for loading a class' ORM from the database
+        Reflected table is cached by Registry
 
         :param engine:
         :param table_name:
         :return:
         """
-        cdef object metadata = MetaData(bind=engine, reflect=True)
-        return metadata.tables[table_name]
+        return Registry.get_table(table_name, engine)
 
     @staticmethod
     def get_class(str table_name, object engine):
@@ -245,14 +335,13 @@ class ClassManager:
         :param table_name:
         :return:
         """
-        cdef object metadata = MetaData(bind=engine, reflect=True)
-        UserClass = type(table_name, (Record,), {})
-        mapper(UserClass, metadata.tables[table_name])
-        return UserClass
+        return Registry.get_class(table_name, engine)
 
     @staticmethod
-    def generate_class(str table_name, dict class_as_dict, str db_dir, str db_name, str table_dir, object metadata=None, object engine=None):
+    def generate_class(str table_name, dict class_as_dict, str db_dir, str db_name, str table_dir, object metadata=None, object engine=None,
+                       tuple indexed_columns=()):
         """ Method generates class from dictionary and returns class
+        Only _id is indexed by default, as each index must be maintained on every insert
 
         :param metadata:
         :param table_name: (str)    Name of db table
@@ -260,14 +349,15 @@ class ClassManager:
         :param db_dir: (str)    Path to database directory
         :param db_name: (str)   Name of database
         :param table_dir: (str) Path to folder holding table/class files
+        :param indexed_columns: (Tuple[str])    Names of additional columns to index
         :return:
         """
         metadata = metadata or MetaData(bind=engine or BaseData.get_engine(db_dir, db_name), reflect=True)
         cdef object t = Table(table_name, metadata, Column('id', Integer, primary_key=True),
                    Column("_id", String, unique=True, index=True),
-                   Column("data_type", String, index=True),
-                   Column("location", String, index=True),
-                   *(Column(key, TypeMapper.string_to_loaded_sql_type[value], index=True,
+                   Column("data_type", String, index="data_type" in indexed_columns),
+                   Column("location", String, index="location" in indexed_columns),
+                   *(Column(key, TypeMapper.string_to_loaded_sql_type[value], index=key in indexed_columns,
                            default=ClassManager.default_data[value]) for
                     key, value in class_as_dict.items() if key not in ("_id", "data_type", "location")))
         setattr(t, "basedir", table_dir)
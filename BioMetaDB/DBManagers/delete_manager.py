@@ -0,0 +1,78 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from BioMetaDB.Models.models import BaseData
+from BioMetaDB.Config.directory_manager import Directories
+from BioMetaDB.DBManagers.store_manager import StoreManager
+from BioMetaDB.Accessories.ops import print_if_not_silent
+
+"""
+Script holds DeleteManager, which removes a set of records from a table using set-based statements
+Ids are loaded into a temporary table, records are deleted with a single statement, and files are removed in parallel
+Files in the project's store are only removed once no record references them
+
+"""
+
+
+class DeleteManager:
+    TEMP_TABLE = "_ids_to_delete"
+
+    def __init__(self, table_name, project_dir, silent=False, max_workers=None):
+        """ DeleteManager removes records, and their files, from a table
+
+        :param table_name: (str)
+        :param project_dir: (str)   Project directory, against which record locations are resolved
+        :param silent: (bool)
+        :param max_workers: (int)   Number of threads used to remove files
+        """
+        self.table_name = table_name
+        self.project_dir = project_dir
+        self.silent = silent
+        self.max_workers = max_workers
+
+    def delete(self, engine, ids):
+        """ Deletes records with ids in a single transaction, then removes their files
+
+        :param engine: (Engine)
+        :param ids: (Iterable[str])
+        :return Tuple[int, int, List[str]]:    Number of records deleted, number of files removed, ids not found
+        """
+        ids = set(ids)
+        with BaseData.transaction(engine) as conn:
+            conn.execute('CREATE TEMP TABLE "%s" (_id TEXT PRIMARY KEY)' % DeleteManager.TEMP_TABLE)
+            if ids:
+                conn.execute('INSERT INTO "%s" (_id) VALUES (?)' % DeleteManager.TEMP_TABLE, [(_id,) for _id in ids])
+            # Single join gathers file locations of all records to delete
+            found = conn.execute('SELECT t._id, t.location FROM "%s" AS t JOIN "%s" AS d ON t._id = d._id' % (
+                self.table_name, DeleteManager.TEMP_TABLE)).fetchall()
+            conn.execute('DELETE FROM "%s" WHERE _id IN (SELECT _id FROM "%s")' % (
+                self.table_name, DeleteManager.TEMP_TABLE))
+            released = StoreManager.release(conn, self.table_name, DeleteManager.TEMP_TABLE)
+            conn.execute('DROP TABLE temp."%s"' % DeleteManager.TEMP_TABLE)
+        print_if_not_silent(self.silent, " ..Removed %i record(s) from table" % len(found))
+        # Files are only removed once records are deleted
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            num_files = sum(executor.map(DeleteManager._remove_files,
+                                         (os.path.join(self.project_dir, location, _id) for _id, location in found
+                                          if location is not None)))
+        print_if_not_silent(self.silent, " ..Removed %i file(s)" % num_files)
+        if released:
+            with engine.connect() as conn:
+                print_if_not_silent(self.silent, " ..Removed %i unreferenced file(s) from store" % StoreManager(
+                    os.path.join(self.project_dir, Directories.DATABASE)).reclaim(conn, released, self.max_workers))
+        return len(found), num_files, sorted(ids.difference(_id for _id, location in found))
+
+    @staticmethod
+    def _remove_files(path):
+        """ Protected method removes data file of record, stored as path or as path.gz
+
+        :param path: (str)  Path to file, without .gz extension
+        :return int:    Number of files removed
+        """
+        removed = 0
+        for _path in (path, path + ".gz"):
+            try:
+                os.remove(_path)
+                removed += 1
+            except FileNotFoundError:
+                continue
+        return removed
@@ -0,0 +1,197 @@
+import os
+import fcntl
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from BioMetaDB.Accessories.ops import print_if_not_silent
+from BioMetaDB.DBManagers.store_manager import StoreManager
+
+"""
+Script holds IngestManager, which places data files of new records into a table directory using a pool of threads
+Files are copied, hard linked, reflinked, or symlinked, and files already present may be skipped by size or checksum
+Files are placed while record metadata is written to the database, optionally through the project's content-addressed store
+
+"""
+
+
+class IngestManager:
+    SECTION = "INGEST"
+    COPY = "copy"
+    HARDLINK = "hardlink"
+    REFLINK = "reflink"
+    SYMLINK = "symlink"
+    MODES = (COPY, HARDLINK, REFLINK, SYMLINK)
+    SKIP_NONE = "none"
+    SKIP_SIZE = "size"
+    SKIP_CHECKSUM = "checksum"
+    SKIPS = (SKIP_NONE, SKIP_SIZE, SKIP_CHECKSUM)
+    DEFAULTS = {
+        "mode": COPY,
+        "skip": SKIP_NONE,
+        # 0 uses ThreadPoolExecutor's default
+        "workers": "0",
+        # Keep one copy of each distinct file in db/.store, hard linked into table directories
+        "store": "no",
+    }
+    # ioctl request to share the data blocks of a file, from linux/fs.h
+    FICLONE = 0x40049409
+
+    def __init__(self, source_dir, table_dir, mode=COPY, skip=SKIP_NONE, workers=None, silent=False, store=None):
+        """ Class places files from source directory into table directory. Source directory is listed once
+
+        :param source_dir: (str)    Directory with files to add
+        :param table_dir: (str)     Directory holding files for table
+        :param mode: (str)  copy, hardlink, reflink, or symlink. Hard links and reflinks are copied if not supported
+        :param skip: (str)  none, size, or checksum. Files in table directory that match are not placed again
+        :param workers: (int)   Number of files placed at once
+        :param silent: (bool)
+        :param store: (StoreManager)    Store that files are added to. Files are always hashed, so skip is not used
+        """
+        assert mode in IngestManager.MODES, "INGEST mode must be one of %s" % ", ".join(IngestManager.MODES)
+        assert skip in IngestManager.SKIPS, "INGEST skip must be one of %s" % ", ".join(IngestManager.SKIPS)
+        self.source_dir = os.path.abspath(source_dir)
+        self.table_dir = table_dir
+        self.mode = mode
+        self.skip = skip
+        self.silent = silent
+        self.store = store
+        # Record id: digest of file, for files added to store
+        self.digests = {}
+        self.source_files = {entry.name for entry in os.scandir(self.source_dir) if entry.is_file()}
+        self.executor = ThreadPoolExecutor(max_workers=workers or None)
+        self.futures = []
+
+    @staticmethod
+    def get(config):
+        """ Returns settings of [INGEST] section of config file, with default values for any that are not present
+
+        :param config: (Config)
+        :return Dict[str, str]:
+        """
+        settings = dict(IngestManager.DEFAULTS)
+        if config.has_section(IngestManager.SECTION):
+            settings.update({key: value for key, value in config[IngestManager.SECTION].items()
+                             if key in IngestManager.DEFAULTS})
+        return settings
+
+    @staticmethod
+    def from_config(config, source_dir, table_dir, silent=False):
+        """ Returns IngestManager using settings from config file
+
+        :param config: (Config)
+        :param source_dir: (str)
+        :param table_dir: (str)
+        :param silent: (bool)
+        :return IngestManager:
+        """
+        settings = IngestManager.get(config)
+        store = None
+        if settings["store"].lower() in ("yes", "true", "on", "1"):
+            store = StoreManager(os.path.dirname(os.path.normpath(table_dir)))
+        return IngestManager(source_dir, table_dir, settings["mode"].lower(), settings["skip"].lower(),
+                             int(settings["workers"]), silent, store)
+
+    def submit(self, _id):
+        """ Queues data file of record, stored as _id or _id.gz in source directory, to be placed in table directory
+
+        :param _id: (str)   Record id
+        :return bool:   File was found
+        """
+        for name in (_id, _id + ".gz"):
+            if name in self.source_files:
+                self.futures.append((_id, self.executor.submit(self._place, name)))
+                return True
+        return False
+
+    def finish(self):
+        """ Waits for all queued files to be placed. Errors raised while placing files are raised here
+
+        :return Tuple[int, int]:    Number of files placed, number of files skipped
+        """
+        self.executor.shutdown(wait=True)
+        placed = 0
+        for _id, future in self.futures:
+            was_placed, digest = future.result()
+            placed += was_placed
+            if digest is not None:
+                self.digests[_id] = digest
+        skipped = len(self.futures) - placed
+        self.futures = []
+        print_if_not_silent(self.silent, " ..%i file(s) placed in table directory using %s" % (placed, self.mode))
+        if skipped > 0:
+            print_if_not_silent(self.silent, " ..%i file(s) already present were skipped" % skipped)
+        return placed, skipped
+
+    def _place(self, name):
+        """ Protected method places a single file in table directory
+
+        :param name: (str)  File name in source directory
+        :return Tuple[bool, Optional[str]]:   File was placed (False if skipped), digest if added to store
+        """
+        source = os.path.join(self.source_dir, name)
+        dest = os.path.join(self.table_dir, name)
+        if self.store is not None:
+            # Stored files are owned by the project, so never share an inode with, or link to, the source file.
+            # Reflinks share data blocks only until either file is written, so are kept
+            digest, placed = self.store.put(
+                source, dest, (shutil.copy if self.mode in (IngestManager.HARDLINK, IngestManager.SYMLINK)
+                               else self._write))
+            return placed, digest
+        if os.path.lexists(dest):
+            if self._is_present(source, dest):
+                return False, None
+            os.remove(dest)
+        self._write(source, dest)
+        return True, None
+
+    def _write(self, source, dest):
+        """ Protected method writes source file to new path using mode
+
+        :param source: (str)
+        :param dest: (str)  Path that does not exist
+        :return:
+        """
+        if self.mode == IngestManager.SYMLINK:
+            os.symlink(source, dest)
+        elif self.mode == IngestManager.HARDLINK:
+            try:
+                os.link(source, dest)
+            except OSError:
+                # Table directory is on a different file system
+                shutil.copy(source, dest)
+        elif self.mode == IngestManager.REFLINK:
+            IngestManager._reflink(source, dest)
+        else:
+            shutil.copy(source, dest)
+
+    def _is_present(self, source, dest):
+        """ Protected method checks if file in table directory already holds the data of source file
+
+        :param source: (str)
+        :param dest: (str)
+        :return bool:
+        """
+        try:
+            if os.path.samefile(source, dest):
+                return True
+        except OSError:
+            return False
+        if self.skip == IngestManager.SKIP_NONE or os.path.islink(dest):
+            return False
+        if os.path.getsize(source) != os.path.getsize(dest):
+            return False
+        return self.skip == IngestManager.SKIP_SIZE or StoreManager.checksum(source) == StoreManager.checksum(dest)
+
+    @staticmethod
+    def _reflink(source, dest):
+        """ Protected method creates copy of source that shares its data blocks, copying data if not supported
+
+        :param source: (str)
+        :param dest: (str)
+        :return:
+        """
+        with open(source, "rb") as R, open(dest, "wb") as W:
+            try:
+                fcntl.ioctl(W.fileno(), IngestManager.FICLONE, R.fileno())
+            except OSError:
+                shutil.copyfileobj(R, W, StoreManager.BLOCK_SIZE)
+        shutil.copymode(source, dest)
@@ -2,14 +2,15 @@
 import os
 import shutil
 from sys import exit
-from sqlalchemy.orm import mapper
 from sqlalchemy import text
 from BioMetaDB.Accessories.ops cimport to_cstring_array, free_cstring_array
 from BioMetaDB.Models.models import BaseData
-from BioMetaDB.Models.functions import Record
-from BioMetaDB.Config.config_manager import ConfigKeys
+from BioMetaDB.Config.config_manager import ConfigKeys, ConfigManager
 from BioMetaDB.Config.directory_manager import Directories
+from BioMetaDB.Models.sqlite_profile import SQLiteProfile
 from BioMetaDB.DBManagers.class_manager import ClassManager
+from BioMetaDB.DBManagers.manifest_manager import TableManifest, ManifestManager
+from BioMetaDB.DBManagers.store_manager import StoreManager
 from BioMetaDB.Exceptions.fix_exceptions import FixAssertString
 
 
@@ -39,7 +40,7 @@ def record_bad_location_file(**kwargs):
     except shutil.SameFileError:
         return "File in location"
     record = (kwargs["sess"]).query(kwargs["UserClass"]).filter(text("_id == '%s'" % kwargs["_id"])).first()
-    setattr(record, "location", os.path.join(kwargs["config"][ConfigKeys.DATABASES][ConfigKeys.db_dir], kwargs["table_name"]))
+    setattr(record, "location", ConfigManager.get_table_location(kwargs["table_name"]))
     setattr(record, "_id", os.path.basename(kwargs['fix_data']))
     return "Info <location> set to %s for %s" % (kwargs["fix_data"], kwargs["_id"])
 
@@ -65,6 +66,43 @@ def file_bad_record_record(**kwargs):
     setattr(record, "location", kwargs["_id"])
     return "Info <_id> set to %s for %s" % (kwargs["fix_data"], kwargs["_id"])
 
+def record_bad_checksum_none(**kwargs):
+    """ Function will announce that no changes were made for the given record's file contents
+
+    :param kwargs:
+    :return:
+    """
+    assert_kwargs_loaded(kwargs, "_id")
+    return "No changes to file contents for %s" % kwargs["_id"]
+
+def record_bad_checksum_file(**kwargs):
+    """ Function will replace the file of a record whose contents do not match its stored checksum
+    with the file passed in the .fix file, adding it to the project store
+    References are written in the session of the fix run, before files are replaced, and the prior stored file
+    is added to kwargs["reclaim"] so it is only removed once the run is committed
+
+    :param kwargs:
+    :return:
+    """
+    assert_kwargs_loaded(kwargs, "_id", "sess", "fix_data", "config", "table_name", "reclaim")
+    cdef str db_dir = kwargs["config"][ConfigKeys.DATABASES][ConfigKeys.db_dir]
+    cdef str table_dir = os.path.join(db_dir, kwargs["table_name"])
+    cdef str name = kwargs["_id"]
+    if not os.path.isfile(kwargs["fix_data"]):
+        return "Unable to replace file for %s" % kwargs["_id"]
+    if os.path.exists(os.path.join(table_dir, name + ".gz")) or \
+            (not os.path.exists(os.path.join(table_dir, name)) and kwargs["fix_data"].endswith(".gz")):
+        name += ".gz"
+    cdef str digest = StoreManager.checksum(kwargs["fix_data"])
+    cdef object conn = kwargs["sess"].connection()
+    old_digest = StoreManager.get_refs(conn, kwargs["table_name"]).get(kwargs["_id"])
+    StoreManager.add_refs(conn, kwargs["table_name"], ((kwargs["_id"], digest),))
+    # Stored file is replaced if it shares the damaged contents
+    StoreManager(db_dir).put(kwargs["fix_data"], os.path.join(table_dir, name), verify=True, digest=digest)
+    if old_digest is not None and old_digest != digest:
+        kwargs["reclaim"].add(old_digest)
+    return "File replaced with %s for %s" % (kwargs["fix_data"], kwargs["_id"])
+
 def record_bad_type_none(**kwargs):
     """ Function will make no changes to data_type of passed _id
 
@@ -233,6 +271,8 @@ cdef class IntegrityManager:
         """
         cdef object record
         cdef list all_records = sess.query(UserClass).all()
+        # Each location is listed once for this check, rather than checking each record's file
+        cdef dict listings = {}
         cdef set records_in_table_dir = set([os.path.basename(val) for val in os.listdir(
             os.path.join(self.config[ConfigKeys.DATABASES][ConfigKeys.db_dir],
                          table_name))])
@@ -240,7 +280,7 @@ cdef class IntegrityManager:
         cdef str _file
         cdef set record_paths = set()
         for record in all_records:
-            record_full_path = record.full_path()
+            record_full_path = record.full_path(listings)
             if record_full_path is not None:
                 record_paths.add(os.path.basename(record_full_path))
             # Data type of record is not known
@@ -259,6 +299,107 @@ cdef class IntegrityManager:
                 _file, "FILE", "BAD_RECORD", "DELETE", table_name)
             self.issues_found = 1
 
+    def manifest_record_check(self, list tables, object max_workers=None):
+        """ Method checks consistency of records in each table, as in record_check, using the file manifest of each
+        table directory. Records are loaded from the database in the calling thread, while table directories are
+        listed (only if changed since the last check) and new files are stat'd in a thread pool.
+        Files from the project store are checksummed only if their size or mtime changed since the last check.
+        Manifests are rewritten after the check
+
+        :param tables: (List[Tuple[str, Session, type]])   Table name, session, and mapped class of each table
+        :param max_workers: (int)   Number of threads used for filesystem checks
+        :return:
+        """
+        cdef str table_name, _id, data_type, name
+        cdef str working_dir = self.config[ConfigKeys.DATABASES][ConfigKeys.working_dir]
+        cdef object location, sess, UserClass, manifest
+        cdef list rows
+        cdef dict table_rows = {}
+        cdef list manifests = []
+        cdef set external_paths = set()
+        cdef set existing_paths
+        cdef set record_paths
+        cdef dict files
+        cdef dict table_refs = {}
+        cdef list to_stat = [], stat_entries = [], to_verify = [], bad
+        cdef dict changed
+        cdef set bad_paths
+        cdef int i
+        for table_name, sess, UserClass in tables:
+            # Files added through the project store are verified against their checksums
+            table_refs[table_name] = StoreManager.get_refs(sess.connection(), table_name)
+            manifest = TableManifest(self.config[ConfigKeys.DATABASES][ConfigKeys.config_dir], table_name,
+                                     os.path.join(self.config[ConfigKeys.DATABASES][ConfigKeys.db_dir], table_name))
+            rows = []
+            for _id, location, data_type in sess.query(UserClass._id, UserClass.location, UserClass.data_type):
+                # Locations are resolved against project directory
+                if location is not None:
+                    location = os.path.normpath(os.path.join(working_dir, location))
+                rows.append((_id, location, data_type))
+                # Files stored outside of table directory are checked directly
+                if location is not None and location != manifest.table_dir:
+                    external_paths.add(location + "/" + _id)
+                    external_paths.add(location + "/" + _id + ".gz")
+            table_rows[table_name] = rows
+            manifests.append(manifest)
+        existing_paths = ManifestManager(max_workers).scan(manifests, external_paths)
+        for manifest in manifests:
+            table_name = manifest.table_name
+            files = manifest.files
+            record_paths = set()
+            for _id, location, data_type in table_rows[table_name]:
+                name = None
+                if location is not None and location != manifest.table_dir:
+                    if location + "/" + _id in existing_paths:
+                        name = _id
+                    elif location + "/" + _id + ".gz" in existing_paths:
+                        name = _id + ".gz"
+                elif _id in files:
+                    name = _id
+                elif _id + ".gz" in files:
+                    name = _id + ".gz"
+                if name is not None:
+                    record_paths.add(name)
+                    manifest.assign(name, _id)
+                    # Stored files already in manifest are verified if changed. New files were hashed when added
+                    if _id in table_refs[table_name] and name in manifest.entries and \
+                            (location is None or location == manifest.table_dir):
+                        to_stat.append((manifest, name))
+                        stat_entries.append((table_name, _id, os.path.join(manifest.table_dir, name),
+                                             table_refs[table_name][_id]))
+                # Data type of record is not known
+                if data_type == "unknown":
+                    self.fix_file.write_issue_with_location(
+                        _id, "RECORD", "BAD_TYPE", "NONE", table_name)
+                    self.issues_found = 1
+                # File for record, as stored in db, does not exist
+                if name is None:
+                    self.fix_file.write_issue_with_location(
+                        _id, "RECORD", "BAD_LOCATION", "NONE", table_name)
+                    self.issues_found = 1
+            for name in sorted(set(files.keys()).difference(record_paths)):
+                # File is in db directory but not in database table
+                self.fix_file.write_issue_with_location(
+                    name, "FILE", "BAD_RECORD", "DELETE", table_name)
+                self.issues_found = 1
+        changed = ManifestManager(max_workers).changed(to_stat)
+        to_verify = [stat_entries[i] for i in sorted(changed.keys())]
+        bad = ManifestManager(max_workers).verify(to_verify)
+        for table_name, _id, name, digest in bad:
+            # File contents do not match checksum stored when file was added
+            self.fix_file.write_issue_with_location(
+                _id, "RECORD", "BAD_CHECKSUM", "NONE", table_name)
+            self.issues_found = 1
+        # Files that match their checksum are recorded with their current size and mtime,
+        # while damaged files keep their prior entry so they are checked again
+        bad_paths = {entry[2] for entry in bad}
+        for i in changed.keys():
+            if changed[i] is not None and stat_entries[i][2] not in bad_paths:
+                manifest, name = to_stat[i]
+                manifest.files[name][:2] = changed[i]
+        for manifest in manifests:
+            manifest.save()
+
     def parse_and_fix(self, bint silent):
         """ Reads .fix file and calls function for all valid issues
 
@@ -271,16 +412,18 @@ cdef class IntegrityManager:
         cdef object return_val = ""
         cdef object sess = None, UserClass = None, engine = None, TableClass = None
         cdef str current_table_name
+        # Digests of stored files that fixes may have left unreferenced
+        cdef set reclaim = set()
         engine = BaseData.get_engine(self.config[ConfigKeys.DATABASES][ConfigKeys.db_dir],
-                                     self.config[ConfigKeys.DATABASES][ConfigKeys.db_name] + ".db")
+                                     self.config[ConfigKeys.DATABASES][ConfigKeys.db_name] + ".db",
+                                     SQLiteProfile.get(self.config))
         sess = BaseData.get_session_from_engine(engine)
         # Generate table class and name based on presence of alias
         # Issues are in format (_id, location, parsed_issue, fix_data)
         current_table_name = issues[0][1]
         if current_table_name != "NONE":
             TableClass = ClassManager.get_class_orm(current_table_name, engine)
-            UserClass = type(current_table_name, (Record,), {})
-            mapper(UserClass, TableClass)
+            UserClass = ClassManager.get_class(current_table_name, engine)
         cdef set possible_functions = set(self.function_hash.keys())
         for i in range(self.fix_file.num_issues):
             # Only re-generate table information if needed
@@ -288,8 +431,7 @@ cdef class IntegrityManager:
             if current_table_name != "NONE" and issues[i][1] != current_table_name:
                 current_table_name = issues[i][1]
                 TableClass = ClassManager.get_class_orm(current_table_name, engine)
-                UserClass = type(current_table_name, (Record,), {})
-                mapper(UserClass, TableClass)
+                UserClass = ClassManager.get_class(current_table_name, engine)
             # Clear info as needed
             elif issues[i][1] == "NONE":
                 current_table_name = "NONE"
@@ -307,7 +449,8 @@ cdef class IntegrityManager:
                                                               engine=engine,
                                                               cfg=self.config,
                                                               silent=silent,
-                                                              table_name=current_table_name)
+                                                              table_name=current_table_name,
+                                                              reclaim=reclaim)
             else:
                 print("Invalid fix data passed for %s" % issues[i][0])
             # Print results of each fix
@@ -315,6 +458,9 @@ cdef class IntegrityManager:
                 print(return_val, "\n")
         # Commit all changes to the database
         sess.commit()
+        if reclaim:
+            with engine.connect() as conn:
+                StoreManager(self.config[ConfigKeys.DATABASES][ConfigKeys.db_dir]).reclaim(conn, reclaim)
 
     cdef dict _create_function_hash(self):
         cdef dict function_hash = {}
@@ -323,6 +469,8 @@ cdef class IntegrityManager:
         function_hash["FILE|BAD_RECORD|DELETE"] = file_bad_record_delete
         function_hash["FILE|BAD_RECORD|RECORD"] = file_bad_record_record
         function_hash["RECORD|BAD_TYPE|NONE"] = record_bad_type_none
+        function_hash["RECORD|BAD_CHECKSUM|NONE"] = record_bad_checksum_none
+        function_hash["RECORD|BAD_CHECKSUM|FILE"] = record_bad_checksum_file
         function_hash["RECORD|BAD_TYPE|SET"] = record_bad_type_set
         # function_hash["TABLE|BAD_TABLE|DELETE"] = table_bad_table_delete
         # function_hash["TABLE|BAD_TABLE|TSV"] = table_bad_table_tsv
@@ -0,0 +1,97 @@
+from collections import OrderedDict
+from BioMetaDB.Models.models import BaseData
+from BioMetaDB.Models.registry import Registry
+from BioMetaDB.Config.config_manager import ConfigManager
+from BioMetaDB.Models.sqlite_profile import SQLiteProfile
+from BioMetaDB.DataStructures.record_list import RecordList
+
+"""
+Script holds LinkManager, which runs linked queries (~>, ->, >>) across tables in a project
+Matching ids are resolved with a single statement, and each linked table is queried once
+
+"""
+
+
+class LinkManager:
+    def __init__(self, config, tables_in_database, truncate=False):
+        """ LinkManager shares a single session for all tables in project
+
+        :param config: (Config)     Loaded config file
+        :param tables_in_database: (Iterable[str])  Names of tables in project
+        :param truncate: (bool)     Passed to each RecordList
+        """
+        self.config = config
+        self.tables_in_database = set(tables_in_database)
+        self.truncate = truncate
+        self._sess = None
+
+    def load_table_metadata(self, tbl_name):
+        """ Returns session, mapped class, and ConfigManager for table
+
+        :param tbl_name: (str)
+        :return Tuple[Session, type, ConfigManager]:
+        """
+        cfg = ConfigManager(self.config, tbl_name)
+        engine = BaseData.get_engine(cfg.db_dir, cfg.db_name + ".db", cfg.sqlite_profile(SQLiteProfile.READ))
+        if self._sess is None:
+            self._sess = BaseData.get_session_from_engine(engine)
+        return self._sess, Registry.get_class(tbl_name, engine), cfg
+
+    def record_list(self, tbl_name, query, ids=None):
+        """ Returns RecordList for table with query run. Empty query returns all records
+
+        :param tbl_name: (str)
+        :param query: (str)     Query string, may use RecordList convenience queries
+        :param ids: (Query)     Optional query of ids to restrict results to
+        :return RecordList:
+        """
+        sess, UserClass, cfg = self.load_table_metadata(tbl_name)
+        rl = RecordList(sess, UserClass, cfg, compute_metadata=False, truncate=self.truncate)
+        if query.replace(" ", "") != '' and query != "None":
+            rl.query(query, ids=ids)
+        else:
+            rl.query(ids=ids)
+        return rl
+
+    def linked_ids(self, *table_queries):
+        """ Returns ids that match every (table name, query) pair, gathered in a single statement
+
+        :param table_queries: (Tuple[str, str])     Table name and query string
+        :return List[str]:
+        """
+        id_queries = [self.record_list(tbl_name, query).id_query() for tbl_name, query in table_queries]
+        if None in id_queries:
+            return []
+        return [row[0] for row in id_queries[0].intersect(*id_queries[1:])]
+
+    def group_by_table(self, ids):
+        """ Groups ids by the table that they link to (first portion of id, before '.'), in order
+        of first appearance. Ids linking to tables that are not in the project are skipped
+
+        :param ids: (Iterable[str])
+        :return OrderedDict[str, List[str]]:
+        """
+        tables = OrderedDict()
+        for _id in ids:
+            tbl_name = _id.split(".")[0]
+            if tbl_name in self.tables_in_database:
+                tables.setdefault(tbl_name, []).append(_id)
+        return tables
+
+    def query_linked_tables(self, ids, query, write, write_tsv):
+        """ Runs query once on each table linked to by ids, then writes or summarizes results
+
+        :param ids: (Iterable[str])     Linking ids
+        :param query: (str)     Query to run on each linked table
+        :param write: (str)     Output directory for records, or "None"
+        :param write_tsv: (str)     Suffix of output .tsv for each table, or "None"
+        :return:
+        """
+        for tbl_name in self.group_by_table(ids).keys():
+            annot_rl = self.record_list(tbl_name, query)
+            if write_tsv != 'None':
+                annot_rl.write_tsv(tbl_name + "." + write_tsv.replace(".tsv", "") + ".tsv")
+            if write != 'None' and len(annot_rl) > 0:
+                annot_rl.write_records(write)
+            if write_tsv == 'None' and write == 'None':
+                annot_rl.summarize()
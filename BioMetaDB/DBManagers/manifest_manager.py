@@ -0,0 +1,186 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from BioMetaDB.DBManagers.store_manager import StoreManager
+
+"""
+Script holds TableManifest and ManifestManager, which track the files in each table directory between integrity checks
+A manifest stores (file name, size, mtime, record id) for each file, along with the mtime of the table directory
+Directories whose mtime is unchanged are not listed again, and only files new to a directory are stat'd
+
+"""
+
+
+class TableManifest:
+    EXT = ".manifest"
+    # Directory mtimes this close to the time of the check may still change within the filesystem's timestamp resolution
+    SETTLE_NS = 2 * 10 ** 9
+
+    def __init__(self, config_dir, table_name, table_dir):
+        """ Class loads manifest of table directory, if present and written for the same directory
+
+        :param config_dir: (str)    Project config directory, in which manifests are stored
+        :param table_name: (str)
+        :param table_dir: (str)     Directory holding files for table
+        """
+        self.file_name = os.path.join(config_dir, table_name + TableManifest.EXT)
+        self.table_name = table_name
+        self.table_dir = os.path.normpath(table_dir)
+        # Table directory is stored relative to project directory, so manifest remains valid after MOVE
+        self.rel_table_dir = os.path.relpath(self.table_dir, os.path.dirname(os.path.normpath(config_dir)))
+        self.dir_mtime = -1
+        # file name: [size, mtime, record id]
+        self.entries = {}
+        # Files currently in directory, set by list_changes
+        self.files = {}
+        self._load()
+
+    def _load(self):
+        """ Protected method reads manifest file. Manifests written for a different table directory are ignored
+
+        :return:
+        """
+        if not os.path.isfile(self.file_name):
+            return
+        with open(self.file_name, "r") as R:
+            header = R.readline().rstrip("\r\n").lstrip("#").split("\t")
+            if len(header) != 2 or header[1] != self.rel_table_dir:
+                return
+            for line in R:
+                line = line.rstrip("\r\n").split("\t")
+                if len(line) != 4:
+                    return
+                self.entries[line[0]] = [int(line[1]), int(line[2]), line[3]]
+        self.dir_mtime = int(header[0])
+
+    def list_changes(self):
+        """ Sets files in table directory, listing it only if it has changed since manifest was written
+
+        :return List[str]:  Names of files not in manifest, which need to be stat'd
+        """
+        if not os.path.isdir(self.table_dir):
+            self.files = {}
+            return []
+        # Directory is stat'd before listing, so later changes are seen by the next check
+        dir_mtime = os.stat(self.table_dir).st_mtime_ns
+        if dir_mtime == self.dir_mtime:
+            self.files = {name: list(entry) for name, entry in self.entries.items()}
+            return []
+        self.dir_mtime = (dir_mtime if time.time_ns() - dir_mtime > TableManifest.SETTLE_NS else -1)
+        self.files = {}
+        new_files = []
+        for name in os.listdir(self.table_dir):
+            if name in self.entries:
+                self.files[name] = list(self.entries[name])
+            else:
+                new_files.append(name)
+        return new_files
+
+    def add(self, name, size, mtime):
+        self.files[name] = [size, mtime, ""]
+
+    def assign(self, name, _id):
+        """ Sets id of record that file belongs to
+
+        :param name: (str)  File name
+        :param _id: (str)   Record id
+        :return:
+        """
+        if name in self.files:
+            self.files[name][2] = _id
+
+    def save(self):
+        """ Writes current files in table directory to manifest
+
+        :return:
+        """
+        with open(self.file_name, "w") as W:
+            W.write("#%i\t%s\n" % (self.dir_mtime, self.rel_table_dir))
+            for name in sorted(self.files.keys()):
+                size, mtime, _id = self.files[name]
+                W.write("%s\t%i\t%i\t%s\n" % (name, size, mtime, _id))
+        self.entries = self.files
+
+    def remove(self):
+        if os.path.isfile(self.file_name):
+            os.remove(self.file_name)
+
+
+class ManifestManager:
+    def __init__(self, max_workers=None):
+        """ Class runs filesystem work for integrity checks of multiple tables using a thread pool
+
+        :param max_workers: (int)   Number of threads, default is ThreadPoolExecutor's default
+        """
+        self.max_workers = max_workers
+
+    @staticmethod
+    def _stat(path):
+        """ Protected method returns size and mtime of file, or None if it does not exist
+
+        :param path: (str)
+        :return Optional[Tuple[int, int]]:
+        """
+        try:
+            stat_result = os.stat(path)
+        except OSError:
+            return None
+        return stat_result.st_size, stat_result.st_mtime_ns
+
+    def scan(self, manifests, paths=()):
+        """ Lists changed table directories and stats new files in parallel, updating files of each manifest.
+        Additional paths, such as record files stored outside of table directories, are checked in the same pool
+
+        :param manifests: (List[TableManifest])
+        :param paths: (Iterable[str])   Paths to check for existence
+        :return Set[str]:   Paths that exist and are files
+        """
+        paths = list(paths)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            new_files = list(executor.map(TableManifest.list_changes, manifests))
+            to_stat = [(manifest, name) for manifest, names in zip(manifests, new_files) for name in names]
+            results = executor.map(
+                ManifestManager._stat,
+                [os.path.join(manifest.table_dir, name) for manifest, name in to_stat]
+            )
+            for (manifest, name), result in zip(to_stat, results):
+                if result is not None:
+                    manifest.add(name, *result)
+            return {path for path, is_file in zip(paths, executor.map(os.path.isfile, paths))
+                    if is_file}
+
+    def changed(self, manifests_names):
+        """ Stats files in parallel, returning those whose size or mtime differs from their manifest entry
+
+        :param manifests_names: (List[Tuple[TableManifest, str]])  Manifest and name of each file in its table directory
+        :return Dict[int, Optional[Tuple[int, int]]]:   Index in list: current size and mtime, None if file is missing
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(
+                ManifestManager._stat,
+                [os.path.join(manifest.table_dir, name) for manifest, name in manifests_names]
+            ))
+        return {i: result for i, ((manifest, name), result) in enumerate(zip(manifests_names, results))
+                if result is None or list(result) != manifest.files[name][:2]}
+
+    def verify(self, files):
+        """ Computes checksums of files in parallel, returning those that do not match their expected digest
+
+        :param files: (List[Tuple[str, str, str, str]])     Table name, record id, path, and expected digest of each file
+        :return List[Tuple[str, str, str, str]]:    Entries of files that do not match or cannot be read
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            digests = list(executor.map(ManifestManager._checksum, [path for _, _, path, _ in files]))
+        return [entry for entry, digest in zip(files, digests) if digest != entry[3]]
+
+    @staticmethod
+    def _checksum(path):
+        """ Protected method returns sha256 digest of file, or None if it cannot be read
+
+        :param path: (str)
+        :return Optional[str]:
+        """
+        try:
+            return StoreManager.checksum(path)
+        except OSError:
+            return None
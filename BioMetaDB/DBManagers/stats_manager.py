@@ -0,0 +1,119 @@
+from math import sqrt
+from sqlalchemy import func, cast, Float
+
+"""
+Script holds StatsManager, which computes the column statistics displayed by RecordList.summarize within the database
+Numeric aggregates are gathered in one SELECT per chunk of columns, and text frequencies are counted using GROUP BY
+
+"""
+
+
+class StatsManager:
+    # Number of numeric columns aggregated per SELECT
+    CHUNK_SIZE = 200
+    # Positions of values in numeric column summaries
+    AVG, SUM, SQ_SUM, STD_DEV, COUNT, NULLS, MIN, MAX = range(8)
+    NULL_VALUE = "None"
+
+    def __init__(self, query, table_class, num_records, truncate=False):
+        """ StatsManager runs aggregate queries over the records selected by a query
+
+        :param query: (Query)   Query selecting records to summarize
+        :param table_class: (type)  Mapped class of table
+        :param num_records: (int)   Number of records selected by query
+        :param truncate: (bool)     Count only first word of text values
+        """
+        self.query = query
+        self.table_class = table_class
+        self.num_records = num_records
+        self.truncate = truncate
+
+    def gather(self, columns, data_types, correct_value):
+        """ Returns summary of columns, in the format used by RecordList.summarize, and whether text columns exist.
+        Numeric columns map to [avg, sum, sq_sum, std_dev, count, nulls, min, max], and are excluded if all values are null.
+        Text/boolean columns map to value: count, with null values counted as "None"
+
+        :param columns: (List[str])     Column names
+        :param data_types: (Dict[str, type])    Column name: python type
+        :param correct_value: (Callable[[str], List[str]])  Splits stored value into values to count
+        :return Tuple[Dict[str, object], bool]:
+        """
+        summary = {}
+        numeric_columns = [column for column in columns if data_types[column] in (int, float)]
+        text_columns = [column for column in columns if data_types[column] in (str, bool)]
+        for i in range(0, len(numeric_columns), StatsManager.CHUNK_SIZE):
+            summary.update(self.numeric_stats(numeric_columns[i: i + StatsManager.CHUNK_SIZE]))
+        for column in text_columns:
+            summary[column] = self.text_counts(column, correct_value)
+        return summary, len(text_columns) > 0
+
+    def numeric_stats(self, columns):
+        """ Returns summary of numeric columns, gathered in a single SELECT
+
+        :param columns: (List[str])
+        :return Dict[str, List[float]]:
+        """
+        columns = [column for column in columns if getattr(self.table_class, column, None) is not None]
+        if not columns or self.num_records == 0:
+            return {}
+        aggregates = []
+        for column in columns:
+            attribute = getattr(self.table_class, column)
+            value = func.nullif(attribute, StatsManager.NULL_VALUE, type_=attribute.type)
+            aggregates.extend((
+                func.count(value),
+                func.total(value),
+                func.total(cast(value, Float) * value),
+                func.min(value),
+                func.max(value),
+            ))
+        row = self.query.with_entities(*aggregates).one()
+        summary = {}
+        for i, column in enumerate(columns):
+            count, total, sq_total, min_value, max_value = row[i * 5: i * 5 + 5]
+            if count == 0:
+                continue
+            summary[column] = [
+                total / self.num_records,
+                total,
+                sq_total,
+                self._std_dev(total, sq_total),
+                count,
+                self.num_records - count,
+                min_value,
+                max_value,
+            ]
+        return summary
+
+    def text_counts(self, column, correct_value):
+        """ Returns number of times each value occurs in text column, counted using GROUP BY
+
+        :param column: (str)
+        :param correct_value: (Callable[[str], List[str]])  Splits stored value into values to count
+        :return Dict[str, int]:
+        """
+        counts = {}
+        attribute = getattr(self.table_class, column, None)
+        if attribute is None:
+            return {StatsManager.NULL_VALUE: self.num_records} if self.num_records > 0 else {}
+        for value, count in self.query.with_entities(attribute, func.count()).group_by(attribute):
+            value = str(value) if value is not None else StatsManager.NULL_VALUE
+            for _v in correct_value(value if value != "" else StatsManager.NULL_VALUE):
+                if self.truncate:
+                    _v = _v.split(" ")[0]
+                counts[_v] = counts.get(_v, 0) + count
+        return counts
+
+    def _std_dev(self, total, sq_total):
+        """ Protected method returns sample standard deviation from sums, or -1 if it cannot be computed
+
+        :param total: (float)   Sum of values
+        :param sq_total: (float)    Sum of squared values
+        :return float:
+        """
+        if self.num_records < 2:
+            return 0.0
+        try:
+            return sqrt((sq_total - ((total ** 2) / self.num_records)) / (self.num_records - 1))
+        except ValueError:
+            return -1
@@ -0,0 +1,171 @@
+import os
+import shutil
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+"""
+Script holds StoreManager, which keeps a single copy of each distinct data file in the project's content-addressed store
+Files are stored under their sha256 digest in db/.store, and are hard linked into table directories
+References from records to digests are kept in the project database, and files are only removed when unreferenced
+
+"""
+
+
+class StoreManager:
+    DIRECTORY = ".store"
+    REF_TABLE = "_store_refs"
+    BLOCK_SIZE = 1048576
+
+    def __init__(self, db_dir):
+        """ Class manages store of data files for project
+
+        :param db_dir: (str)    Project db directory, in which the store is kept
+        """
+        self.store_dir = os.path.join(db_dir, StoreManager.DIRECTORY)
+
+    def blob_path(self, digest):
+        """ Returns path to stored file with digest
+
+        :param digest: (str)
+        :return str:
+        """
+        return os.path.join(self.store_dir, digest[:2], digest)
+
+    def put(self, source, dest, place=shutil.copy, verify=False, digest=None):
+        """ Adds source file to store, if not already present, and links stored file to dest
+        Safe to call from multiple threads
+
+        :param source: (str)    Path to file to add
+        :param dest: (str)  Path in table directory
+        :param place: (Callable[[str, str], None])  Function that writes source file to a new path in the store
+        :param verify: (bool)   Replace stored file if its contents do not match its digest
+        :param digest: (str)    Digest of source file, if already known
+        :return Tuple[str, bool]:   Digest of file, dest was written (False if already linked to stored file)
+        """
+        digest = digest or StoreManager.checksum(source)
+        blob = self.blob_path(digest)
+        if verify and os.path.exists(blob) and StoreManager.checksum(blob) != digest:
+            os.remove(blob)
+        if not os.path.exists(blob):
+            os.makedirs(os.path.dirname(blob), exist_ok=True)
+            # Written under a temporary name, so a partially written file is never stored under its digest
+            tmp = "%s.%i.%i.tmp" % (blob, os.getpid(), threading.get_ident())
+            place(source, tmp)
+            os.replace(tmp, blob)
+        if os.path.lexists(dest):
+            if os.path.samefile(blob, dest):
+                return digest, False
+            os.remove(dest)
+        try:
+            os.link(blob, dest)
+        except OSError:
+            shutil.copy(blob, dest)
+        return digest, True
+
+    @staticmethod
+    def has_refs(conn):
+        """ Checks if reference table is in project database
+
+        :param conn: (Connection)
+        :return bool:
+        """
+        return conn.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = ?",
+                            (StoreManager.REF_TABLE,)).first() is not None
+
+    @staticmethod
+    def add_refs(conn, table_name, refs):
+        """ Stores digest of file for each record
+
+        :param conn: (Connection)
+        :param table_name: (str)
+        :param refs: (Iterable[Tuple[str, str]])   Record id, digest
+        :return:
+        """
+        refs = [(table_name, _id, digest) for _id, digest in refs]
+        conn.execute('CREATE TABLE IF NOT EXISTS "%s" (table_name TEXT NOT NULL, _id TEXT NOT NULL, '
+                     'digest TEXT NOT NULL, PRIMARY KEY (table_name, _id))' % StoreManager.REF_TABLE)
+        conn.execute('CREATE INDEX IF NOT EXISTS "ix_%s_digest" ON "%s" (digest)' % (
+            StoreManager.REF_TABLE, StoreManager.REF_TABLE))
+        if refs:
+            conn.execute('INSERT OR REPLACE INTO "%s" (table_name, _id, digest) VALUES (?, ?, ?)' %
+                         StoreManager.REF_TABLE, refs)
+
+    @staticmethod
+    def get_refs(conn, table_name):
+        """ Returns digest of file for each record of table that has a stored file
+
+        :param conn: (Connection)
+        :param table_name: (str)
+        :return Dict[str, str]:     Record id: digest
+        """
+        if not StoreManager.has_refs(conn):
+            return {}
+        return {_id: digest for _id, digest in conn.execute(
+            'SELECT _id, digest FROM "%s" WHERE table_name = ?' % StoreManager.REF_TABLE, (table_name,))}
+
+    @staticmethod
+    def release(conn, table_name, id_table=None):
+        """ Removes references of records in table, all records if id_table is not passed
+
+        :param conn: (Connection)
+        :param table_name: (str)
+        :param id_table: (str)  Name of table holding _id of each record to release
+        :return Set[str]:   Digests that were referenced by released records
+        """
+        if not StoreManager.has_refs(conn):
+            return set()
+        condition = "table_name = ?"
+        if id_table is not None:
+            condition += ' AND _id IN (SELECT _id FROM "%s")' % id_table
+        digests = {row[0] for row in conn.execute(
+            'SELECT DISTINCT digest FROM "%s" WHERE %s' % (StoreManager.REF_TABLE, condition), (table_name,))}
+        conn.execute('DELETE FROM "%s" WHERE %s' % (StoreManager.REF_TABLE, condition), (table_name,))
+        return digests
+
+    def reclaim(self, conn, digests, max_workers=None):
+        """ Removes stored files that are no longer referenced by any record. Call once releases are committed
+
+        :param conn: (Connection)
+        :param digests: (Iterable[str])   Digests that may no longer be referenced, as from release
+        :param max_workers: (int)   Number of threads used to remove files
+        :return int:    Number of stored files removed
+        """
+        digests = set(digests)
+        if not digests or not StoreManager.has_refs(conn):
+            return 0
+        referenced = set()
+        digests_list = sorted(digests)
+        # Stay below SQLite's limit on number of bound parameters
+        for i in range(0, len(digests_list), 500):
+            batch = digests_list[i: i + 500]
+            referenced.update(row[0] for row in conn.execute(
+                'SELECT DISTINCT digest FROM "%s" WHERE digest IN (%s)' % (
+                    StoreManager.REF_TABLE, ",".join("?" * len(batch))), batch))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return sum(executor.map(self._remove_blob, digests - referenced))
+
+    def _remove_blob(self, digest):
+        """ Protected method removes stored file
+
+        :param digest: (str)
+        :return int:    1 if file was removed
+        """
+        try:
+            os.remove(self.blob_path(digest))
+        except FileNotFoundError:
+            return 0
+        return 1
+
+    @staticmethod
+    def checksum(path):
+        """ Returns sha256 digest of file
+
+        :param path: (str)
+        :return str:
+        """
+        digest = hashlib.sha256()
+        with open(path, "rb") as R:
+            for block in iter(lambda: R.read(StoreManager.BLOCK_SIZE), b""):
+                digest.update(block)
+        return digest.hexdigest()
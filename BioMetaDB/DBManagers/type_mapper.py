@@ -1,8 +1,9 @@
+import re
 import operator
-import random
+from itertools import islice, zip_longest
 from sqlalchemy import Float, Integer, String, VARCHAR, Boolean
 
-from BioMetaDB.Serializers.count_table import CountTable
+from BioMetaDB.Serializers.count_table_stream import CountTableStream
 
 """
 Class holds dictionaries to map types to each other and to string representations
@@ -58,34 +59,86 @@ class TypeMapper:
         "False": "FALSE",
     }
 
+    # Patterns for single values, "" and "None" are null and match every type
+    _int_value = r"[ \t]*[+-]?\d+[ \t]*"
+    _float_value = r"[ \t]*[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?[ \t]*"
+    _value_patterns = (
+        (None,  r"(?:None)?"),
+        (int,   r"(?:%s|None)?" % _int_value),
+        (float, r"(?:%s|None)?" % _float_value),
+        (bool,  r"(?:True|False|None)?"),
+    )
+    # Patterns match an entire column, joined by newlines, in a single call.
+    # Types are tested in order, so mixed int/float columns widen to float and anything else widens to str
+    column_patterns = tuple(
+        (_type, re.compile(r"%s(?:\n%s)*" % (pattern, pattern))) for _type, pattern in _value_patterns
+    )
+    # Default sample is SAMPLE_SIZE rows, reduced for wide tables to read at most SAMPLE_CELLS values
+    SAMPLE_SIZE = 10000
+    SAMPLE_CELLS = 2000000
+    MIN_SAMPLE_SIZE = 100
+
     @staticmethod
-    def get_translated_types(counttable_object, dict_to_reference):
-        if dict_to_reference == TypeMapper.py_type_to_string:
-            return {
-                counttable_object.header[i]:
-                    dict_to_reference[TypeMapper.determine_column_type(counttable_object, i)]
-                for i in range(len(counttable_object.header))
-            }
+    def get_translated_types(counttable_object, dict_to_reference, sample_size=None):
+        """ Returns dict of header name: type for each column in count table,
+        translated using dict_to_reference (keyed by python type).
+        Values outside of the sample that do not fit their column's type are widened when parsed, see ColumnBatch,
+        and the column is widened in the table schema once loaded, see ClassManager.populate_data_to_existing_table
+
+        :param counttable_object: (CountTableStream|CountTable)
+        :param dict_to_reference: (Dict[type, object])  E.g. TypeMapper.py_type_to_string
+        :param sample_size: (int)   Number of rows used to determine types, see TypeMapper.get_sample_size
+        :return Dict[str, object]:
+        """
+        sample_size = sample_size or TypeMapper.get_sample_size(len(counttable_object.header))
+        if isinstance(counttable_object, CountTableStream):
+            rows = counttable_object.sample(sample_size)
+        else:
+            rows = counttable_object.file_contents.values()
+        column_types = TypeMapper.determine_types(rows, len(counttable_object.header), sample_size)
         return {
-            counttable_object.header[i]:
-                dict_to_reference[
-                    type(counttable_object.get_at(random.sample(counttable_object.file_contents.keys(), 1)[0], i))
-                ]
+            counttable_object.header[i]: dict_to_reference[column_types[i]]
             for i in range(len(counttable_object.header))
         }
 
+    @staticmethod
+    def get_sample_size(num_columns):
+        """ Returns default number of rows to sample for type inference
+
+        :param num_columns: (int)
+        :return int:
+        """
+        return min(TypeMapper.SAMPLE_SIZE,
+                   max(TypeMapper.MIN_SAMPLE_SIZE, TypeMapper.SAMPLE_CELLS // max(num_columns, 1)))
+
     @staticmethod
     def determine_column_type(counttable_object, column_idx):
-        values = {
-            int: 0,
-            bool: 0,
-            float: 0,
-            str: 0,
-            # None: 0
-        }
-        for value_list in counttable_object.file_contents.values():
-            if value_list[column_idx] != 'None':
-                values[
-                    CountTable._try_return_type(value_list[column_idx])
-                ] += 1
-        return (max(values.items(), key=lambda x: x[1]) if values.items() else (str,))[0]
+        return TypeMapper.determine_types(counttable_object.file_contents.values(), column_idx + 1)[column_idx]
+
+    @staticmethod
+    def determine_types(rows, num_columns, sample_size=None):
+        """ Determines python type of all columns in a single pass over (a sample of) rows.
+        Each column is classified with a single regex match over all of its sampled values.
+        Columns holding different types are widened (int/float -> float, otherwise -> str),
+        columns with no values in sample are typed as int
+
+        :param rows: (Iterable[List[str]])  Unparsed rows, not including id
+        :param num_columns: (int)   Number of columns to type
+        :param sample_size: (int)   Maximum number of rows to read, see TypeMapper.get_sample_size
+        :return List[type]:
+        """
+        column_types = []
+        columns = list(zip_longest(*islice(rows, sample_size or TypeMapper.get_sample_size(num_columns)),
+                                   fillvalue=""))
+        for i in range(num_columns):
+            if i >= len(columns):
+                column_types.append(int)
+                continue
+            column = "\n".join(columns[i])
+            for _type, pattern in TypeMapper.column_patterns:
+                if pattern.fullmatch(column) is not None:
+                    column_types.append(_type if _type is not None else int)
+                    break
+            else:
+                column_types.append(str)
+        return column_types
@@ -5,6 +5,7 @@ import glob
 
 from BioMetaDB.DBManagers.type_mapper import TypeMapper
 from BioMetaDB.Models.functions import Record
+from BioMetaDB.Models.models import BaseData
 from sqlalchemy.orm import mapper
 from BioMetaDB.Accessories.ops import print_if_not_silent
 from BioMetaDB.Serializers.count_table import CountTable
@@ -30,6 +31,87 @@ class UpdateManager:
         print_if_not_silent(silent, " ..Creating deep copy of existing table")
         return self._write_to_file(*self._query_table(DBClass), outfile_prefix)
 
+    @staticmethod
+    def evolve_table(object engine, object TableClass, object UpdatedClass, str table_name, bint silent):
+        """ Changes schema of existing table to that of UpdatedClass within a single transaction.
+        New columns are added with ALTER TABLE, and removed or retyped columns are handled by creating the
+        new table and copying existing data with a single INSERT ... SELECT
+
+        :param engine: (Engine)
+        :param TableClass: (Table)  Current table
+        :param UpdatedClass: (Table)    Table with updated schema
+        :param table_name: (str)
+        :param silent: (bool)
+        :return:
+        """
+        cdef object conn
+        with BaseData.transaction(engine) as conn:
+            UpdateManager.evolve(conn, TableClass, UpdatedClass, table_name, silent)
+
+    @staticmethod
+    def evolve(object conn, object TableClass, object UpdatedClass, str table_name, bint silent):
+        """ Changes schema of existing table to that of UpdatedClass using connection, see evolve_table
+
+        :param conn: (Connection)   Connection with open transaction
+        :param TableClass: (Table)  Current table
+        :param UpdatedClass: (Table)    Table with updated schema
+        :param table_name: (str)
+        :param silent: (bool)
+        :return:
+        """
+        cdef dict old_types = {str(col.name): col.type.compile(dialect=conn.dialect) for col in TableClass.columns}
+        cdef dict new_types = {str(col.name): col.type.compile(dialect=conn.dialect) for col in UpdatedClass.columns}
+        cdef list added = [name for name in new_types.keys() if name not in old_types.keys()]
+        cdef list kept = [name for name in new_types.keys() if name in old_types.keys()]
+        cdef bint rebuild = len(old_types) != len(kept) or any(old_types[name] != new_types[name] for name in kept)
+        if rebuild:
+            print_if_not_silent(silent, " ..Rebuilding table with updated schema")
+            UpdateManager._rebuild_table(conn, UpdatedClass, table_name, kept)
+        elif added:
+            print_if_not_silent(silent, " ..Adding %i column(s) to table" % len(added))
+            UpdateManager._add_columns(conn, UpdatedClass, table_name, added, new_types)
+
+    @staticmethod
+    def _add_columns(object conn, object UpdatedClass, str table_name, list added, dict new_types):
+        """ Protected method adds columns, and their indices, to existing table
+
+        :param conn: (Connection)   Connection with open transaction
+        :param UpdatedClass: (Table)
+        :param table_name: (str)
+        :param added: (List[str])   Names of new columns
+        :param new_types: (Dict[str, str])  Column name: SQL type
+        :return:
+        """
+        cdef str name
+        cdef object index
+        for name in added:
+            conn.execute('ALTER TABLE "%s" ADD COLUMN "%s" %s' % (table_name, name, new_types[name]))
+        for index in UpdatedClass.indexes:
+            if any(col.name in added for col in index.columns):
+                index.create(conn)
+
+    @staticmethod
+    def _rebuild_table(object conn, object UpdatedClass, str table_name, list kept):
+        """ Protected method swaps table for one with updated schema, copying data for kept columns
+
+        :param conn: (Connection)   Connection with open transaction
+        :param UpdatedClass: (Table)
+        :param table_name: (str)
+        :param kept: (List[str])    Names of columns in both schemas
+        :return:
+        """
+        cdef str old_table_name = "_%s_old" % table_name
+        cdef str columns = ", ".join('"%s"' % name for name in kept)
+        cdef object row
+        # Indices keep their names when table is renamed, so are dropped before new table is created
+        for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = ? "
+                                "AND sql IS NOT NULL", (table_name,)).fetchall():
+            conn.execute('DROP INDEX "%s"' % row[0])
+        conn.execute('ALTER TABLE "%s" RENAME TO "%s"' % (table_name, old_table_name))
+        UpdatedClass.create(conn)
+        conn.execute('INSERT INTO "%s" (%s) SELECT %s FROM "%s"' % (table_name, columns, columns, old_table_name))
+        conn.execute('DROP TABLE "%s"' % old_table_name)
+
     @staticmethod
     def delete_old_table_and_populate(object engine, object TableClass, object UpdatedClass, object data_table, str table_name, object sess, bint silent,
                                       list ignore_fields=[]):
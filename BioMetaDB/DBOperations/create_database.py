@@ -1,7 +1,7 @@
 import os
 from BioMetaDB.Accessories.ops import touch
 from BioMetaDB.Accessories.ops import print_if_not_silent
-from BioMetaDB.Serializers.count_table import CountTable
+from BioMetaDB.Serializers.count_table_stream import CountTableStream
 from BioMetaDB.Config.directory_manager import Directories
 from BioMetaDB.Exceptions.create_database_exceptions import CreateDBAssertString
 from BioMetaDB.DBManagers.class_manager import ClassManager
@@ -9,6 +9,8 @@ from BioMetaDB.DBManagers.type_mapper import TypeMapper
 from BioMetaDB.Config.config_manager import Config
 from BioMetaDB.Config.config_manager import ConfigManager
 from BioMetaDB.Config.config_manager import ConfigKeys
+from BioMetaDB.Models.sqlite_profile import SQLiteProfile
+from BioMetaDB.DBManagers.ingest_manager import IngestManager
 from BioMetaDB.DBOperations.integrity_check import integrity_check
 
 
@@ -106,7 +108,7 @@ def create_database(db_name, table_name, directory_name, data_file, alias, silen
     data_types = {}
     initial_data = []
     if data_file is not "None":
-        _initial_data = CountTable(data_file)
+        _initial_data = CountTableStream(data_file)
         # Ignore first column name, typically announcing "Name" or "Genome ID"
         # Get names and types of each column in dict
         # Key is header name (which will be used as name of column in database)
@@ -137,6 +139,7 @@ def create_database(db_name, table_name, directory_name, data_file, alias, silen
     }
     config[table_name] = {
         ConfigKeys.rel_classes_dir:     os.path.join(db_name, Directories.CLASSES),
+        ConfigKeys.indexed_columns:     "",
     }
     config[ConfigKeys.TABLES_TO_DB] = {
         table_name: db_name,
@@ -144,6 +147,10 @@ def create_database(db_name, table_name, directory_name, data_file, alias, silen
     config[ConfigKeys.TABLES_TO_ALIAS] = {
         "{}|{}".format(alias, table_name): table_name,
     }
+    # Performance settings applied to each database connection
+    config.read_dict(SQLiteProfile.defaults())
+    # How data files are placed in table directories
+    config[IngestManager.SECTION] = IngestManager.DEFAULTS
     with open(os.path.join(config_dir, config_file), "w") as W:
         config.write(W)
     # Create table
@@ -1,7 +1,7 @@
 import os
 from BioMetaDB.Config.directory_manager import Directories
 from BioMetaDB.Exceptions.config_manager_exceptions import ConfigAssertString
-from BioMetaDB.Serializers.count_table import CountTable
+from BioMetaDB.Serializers.count_table_stream import CountTableStream
 from BioMetaDB.Config.config_manager import ConfigManager
 from BioMetaDB.Config.config_manager import ConfigKeys
 from BioMetaDB.DBManagers.class_manager import ClassManager
@@ -86,7 +86,7 @@ def create_table_in_existing_database(config_file, table_name, directory_name, d
     data_types = {}
     initial_data = []
     if data_file is not "None":
-        _initial_data = CountTable(data_file)
+        _initial_data = CountTableStream(data_file)
         # Ignore first column name, typically announcing "Name" or "Genome ID"
         # Get names and types of each column in dict
         # Key is header name (which will be used as name of column in database)
@@ -106,6 +106,7 @@ def create_table_in_existing_database(config_file, table_name, directory_name, d
     config[table_name] = {
         ConfigKeys.rel_classes_dir: os.path.join(config[ConfigKeys.DATABASES][ConfigKeys.rel_work_dir],
                                                  Directories.CLASSES),
+        ConfigKeys.indexed_columns: "",
     }
     config.set(ConfigKeys.TABLES_TO_DB, table_name, config[ConfigKeys.DATABASES][ConfigKeys.db_name])
     config.set(ConfigKeys.TABLES_TO_ALIAS, "{}|{}".format(alias, table_name), table_name)
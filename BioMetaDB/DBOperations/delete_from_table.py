@@ -1,17 +1,15 @@
-import os
-from sqlalchemy.orm import mapper
 from BioMetaDB.DBOperations.integrity_check import integrity_check
 from BioMetaDB.Exceptions.config_manager_exceptions import TableNameAssertString
 from BioMetaDB.Models.models import BaseData
-from BioMetaDB.Models.functions import Record
 from BioMetaDB.Config.config_manager import ConfigKeys
 from BioMetaDB.Accessories.ops import print_if_not_silent
 from BioMetaDB.Config.config_manager import ConfigManager
-from BioMetaDB.DBManagers.class_manager import ClassManager
+from BioMetaDB.DBManagers.delete_manager import DeleteManager
 from BioMetaDB.Exceptions.remove_columns_from_table_exceptions import ListFileNotProvidedError
 
 """
 Script will hold functionality for DELETE, which deletes records from database and associated files
+Records are deleted in a single statement, and files are removed in parallel
 
 """
 
@@ -61,7 +59,8 @@ def delete_from_table(config_file, table_name, list_file, alias, silent, integri
     if list_file == "None":
         raise ListFileNotProvidedError("Provide file with list of records to delete")
     cfg = ConfigManager(config, table_name)
-    ids_to_remove = set(line.rstrip("\r\n") for line in open(list_file, "r"))
+    with open(list_file, "r") as R:
+        ids_to_remove = set(line.rstrip("\r\n") for line in R if line.rstrip("\r\n") != "")
     if not silent:
         _delete_records_display_message_prelude(
             config[ConfigKeys.DATABASES][ConfigKeys.db_name],
@@ -71,19 +70,10 @@ def delete_from_table(config_file, table_name, list_file, alias, silent, integri
             ids_to_remove
         )
 
-    engine = BaseData.get_engine(cfg.db_dir, cfg.db_name + ".db")
-    sess = BaseData.get_session_from_engine(engine)
-    TableClass = ClassManager.get_class_orm(table_name, engine)
-    UserClass = type(table_name, (Record,), {})
-    mapper(UserClass, TableClass)
-    for _id in ids_to_remove:
-        print_if_not_silent(silent, " ..Removing record %s" % _id)
-        try:
-            os.remove(sess.query(UserClass).filter_by(_id=_id).first().full_path())
-        except TypeError:
-            continue
-        sess.delete(sess.query(UserClass).filter_by(_id=_id).first())
-    sess.commit()
+    engine = BaseData.get_engine(cfg.db_dir, cfg.db_name + ".db", cfg.sqlite_profile())
+    num_records, num_files, missing_ids = DeleteManager(table_name, cfg.working_dir, silent).delete(engine, ids_to_remove)
+    if missing_ids:
+        print_if_not_silent(silent, " ..%i record(s) not found in table: %s" % (len(missing_ids), ",".join(missing_ids)))
     if not silent:
         _remove_columns_display_message_epilogue()
     if not integrity_cancel:
@@ -1,10 +1,8 @@
 # cython: language_level=3
 import os
-from sqlalchemy.orm import mapper
 from random import randint
 from datetime import datetime
 from BioMetaDB.Models.models import BaseData
-from BioMetaDB.Models.functions import Record
 from BioMetaDB.Config.config_manager import ConfigManager, ConfigKeys
 from BioMetaDB.DBManagers.class_manager import ClassManager
 from BioMetaDB.DBManagers.integrity_manager import IntegrityManager
@@ -68,15 +66,14 @@ def integrity_check(config_file, table_name, alias, silent):
     im.initialize_fix_file()
     im.initial_project_check()
     # im.table_check()
+    tables = []
     for table in tables_to_search:
         cfg = ConfigManager(config, table)
-        engine = BaseData.get_engine(cfg.db_dir, cfg.db_name + ".db")
+        engine = BaseData.get_engine(cfg.db_dir, cfg.db_name + ".db", cfg.sqlite_profile())
         sess = BaseData.get_session_from_engine(engine)
-        TableClass = ClassManager.get_class_orm(table, engine)
-        UserClass = type(table, (Record,), {})
-        # Map to SQL orm
-        mapper(UserClass, TableClass)
-        im.record_check(sess, UserClass, table)
+        UserClass = ClassManager.get_class(table, engine)
+        tables.append((table, sess, UserClass))
+    im.manifest_record_check(tables)
     if im.issues_found == 0:
         os.remove(py_fixfile_name)
     if not silent:
@@ -1,17 +1,16 @@
 import os
 import shutil
 from pathlib import Path
-from sqlalchemy.orm import mapper
-from BioMetaDB import BaseData, Record
+from BioMetaDB import BaseData
 from BioMetaDB.Config.config_manager import ConfigKeys
 from BioMetaDB.Config.config_manager import ConfigManager
 from BioMetaDB.Config.directory_manager import Directories
-from BioMetaDB.DBManagers.class_manager import ClassManager
+from BioMetaDB.Models.sqlite_profile import SQLiteProfile
 from BioMetaDB.DBOperations.integrity_check import integrity_check
 
 """
-Script holds functionality for UPDATE, which updates existing/adds new records to database
-Handles new column generation and SQL migration 
+Script holds functionality for MOVE, which moves project directory to new location
+Record locations are stored relative to project directory, so only config file is rewritten
 
 """
 
@@ -32,6 +31,21 @@ def _move_project_display_message_epilogue():
     print("Move complete!", "\n")
 
 
+def _relativize_locations(conn, tbl_name):
+    """ Migrates locations of table's records stored as absolute paths (by earlier versions) to the location
+    relative to project directory, in a single statement. Records stored in other directories are not changed
+
+    :param conn: (Connection)
+    :param tbl_name: (str)
+    :return int:    Number of records updated
+    """
+    table_location = ConfigManager.get_table_location(tbl_name)
+    return conn.execute(
+        'UPDATE "%s" SET location = ? WHERE location != ? AND substr(location, -?) = ?' % tbl_name,
+        (table_location, table_location, len(table_location) + 1, os.sep + table_location)
+    ).rowcount
+
+
 def move_project(config_file, path, integrity_cancel, silent):
     """
 
@@ -76,22 +90,16 @@ def move_project(config_file, path, integrity_cancel, silent):
     }
     with open(os.path.join(path, project_name, Directories.CONFIG, os.path.basename(config_file)), "w") as W:
         config.write(W)
-    # Update location for each record in each table
-    tables_in_database = config[ConfigKeys.TABLES_TO_DB].keys()
+    # Records of projects created by earlier versions store absolute locations, which are migrated once
     engine = BaseData.get_engine(
         os.path.join(config[ConfigKeys.DATABASES][ConfigKeys.working_dir], Directories.DATABASE),
-        config[ConfigKeys.DATABASES][ConfigKeys.rel_work_dir] + ".db"
+        config[ConfigKeys.DATABASES][ConfigKeys.rel_work_dir] + ".db",
+        SQLiteProfile.get(config)
     )
-    sess = BaseData.get_session_from_engine(engine)
-    for tbl_name in tables_in_database:
-
-        TableClass = ClassManager.get_class_orm(tbl_name, engine)
-        UserClass = type(tbl_name, (Record,), {})
-        mapper(UserClass, TableClass)
-        for record in sess.query(UserClass).all():
-            record.location = os.path.join(abs_path_working_dir, Directories.DATABASE, tbl_name)
-        sess.commit()
-        if not integrity_cancel:
-            integrity_check(abs_path_working_dir, tbl_name, "None", silent)
+    with BaseData.transaction(engine) as conn:
+        for tbl_name in config[ConfigKeys.TABLES_TO_DB].keys():
+            _relativize_locations(conn, tbl_name)
+    if not integrity_cancel:
+        integrity_check(abs_path_working_dir, "None", "None", silent)
     if not silent:
         _move_project_display_message_epilogue()
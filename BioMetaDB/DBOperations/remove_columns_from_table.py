@@ -2,6 +2,7 @@ from datetime import datetime
 from BioMetaDB.DBOperations.integrity_check import integrity_check
 from BioMetaDB.Exceptions.config_manager_exceptions import TableNameAssertString
 from BioMetaDB.Models.models import BaseData
+from BioMetaDB.Models.registry import Registry
 from BioMetaDB.Config.config_manager import ConfigKeys
 from BioMetaDB.Config.config_manager import ConfigManager
 from BioMetaDB.DBManagers.class_manager import ClassManager
@@ -10,7 +11,7 @@ from BioMetaDB.Exceptions.remove_columns_from_table_exceptions import ListFileNo
 
 """
 Script will hold functionality for REMOVECOL, to remove columns from existing table data
-Saves migration
+Table schema is changed in place, saving migration only if backup is requested
 Creates new database table model
 
 """
@@ -39,7 +40,7 @@ def _remove_columns_display_message_epilogue():
     print("Columns removed from database!", "\n")
 
 
-def remove_columns_from_table(config_file, table_name, list_file, alias, silent, integrity_cancel):
+def remove_columns_from_table(config_file, table_name, list_file, alias, silent, integrity_cancel, backup=False):
     """
 
     :param config_file:
@@ -48,6 +49,7 @@ def remove_columns_from_table(config_file, table_name, list_file, alias, silent,
     :param alias:
     :param silent:
     :param integrity_cancel:
+    :param backup: (bool)   Save copy of table data to migrations directory before schema changes
     :return:
     """
     _cfg, _tbl, _sil, _al = config_file, table_name, silent, alias
@@ -71,11 +73,12 @@ def remove_columns_from_table(config_file, table_name, list_file, alias, silent,
             columns_to_remove
         )
 
-    engine = BaseData.get_engine(cfg.db_dir, cfg.db_name + ".db")
+    engine = BaseData.get_engine(cfg.db_dir, cfg.db_name + ".db", cfg.sqlite_profile())
     sess = BaseData.get_session_from_engine(engine)
     TableClass = ClassManager.get_class_orm(table_name, engine)
-    update_manager = UpdateManager(cfg, ClassManager.get_class_as_dict(cfg), sess)
-    table_copy_csv = update_manager.create_table_copy(datetime.today().strftime("%Y%m%d"), TableClass, silent)
+    if backup:
+        update_manager = UpdateManager(cfg, ClassManager.get_class_as_dict(cfg), sess)
+        update_manager.create_table_copy(datetime.today().strftime("%Y%m%d"), TableClass, silent)
     new_attrs = {key: value
                  for key, value
                  in ClassManager.correct_dict(ClassManager.get_class_as_dict(cfg)).items()
@@ -85,19 +88,19 @@ def remove_columns_from_table(config_file, table_name, list_file, alias, silent,
         new_attrs,
         cfg.db_dir,
         cfg.db_name,
-        cfg.table_dir
+        cfg.table_dir,
+        indexed_columns=cfg.indexed_columns
     )
     ClassManager.write_class(new_attrs, cfg.classes_file)
     cfg.update_config_file(table_name)
-    update_manager.delete_old_table_and_populate(
+    UpdateManager.evolve_table(
         engine,
         TableClass,
         UpdatedDBClass,
-        table_copy_csv,
         table_name,
-        sess,
         silent
     )
+    Registry.invalidate(engine)
     if not silent:
         _remove_columns_display_message_epilogue()
     if not integrity_cancel:
@@ -1,14 +1,15 @@
 import os
 import shutil
-from sqlalchemy.orm import mapper
 from BioMetaDB.DBOperations.integrity_check import integrity_check
 from BioMetaDB.Exceptions.config_manager_exceptions import TableNameAssertString
 from BioMetaDB.Models.models import BaseData
-from BioMetaDB.Models.functions import Record
+from BioMetaDB.Models.registry import Registry
 from BioMetaDB.Config.config_manager import ConfigKeys
 from BioMetaDB.Accessories.ops import print_if_not_silent
 from BioMetaDB.Config.config_manager import ConfigManager
 from BioMetaDB.DBManagers.class_manager import ClassManager
+from BioMetaDB.DBManagers.manifest_manager import TableManifest
+from BioMetaDB.DBManagers.store_manager import StoreManager
 
 """
 Script will hold functionality for REMOVE, which removes a table from a database,
@@ -66,11 +67,10 @@ def remove_table_from_database(config_file, table_name, alias, silent, integrity
         )
 
     cfg = ConfigManager(config, table_name)
-    engine = BaseData.get_engine(cfg.db_dir, cfg.db_name + ".db")
+    engine = BaseData.get_engine(cfg.db_dir, cfg.db_name + ".db", cfg.sqlite_profile())
     sess = BaseData.get_session_from_engine(engine)
     TableClass = ClassManager.get_class_orm(table_name, engine)
-    UserClass = type(table_name, (Record,), {})
-    mapper(UserClass, TableClass)
+    UserClass = ClassManager.get_class(table_name, engine)
     all_records = sess.query(UserClass).all()
     for record in all_records:
         if record:
@@ -79,10 +79,20 @@ def remove_table_from_database(config_file, table_name, alias, silent, integrity
                 os.remove(record.full_path())
             except OSError:
                 continue
-    TableClass.drop(engine)
+    # Table is dropped in the same transaction that releases its references to stored files
+    with BaseData.transaction(engine) as conn:
+        TableClass.drop(conn)
+        released = StoreManager.release(conn, table_name)
+    Registry.invalidate(engine)
     cfg.remove_table_from_config_file(table_name)
     os.remove(cfg.classes_file)
+    TableManifest(cfg.config_dir, table_name, cfg.table_dir).remove()
     shutil.rmtree(cfg.table_dir)
+    # Files in store are kept while records of other tables reference them
+    if released:
+        with engine.connect() as conn:
+            print_if_not_silent(silent, " ..Removed %i unreferenced file(s) from store" %
+                                StoreManager(cfg.db_dir).reclaim(conn, released))
     if not silent:
         _remove_columns_display_message_epilogue()
     if not integrity_cancel:
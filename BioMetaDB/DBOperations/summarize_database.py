@@ -1,8 +1,6 @@
-from sqlalchemy.orm import mapper
-from BioMetaDB.Models.models import BaseData
-from BioMetaDB.Models.functions import Record
+from BioMetaDB.Models.registry import Registry
 from BioMetaDB.DataStructures.record_list import RecordList
-from BioMetaDB.DBManagers.class_manager import ClassManager
+from BioMetaDB.DBManagers.link_manager import LinkManager
 from BioMetaDB.Config.config_manager import ConfigManager, ConfigKeys
 from BioMetaDB.Exceptions.summarize_database_exceptions import SummarizeDBAssertString
 
@@ -61,38 +59,16 @@ def summarize_database(config_file, view, query, table_name, alias, write, write
         if "evaluation" not in tables_in_database or "functions" not in tables_in_database:
             print("Table linker requires 'evaluation' and 'functions' tables to be present")
             exit(1)
-        matching_records = []
-        eval_sess, EvalClass, eval_cfg = load_table_metadata(config, "evaluation")
-        eval_rl = RecordList(eval_sess, EvalClass, eval_cfg, compute_metadata=False, truncate=truncate)
-        fxn_sess, FxnClass, fxn_cfg = load_table_metadata(config, "functions")
-        fxn_rl = RecordList(fxn_sess, FxnClass, fxn_cfg, compute_metadata=False, truncate=truncate)
+        linker = LinkManager(config, tables_in_database, truncate)
         evaluation_query, block_1 = query.split("~>")
         function_query, annotation_query = block_1.split("->")
-        if evaluation_query.replace(" ", "") != '':
-            eval_rl.query(evaluation_query)
-        else:
-            eval_rl.query()
-        if function_query.replace(" ", "") != '':
-            fxn_rl.query(function_query)
-        else:
-            fxn_rl.query()
-        for record in eval_rl:
-            if record in fxn_rl:
-                record_id = record._id.split(".")[0]
-                if record_id not in tables_in_database:
-                    continue
-                sess, UserClass, cfg = load_table_metadata(config, record_id)
-                annot_rl = RecordList(sess, UserClass, cfg, compute_metadata=False, truncate=truncate)
-                _handle_query(annot_rl, annotation_query)
-                if write_tsv != 'None':
-                    annot_rl.write_tsv(record_id + "." + write_tsv.replace(".tsv", "") + ".tsv")
-                for record_2 in annot_rl:
-                    matching_records.append(record_2)
-                if write_tsv == 'None' and write == 'None':
-                    annot_rl.summarize()
-        if matching_records and write != "None":
-            rl = RecordList(compute_metadata=False, records_list=matching_records, truncate=truncate)
-            rl.write_records(write)
+        # Single statement for ids matching both evaluation and functions queries
+        linker.query_linked_tables(
+            linker.linked_ids(("evaluation", evaluation_query), ("functions", function_query)),
+            annotation_query,
+            write,
+            write_tsv
+        )
         exit()
     if "~>" in query:
         # assert table_name == 'None', "Query cannot contain a '~>' statement with a table name"
@@ -102,30 +78,10 @@ def summarize_database(config_file, view, query, table_name, alias, write, write
         if "evaluation" not in tables_in_database:
             print("Table linker requires 'evaluation' table to be present")
             exit(1)
-        matching_records = []
-        eval_sess, EvalClass, eval_cfg = load_table_metadata(config, "evaluation")
-        eval_rl = RecordList(eval_sess, EvalClass, eval_cfg, compute_metadata=False, truncate=truncate)
+        linker = LinkManager(config, tables_in_database, truncate)
         evaluation_query, annotation_query = query.split("~>")
-        if evaluation_query.replace(" ", "") != '':
-            eval_rl.query(evaluation_query)
-        else:
-            eval_rl.query()
-        for record in eval_rl:
-            record_id = record._id.split(".")[0]
-            if record_id not in tables_in_database:
-                continue
-            sess, UserClass, cfg = load_table_metadata(config, record_id)
-            annot_rl = RecordList(sess, UserClass, cfg, compute_metadata=False, truncate=truncate)
-            _handle_query(annot_rl, annotation_query)
-            if write_tsv != 'None':
-                annot_rl.write_tsv(record_id + "." + write_tsv.replace(".tsv", "") + ".tsv")
-            for record_2 in annot_rl:
-                matching_records.append(record_2)
-            if write_tsv == 'None' and write == 'None':
-                annot_rl.summarize()
-        if matching_records and write != "None":
-            rl = RecordList(compute_metadata=False, records_list=matching_records, truncate=truncate)
-            rl.write_records(write)
+        linker.query_linked_tables(linker.linked_ids(("evaluation", evaluation_query)), annotation_query, write,
+                                   write_tsv)
         exit()
     if "->" in query:
         # assert table_name == 'None', "Query cannot contain a '->' statement with a table name"
@@ -135,30 +91,10 @@ def summarize_database(config_file, view, query, table_name, alias, write, write
         if "functions" not in tables_in_database:
             print("Table linker requires 'functions' table to be present")
             exit(1)
-        matching_records = []
-        eval_sess, EvalClass, eval_cfg = load_table_metadata(config, "functions")
-        eval_rl = RecordList(eval_sess, EvalClass, eval_cfg, compute_metadata=False, truncate=truncate)
+        linker = LinkManager(config, tables_in_database, truncate)
         evaluation_query, annotation_query = query.split("->")
-        if evaluation_query.replace(" ", "") != '':
-            eval_rl.query(evaluation_query)
-        else:
-            eval_rl.query()
-        for record in eval_rl:
-            record_id = record._id.split(".")[0]
-            if record_id not in tables_in_database:
-                continue
-            sess, UserClass, cfg = load_table_metadata(config, record_id)
-            annot_rl = RecordList(sess, UserClass, cfg, compute_metadata=False, truncate=truncate)
-            _handle_query(annot_rl, annotation_query)
-            if write_tsv != 'None':
-                annot_rl.write_tsv(record_id + "." + write_tsv.replace(".tsv", "") + ".tsv")
-            for record_2 in annot_rl:
-                matching_records.append(record_2)
-            if write_tsv == 'None' and write == 'None':
-                annot_rl.summarize()
-        if matching_records and write != "None":
-            rl = RecordList(compute_metadata=False, records_list=matching_records, truncate=truncate)
-            rl.write_records(write)
+        linker.query_linked_tables(linker.linked_ids(("functions", evaluation_query)), annotation_query, write,
+                                   write_tsv)
         exit()
     if ">>" in query:
         # assert table_name == 'None', "Query cannot contain a '>>' statement with a table name"
@@ -168,30 +104,18 @@ def summarize_database(config_file, view, query, table_name, alias, write, write
         if "evaluation" not in tables_in_database or "functions" not in tables_in_database:
             print("Table linker requires 'evaluation' and 'functions' tables to be present")
             exit(1)
-        eval_sess, EvalClass, eval_cfg = load_table_metadata(config, "evaluation")
-        eval_rl = RecordList(eval_sess, EvalClass, eval_cfg, compute_metadata=False, truncate=truncate)
+        linker = LinkManager(config, tables_in_database, truncate)
         evaluation_query, annotation_query = query.split(">>")
-        if evaluation_query.replace(" ", "") != '':
-            eval_rl.query(evaluation_query)
-        else:
-            eval_rl.query()
-        sess, UserClass, cfg = load_table_metadata(config, "functions")
+        eval_rl = linker.record_list("evaluation", evaluation_query)
         if len(eval_rl) > 0:
-            in_query = ""
-            for record in eval_rl:
-                in_query += "_id == '%s' OR " % record._id
-            annot_rl = RecordList(sess, UserClass, cfg, compute_metadata=False, truncate=truncate)
-            if annotation_query.replace(" ", "") != '':
-                annot_rl.query(annotation_query + " AND " + in_query[:-4])
-            else:
-                annot_rl.query(in_query[:-4])
-            if annot_rl is not None:
-                if write != "None":
-                    annot_rl.write_records(write)
-                if write_tsv != "None":
-                    annot_rl.write_tsv(write_tsv.replace(".tsv", "") + ".tsv")
-                if write_tsv == 'None' and write == 'None':
-                    annot_rl.summarize()
+            # Functions matching query are restricted to evaluation ids in the same statement
+            annot_rl = linker.record_list("functions", annotation_query, ids=eval_rl.id_query())
+            if write != "None":
+                annot_rl.write_records(write)
+            if write_tsv != "None":
+                annot_rl.write_tsv(write_tsv.replace(".tsv", "") + ".tsv")
+            if write_tsv == 'None' and write == 'None':
+                annot_rl.summarize()
         else:
             eval_rl.summarize()
         exit()
@@ -239,15 +163,8 @@ def summarize_database(config_file, view, query, table_name, alias, write, write
 
 
 def load_table_metadata(config, tbl_name):
-    cfg = ConfigManager(config, tbl_name)
-    engine = BaseData.get_engine(cfg.db_dir, cfg.db_name + ".db")
-    sess = BaseData.get_session_from_engine(engine)
-    TableClass = ClassManager.get_class_orm(tbl_name, engine)
-    UserClass = type(tbl_name, (Record,), {})
-    # Map to SQL orm
-    mapper(UserClass, TableClass)
     # Display queried info for single table and break
-    return sess, UserClass, cfg
+    return Registry.load_table_metadata(config, tbl_name)
 
 
 def _handle_query(rl, query="None"):
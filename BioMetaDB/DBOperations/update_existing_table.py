@@ -2,7 +2,7 @@ import os
 from BioMetaDB.Config.config_manager import ConfigKeys
 from BioMetaDB.Config.config_manager import ConfigManager
 from BioMetaDB.DBManagers.class_manager import ClassManager
-from BioMetaDB.Serializers.count_table import CountTable
+from BioMetaDB.Serializers.count_table_stream import CountTableStream
 from BioMetaDB.DBOperations.integrity_check import integrity_check
 
 """
@@ -36,7 +36,8 @@ def _update_table_display_message_epilogue():
     print("Update complete!", "\n")
 
 
-def update_existing_table(config_file, table_name, directory_name, data_file, alias, silent, integrity_cancel):
+def update_existing_table(config_file, table_name, directory_name, data_file, alias, silent, integrity_cancel,
+                          backup=False):
     """
 
     :param config_file:
@@ -46,6 +47,7 @@ def update_existing_table(config_file, table_name, directory_name, data_file, al
     :param alias:
     :param silent:
     :param integrity_cancel:
+    :param backup: (bool)   Save copy of table data to migrations directory before schema changes
     :return:
     """
     _cfg, _tbl, _al, _sil = config_file, table_name, alias, silent
@@ -71,7 +73,7 @@ def update_existing_table(config_file, table_name, directory_name, data_file, al
             alias
         )
     if data_file != "None":
-        data_to_add = CountTable(data_file)
+        data_to_add = CountTableStream(data_file)
     else:
         data_to_add = None
     if directory_name != "None":
@@ -80,10 +82,10 @@ def update_existing_table(config_file, table_name, directory_name, data_file, al
         genomic_files_to_add = ()
     if alias == "None":
         new_attrs = ClassManager.populate_data_to_existing_table(table_name, data_to_add, cfg, genomic_files_to_add,
-                                                                 directory_name, silent, alias)
+                                                                 directory_name, silent, alias, backup=backup)
     else:
         new_attrs = ClassManager.populate_data_to_existing_table(table_name, data_to_add, cfg, genomic_files_to_add,
-                                                                 directory_name, silent)
+                                                                 directory_name, silent, backup=backup)
     ClassManager.write_class(new_attrs, cfg.classes_file)
     if not silent:
         _update_table_display_message_epilogue()
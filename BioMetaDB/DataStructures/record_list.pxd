@@ -5,6 +5,10 @@ cdef class RecordList:
     cdef dict _summary
     cdef int num_records
     cdef list results
+    cdef object _query
+    cdef dict _index
+    cdef list _window
+    cdef int _window_start
     cdef bint has_text
     cdef int num_records_in_db
     cdef bint truncate
@@ -1,21 +1,25 @@
 # cython: language_level=3
 import os
+import gzip
 import re
 from math import sqrt
 # from io import StringIO
-from random import choice
-from sqlalchemy import text
+from sqlalchemy import text, func
+from sqlalchemy.orm import class_mapper
 from string import punctuation
 from sqlalchemy.exc import OperationalError
-from string import ascii_lowercase
 from BioMetaDB.DBManagers.type_mapper import TypeMapper
 from BioMetaDB.DBManagers.class_manager import ClassManager
-from BioMetaDB.DBOperations.update_existing_table import update_existing_table
+from BioMetaDB.DBManagers.stats_manager import StatsManager
+from BioMetaDB.Serializers.record_writer import RecordWriter
+from BioMetaDB.Models.registry import Registry
+from BioMetaDB.Serializers.count_table_stream import UpdateDataStream
+from BioMetaDB.DBOperations.integrity_check import integrity_check
 from BioMetaDB.Exceptions.record_list_exceptions import ColumnNameNotFoundError
 
 
-cdef extern from "Python.h":
-    char* PyUnicode_AsUTF8(object unicode)
+# Number of records loaded from the database at a time when iterating over a query
+WINDOW_SIZE = 1000
 
 
 """
@@ -41,13 +45,20 @@ cdef class RecordList(object):
         self.TableClass = table_class
         self.cfg = cfg
         self._summary = None
+        self._query = None
+        self._index = None
+        # Records loaded by index, starting at _window_start in current db view
+        self._window = None
+        self._window_start = 0
         self.num_records = 0
+        # Counted on first use
+        self.num_records_in_db = -1
         self.truncate = truncate
         if records_list:
             self.results = records_list
+            self.num_records = len(records_list)
         else:
             self.results = None
-            self.num_records_in_db = len(self.sess.query(self.TableClass).all())
         self.has_text = False
         if query and not records_list:
             self.query(query)
@@ -129,13 +140,13 @@ cdef class RecordList(object):
                 "Table Name:",
                 self.cfg.table_name,
                 "Number of Records:",
-                "{:>{len_num}}/{:<{len_db}}".format(str(self.num_records), str(self.num_records_in_db),
+                "{:>{len_num}}/{:<{len_db}}".format(str(self.num_records), str(self._get_num_records_in_db()),
                                                len_num=len(str(self.num_records)),
-                                               len_db=len(str(self.num_records_in_db))),
+                                               len_db=len(str(self._get_num_records_in_db()))),
                 longest_key=longest_key))
         # Display single record
         elif self.num_records == 1:
-            print(str(self.results[0]))
+            print(str(self[0]))
             return  # summary_string.getvalue()
         # No records found
         else:
@@ -188,6 +199,8 @@ cdef class RecordList(object):
 
     def _gather_metadata(self):
         """ Protected method to collect data, averages, and standard deviations
+        Statistics for the current db view are computed within the database,
+        records are only walked in python for lists created from records_list
 
         :return:
         """
@@ -200,15 +213,19 @@ cdef class RecordList(object):
         cdef object found_type, obj
         cdef dict data_types = {_k: TypeMapper.string_to_py_type[v]
                                 for _k,v in ClassManager.get_class_as_dict(self.cfg).items()}
-        if self.results is None:
+        if self.results is None and self._query is None:
              self.query()
-        num_records = self.num_records
+        num_records = len(self)
         column_keys = list(self.columns())
+        if self._query is not None:
+            summary_data, has_text = StatsManager(self._query, self.TableClass, num_records, self.truncate).gather(
+                column_keys, data_types, RecordList._correct_value)
+            return summary_data, num_records, has_text
         if self.truncate:
             get_fxn = self._get_truncated
         else:
             get_fxn = getattr
-        for record in self.results:
+        for record in self:
             # if record._id in self.ignore_ids:
             #     continue
             for column in column_keys:
@@ -263,29 +280,101 @@ cdef class RecordList(object):
                         summary_data[column][3] = -1
         return summary_data, num_records, has_text
 
-    def query(self, *args):
+    def query(self, *args, object ids=None):
         """ Wrapper function for querying database. Converts text argument to query statement
+        Only the number of matching records is gathered, records are loaded as they are accessed
 
         :param args:
+        :param ids: (Query)     Optional query of ids (e.g. from id_query()) to restrict results to
         :return:
         """
-        cdef object record
+        cdef object query
         self._clear_prior_metadata()
         # Query passed
         if len(args) > 0:
-            # Attempt query
-            try:
-                self.results = self._map_query(*args)
-            # Column name not found
-            except OperationalError:
-                return
-                # raise ColumnNameNotFoundError
+            query = self._map_query(*args)
         # Default get all
         else:
-            self.results = self.sess.query(self.TableClass).all()
-        self.num_records = len(self.results)
+            query = self.sess.query(self.TableClass)
+        if ids is not None:
+            query = query.filter(self.TableClass._id.in_(ids))
+        # Attempt query
+        try:
+            self._set_query(query)
+        # Column name not found
+        except OperationalError:
+            return
+            # raise ColumnNameNotFoundError
         return
 
+    def _set_query(self, object query):
+        """ Protected method sets query as current db view, running only SELECT COUNT(*)
+
+        :param query: (Query)
+        :return:
+        """
+        self.results = []
+        self._query = None
+        self._index = None
+        self._window = None
+        self.num_records = query.with_entities(func.count(self.TableClass._id)).scalar()
+        self._query = query
+        self.results = None
+
+    def id_query(self):
+        """ Returns query selecting only the ids in the current db view, for use in
+        set operations (e.g. intersect) or as ids in another RecordList's query()
+
+        :return Query:
+        """
+        if self._query is None:
+            return None
+        return self._query.with_entities(self.TableClass._id)
+
+    def _ordered_query(self):
+        """ Protected method returns current db view in a stable order, so records keep their index across calls
+
+        :return Query:
+        """
+        return self._query.order_by(self.TableClass.id)
+
+    def _materialize(self):
+        """ Protected method loads all records in current db view
+
+        :return List[object]:
+        """
+        cdef object record
+        if self.results is None:
+            self.results = (self._ordered_query().all() if self._query is not None else [])
+            if self._index is not None:
+                self._index = {record._id: record for record in self.results}
+        return self.results
+
+    def _get_index(self):
+        """ Protected method returns hash index of _id: record for current db view, building it on first use
+        If records are not yet loaded, only ids are gathered and records are stored as None until accessed
+
+        :return Dict[str, object]:
+        """
+        cdef object record
+        if self._index is None:
+            if self.results is not None:
+                self._index = {record._id: record for record in self.results}
+            elif self._query is not None:
+                self._index = {record[0]: None for record in self.id_query()}
+            else:
+                self._index = {}
+        return self._index
+
+    def _get_num_records_in_db(self):
+        """ Protected method returns total number of records in table, using SELECT COUNT(*)
+
+        :return int:
+        """
+        if self.num_records_in_db < 0:
+            self.num_records_in_db = self.sess.query(func.count(self.TableClass._id)).scalar()
+        return self.num_records_in_db
+
     def _map_query(self, *args):
         """ Method calls 'convenience queries'
 
@@ -304,27 +393,27 @@ cdef class RecordList(object):
             for col in self.columns():
                 query += "(%s IS NOT NULL AND %s != 'hypothetical protein') OR " % (col, col)
             args[0] = args[0].replace("annotated", query[:-4])
-            return self.sess.query(self.TableClass).filter(text(*args)).all()
+            return self.sess.query(self.TableClass).filter(text(*args))
         # All unannotated
         if "unannotated" in args[0]:
             for col in self.columns():
                 query += "(%s IS NULL OR %s == 'hypothetical protein') AND " % (col, col)
             args[0] = args[0].replace("unannotated", query[:-5])
-            return self.sess.query(self.TableClass).filter(text(*args)).all()
+            return self.sess.query(self.TableClass).filter(text(*args))
         # High quality, non-redundant
         if 'hqnr' in args[0]:
             args[0] = args[0].replace("hqnr", "is_non_redundant AND is_complete AND NOT is_contaminated")
-            return self.sess.query(self.TableClass).filter(text(*args)).all()
+            return self.sess.query(self.TableClass).filter(text(*args))
         # Individual annotations
         for val in args[0].split(" "):
             if "_annot" in val:
                 _v = val.replace("_annot", "")
                 args[0] = args[0].replace(val, "(%s IS NOT NULL AND %s != 'hypothetical protein')" % (_v, _v))
-                # return self.sess.query(self.TableClass).filter(text(*args)).all()
+                # return self.sess.query(self.TableClass).filter(text(*args))
             elif "_unannot" in val:
                 _v = val.replace("_unannot", "")
                 args[0] = args[0].replace(val, "(%s IS NULL OR %s == 'hypothetical protein')" % (_v, _v))
-        return self.sess.query(self.TableClass).filter(text(*args)).all()
+        return self.sess.query(self.TableClass).filter(text(*args))
 
 
     # TODO Needs to be tested w/ tables that populate non-null set of db records
@@ -335,7 +424,9 @@ cdef class RecordList(object):
         :return:
         """
         try:
-            self.results = self.sess.query(self.TableClass).join(other.TableClass, self.TableClass._id == other.TableClass._id).all()
+            self._set_query(
+                self.sess.query(self.TableClass).join(other.TableClass, self.TableClass._id == other.TableClass._id)
+            )
         # Column name not found
         except OperationalError:
             raise ColumnNameNotFoundError
@@ -347,7 +438,7 @@ cdef class RecordList(object):
 
         :return:
         """
-        self._summary, self.num_records = None, 0
+        self._summary, self.num_records, self._index, self._window = None, 0, None, None
 
     def find_column(self, str possible_column):
         """ Searches available columns for user-passed value
@@ -365,41 +456,78 @@ cdef class RecordList(object):
         return self
 
     def __contains__(self, item):
-        return item._id in [record._id for record in self.results]
+        """ Checks if record (or record id) is in current db view using hash index
+
+        :param item:
+        :return:
+        """
+        if type(item) == str:
+            return item in self._get_index()
+        return item._id in self._get_index()
 
     def __iter__(self):
-        """ Iterator yields next value in self.results
+        """ Iterator yields next value in current db view
+        Records are loaded from the database WINDOW_SIZE at a time unless already loaded
 
         :return:
         """
-        cdef int i
-        for i in range(self.num_records):
-            yield self.results[i]
+        cdef object record
+        if self.results is not None:
+            for record in self.results:
+                yield record
+        elif self._query is not None:
+            for record in self._ordered_query().yield_per(WINDOW_SIZE):
+                yield record
 
     def __getitem__(self, item):
         """ Allows class to be indexed and searched
+        Only the requested records are loaded, unless all records are already loaded.
+        Records are loaded by index WINDOW_SIZE at a time, so accessing records in order runs one query per window
 
         :param item:
         :return:
         """
         cdef object record
         if type(item) == int:
-            assert item < self.num_records, "Index must be less than length"
-            return self.results[item]
+            if item < 0:
+                item += self.num_records
+            assert 0 <= item < self.num_records, "Index must be less than length"
+            if self.results is not None:
+                return self.results[item]
+            if self._window is None or not self._window_start <= item < self._window_start + len(self._window):
+                self._load_window(item)
+            return self._window[item - self._window_start]
         elif type(item) == slice:
-            if type(item.start) is None:
-                item.start = 0
-            if type(item.stop) is None:
-                item.stop = -1
-            if type(item.step) is None:
-                item.start = 1
-            return self.results[item.start : item.stop : item.step]
+            if self.results is None and self._query is not None and item.step in (None, 1) \
+                    and (item.start or 0) >= 0 and item.stop is not None and item.stop >= 0:
+                return self._ordered_query().slice(item.start or 0, item.stop).all()
+            return self._materialize()[item]
         elif type(item) == str:
-            for record in self.results:
-                if record._id == item:
-                    return record
+            index = self._get_index()
+            if item not in index:
+                return None
+            record = index[item]
+            if record is None:
+                record = self._query.filter(self.TableClass._id == item).first()
+                index[item] = record
+            return record
         return None
 
+    def _load_window(self, int item):
+        """ Protected method loads the WINDOW_SIZE records of current db view that hold index item
+        The window following the loaded window is found by id, rather than by offset
+
+        :param item: (int)
+        :return:
+        """
+        cdef int start = item - item % WINDOW_SIZE
+        if self._window and start == self._window_start + len(self._window):
+            self._window = self._ordered_query().filter(
+                self.TableClass.id > self._window[-1].id).limit(WINDOW_SIZE).all()
+        else:
+            self._window = self._ordered_query().slice(start, start + WINDOW_SIZE).all()
+        self._window_start = start
+
     def __len__(self):
         """ Accessible through len()
 
@@ -412,9 +540,9 @@ cdef class RecordList(object):
 
         :return:
         """
-        cdef object record
-        if self.results:
-            return [record._id for record in self.results]
+        cdef list ids = list(self._get_index().keys())
+        if ids:
+            return ids
         return None
 
     def values(self):
@@ -423,7 +551,7 @@ cdef class RecordList(object):
         :return:
         """
         cdef object record
-        return [record for record in self.results]
+        return [record for record in self._materialize()]
 
     def items(self):
         """ Returns tuple of (key, value) pairs
@@ -431,7 +559,7 @@ cdef class RecordList(object):
         :return:
         """
         cdef object record
-        return [(record._id, record) for record in self.results]
+        return [(record._id, record) for record in self._materialize()]
 
     def save(self):
         """ Calls the session's commit function to store changes
@@ -441,53 +569,60 @@ cdef class RecordList(object):
         self.sess.commit()
         return self
 
-    def write_records(self, str output_dir):
+    def write_records(self, str output_dir, int workers=0):
         """ Method will write all records that are in the current db view to a user-provided
-         output file
+        output directory, adding each record's annotation to the headers in its file.
+        Annotations are found once per record, and files (decompressed if gzipped) are written in parallel.
+        Records without a data file are skipped
 
-        :return:
+        :param output_dir: (str)
+        :param workers: (int)   Number of files written at once, 0 for default
+        :return int:    Number of files written
         """
-        cdef object R, W
-        cdef bytes _line
         cdef object record
+        cdef str path
+        cdef list columns = self._annotation_columns()
+        cdef list jobs = []
+        # Each location is listed once for this call, rather than checking each record's file
+        cdef dict listings = {}
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
-        for record in self.results:
-            W = open(os.path.join(output_dir, record._id), "wb")
-            R = open(record.full_path(), "rb")
-            try:
-                for _line in R:
-                    W.write(_line[:-1] + b" " + PyUnicode_AsUTF8(self._add_annotation(record)) + b"\n")
-                    _line = next(R)
-                    while _line[0] != b">":
-                        W.write(_line)
-                        _line = next(R)
-            except StopIteration:
+        for record in self:
+            path = record.full_path(listings)
+            if path is None:
                 continue
-            R.close()
-        W.close()
+            jobs.append((path, RecordWriter.out_file_name(output_dir, record._id),
+                         self._add_annotation(record, columns), record.data_type))
+        return RecordWriter(workers).write(jobs)
+
+    def _annotation_columns(self):
+        """ Protected method returns columns searched for annotation, in order of priority
+
+        :return List[str]:
+        """
+        cdef list priority_list = RecordList._annotation_priority()
+        if self.cfg is None:
+            return priority_list
+        return priority_list + list(set(self.columns()) - set(priority_list))
 
-    def _add_annotation(self, object record):
+    def _add_annotation(self, object record, list columns=None):
         """ Protected method will search for annotation (via priority list) and add as fasta description
 
         :param record:
+        :param columns: (List[str])     Columns to search, as from _annotation_columns
         :return:
         """
         cdef str annot, located_annot
-        cdef list priority_list = RecordList._annotation_priority()
+        if columns is None:
+            columns = self._annotation_columns()
         if self.truncate:
             get_fxn = self._get_truncated
         else:
             get_fxn = getattr
-        for annot in priority_list:
+        for annot in columns:
             located_annot = str(get_fxn(record, annot, ""))
             if located_annot is not None and located_annot not in ("", "None"):
                 return located_annot
-        if self.cfg is not None:
-            for annot in set(self.columns()) - set(priority_list):
-                located_annot = str(get_fxn(record, annot, ""))
-                if located_annot is not None and located_annot not in ("", "None"):
-                    return located_annot
         return ""
 
     def _get_truncated(self, object record, str annotation, str default=""):
@@ -497,52 +632,98 @@ cdef class RecordList(object):
         :param default:
         :return:
         """
+        return RecordList._truncate_value(annotation, getattr(record, annotation, default))
+
+    @staticmethod
+    def _truncate_value(str annotation, object value):
+        """ Protected method returns first word of value, as string
+
+        :param annotation: (str)    Column name
+        :param value:
+        :return str:
+        """
         # Prokka does not work well here
         # Do not truncate
         if annotation == "prokka":
-            return str(getattr(record, annotation, default))
-        cdef str trunc_annot = str(getattr(record, annotation, default)).split(" ")[0]
+            return str(value)
+        cdef str trunc_annot = str(value).split(" ")[0]
         if trunc_annot == "hypothetical":
             return "hypothetical protein"
         return trunc_annot
 
     def write_tsv(self, str output_file, str delim = "\t", list col_list = []):
-        """ Outputs all record metadata in current db view to file
+        """ Outputs all record metadata in current db view to file, gzipped if output_file ends with .gz
+        Rows of a query that is not yet loaded are streamed from the database as tuples of only the
+        written columns, and are written in batches
 
         :param output_file:
         :param delim:
         :param col_list:
         :return:
         """
-        if self.truncate:
-            get_fxn = self._get_truncated
-        else:
-            get_fxn = getattr
-        if self.results is None:
+        if self.results is None and self._query is None:
              self.query()
         cdef list cols
         cdef object W
-        cdef object record
-        cdef str col
+        cdef object row
+        cdef list lines = []
         # Write header
-        if len(self.results) > 0:
+        if len(self) > 0:
             if col_list:
                 cols = col_list
             else:
                 cols = sorted(self.columns())
-            W = open(output_file, "w")
-            W.write("_id" + delim)
-            W.write(delim.join(cols) + "\n")
+            W = (gzip.open(output_file, "wt") if output_file.endswith(".gz") else open(output_file, "w"))
+            try:
+                W.write("_id" + delim)
+                W.write(delim.join(cols) + "\n")
+                for row in self._iter_rows(cols):
+                    lines.append(delim.join(row) + "\n")
+                    if len(lines) >= WINDOW_SIZE:
+                        W.writelines(lines)
+                        lines = []
+                W.writelines(lines)
+            finally:
+                W.close()
+
+    def _iter_rows(self, list cols):
+        """ Protected method yields _id and string values of cols for each record in current db view
+        Loaded records are read directly, otherwise only the needed columns are selected, using a streaming cursor
+
+        :param cols: (List[str])
+        :return Iterable[List[str]]:
+        """
+        cdef object record, row
+        cdef str col
+        cdef int i
+        cdef list values
+        cdef object table_columns = class_mapper(self.TableClass).columns
+        # Columns not in table are written as None, as with records
+        cdef list selected = [col for col in cols if col in table_columns]
+        cdef list positions = [(selected.index(col) + 1 if col in table_columns else -1) for col in cols]
+        if self.results is not None:
+            get_fxn = (self._get_truncated if self.truncate else getattr)
             for record in self.results:
-                W.write(record._id)
-                for col in cols:
-                    W.write(delim + str(get_fxn(record, col, "None")).strip())
-                W.write("\n")
+                yield [record._id] + [str(get_fxn(record, col, "None")).strip() for col in cols]
+            return
+        for row in self._query.with_entities(self.TableClass._id, *[getattr(self.TableClass, col) for col in selected]) \
+                .execution_options(stream_results=True).yield_per(WINDOW_SIZE):
+            values = [row[0]]
+            for col, i in zip(cols, positions):
+                if i == -1:
+                    values.append("None")
+                elif self.truncate:
+                    values.append(RecordList._truncate_value(col, row[i]).strip())
+                else:
+                    values.append(str(row[i]).strip())
+            yield values
 
     def update(self, object data=None, str directory_name="None", bint silent=False, bint integrity_cancel=False):
         """ Wrapper function to update project. In experimental mode.
+        Data is loaded directly from memory using batched statements, adding new columns to the table in place.
+        Pending changes in the session are committed first. Integrity check is only run when files are added
 
-        :param data:
+        :param data: (UpdateData)
         :param directory_name:
         :param silent:
         :param integrity_cancel:
@@ -551,11 +732,50 @@ cdef class RecordList(object):
         # No valid info passed
         if data is None:
             return
-        # Function call for .tsv file
-        cdef str file_name = "%s.tmp" % "".join([choice(ascii_lowercase) for i in range(32)])
-        data.to_file(file_name)
-        update_existing_table(self.cfg.working_dir, self.TableClass.__name__, directory_name, file_name, "None", silent, integrity_cancel)
-        data.delete_file()
+        cdef object genomic_files_to_add = ()
+        # Loading uses its own connection, which would otherwise wait on this session's transaction
+        self.sess.commit()
+        if directory_name != "None":
+            genomic_files_to_add = os.listdir(directory_name)
+        ClassManager.write_class(
+            ClassManager.populate_data_to_existing_table(self.cfg.table_name, UpdateDataStream(data), self.cfg,
+                                                         genomic_files_to_add, directory_name, silent),
+            self.cfg.classes_file
+        )
+        self._refresh_class()
+        if directory_name != "None" and not integrity_cancel:
+            integrity_check(self.cfg.working_dir, self.cfg.table_name, "None", silent)
+
+    def _refresh_class(self):
+        """ Protected method reloads records in current db view after an update, using the mapped class
+        for the current schema if columns were added. A query's view is kept by selecting records whose ids
+        match the full prior query, including its joins, and loaded records are reloaded by id, in order
+
+        :return:
+        """
+        cdef object query = self._query
+        cdef object TableClass = Registry.get_class(self.cfg.table_name, self.sess.bind)
+        cdef object PriorClass = self.TableClass
+        cdef object record
+        cdef list ids = ([record._id for record in self.results] if query is None and self.results is not None
+                         else None)
+        cdef dict records = {}
+        cdef int i
+        self.sess.expire_all()
+        if TableClass is self.TableClass:
+            return
+        self.TableClass = TableClass
+        self._clear_prior_metadata()
+        if query is not None:
+            self._set_query(self.sess.query(TableClass).filter(
+                TableClass._id.in_(query.with_entities(PriorClass._id))))
+        elif ids is not None:
+            # Stay below SQLite's limit on number of bound parameters
+            for i in range(0, len(ids), 500):
+                for record in self.sess.query(TableClass).filter(TableClass._id.in_(ids[i: i + 500])):
+                    records[record._id] = record
+            self.results = [records[_id] for _id in ids if _id in records]
+            self.num_records = len(self.results)
 
     @staticmethod
     def _annotation_priority():
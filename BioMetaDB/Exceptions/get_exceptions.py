@@ -7,3 +7,7 @@ class SequenceIdNotFoundError(Error):
 
 class ImproperFormatIndexFileError(Error):
     pass
+
+
+class ImproperFormatFastxFileError(Error):
+    pass
@@ -10,6 +10,9 @@ class IndexExtensions:
     IDX_FA_FILE = ".imfadx"
     IDX_FQ_FILE = ".imfqdx"
     IDX_TSV_FILE = ".imtbx"
+    # Byte-offset indices, for random access to records
+    IDX_FA_OFFSET_FILE = ".imfai"
+    IDX_FQ_OFFSET_FILE = ".imfqi"
     match = {
         IDX_FA_FILE:    "fasta",
         IDX_FQ_FILE:    "fastq",
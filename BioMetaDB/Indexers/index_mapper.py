@@ -151,12 +151,23 @@ class IndexCreator:
         :param file_name: (str)	Name of fastx file
         """
         data_type = BioOps.get_type(file_name)
-        records = BioOps.parse_large(file_name, data_type)
+        records = BioOps.iter_records(file_name, data_type)
+        SeqIO.write(IndexCreator._rename_records(records, image_mapper, remove_description),
+                    file_name + IndexExtensions.match[data_type], data_type)
+
+    @staticmethod
+    def _rename_records(records, image_mapper, remove_description):
+        """ Generator yields records with ids renamed using index file
+
+        :param records: (Iterator[SeqRecord])
+        :param image_mapper: (IndexMapper)	Mapped index file
+        :param remove_description: (bool)   Remove description from records
+        """
         for record in records:
             record.id = image_mapper.get(record.id)
             if remove_description:
                 record.description = ""
-        SeqIO.write(records, file_name + IndexExtensions.match[data_type], data_type)
+            yield record
 
     @staticmethod
     def rename_directory_contents_using_index(directory):
@@ -0,0 +1,348 @@
+import os
+import gzip
+import shutil
+from Bio import bgzf
+from Bio.Seq import Seq
+from Bio.SeqRecord import SeqRecord
+from BioMetaDB.Accessories.bio_ops import BioOps
+from BioMetaDB.Indexers.index_extensions import IndexExtensions
+from BioMetaDB.Exceptions.get_exceptions import SequenceIdNotFoundError
+from BioMetaDB.Exceptions.get_exceptions import ImproperFormatIndexFileError
+from BioMetaDB.Exceptions.get_exceptions import ImproperFormatFastxFileError
+
+"""
+Script holds OffsetIndex, a faidx-style index of the byte offset, length, and line width of each record in a fastx file
+Records are retrieved by seeking directly to their offset, in plain or block-gzipped (bgzip) files
+
+"""
+
+
+class OffsetEntry:
+    """ Location of single record in fastx file
+    For bgzip files, offsets are BGZF virtual offsets
+
+    """
+    __slots__ = ("name", "length", "offset", "line_bases", "line_width", "qual_offset", "header_offset")
+
+    def __init__(self, name, length, offset, line_bases, line_width, qual_offset, header_offset):
+        """
+
+        :param name: (str)  Record id
+        :param length: (int)    Number of bases in sequence
+        :param offset: (int)    Offset of first base of sequence
+        :param line_bases: (int)    Number of bases per sequence line
+        :param line_width: (int)    Number of bytes per sequence line, including newline
+        :param qual_offset: (int)   Offset of first quality score, -1 for fasta
+        :param header_offset: (int) Offset of header line
+        """
+        self.name = name
+        self.length = length
+        self.offset = offset
+        self.line_bases = line_bases
+        self.line_width = line_width
+        self.qual_offset = qual_offset
+        self.header_offset = header_offset
+
+    def num_bytes(self):
+        """ Returns number of bytes spanned by sequence (or quality scores), including newlines
+
+        :return int:
+        """
+        if self.line_bases == 0:
+            return 0
+        return (self.length // self.line_bases) * self.line_width + self.length % self.line_bases
+
+    def to_line(self):
+        return "%s\t%i\t%i\t%i\t%i\t%i\t%i\n" % (self.name, self.length, self.offset, self.line_bases,
+                                                 self.line_width, self.qual_offset, self.header_offset)
+
+    @staticmethod
+    def from_line(line):
+        """ Returns OffsetEntry from line of index file
+
+        :param line: (str)
+        :return OffsetEntry:
+        """
+        line = line.rstrip("\r\n").split("\t")
+        if len(line) != 7:
+            raise ImproperFormatIndexFileError(line[0])
+        return OffsetEntry(line[0], *(int(val) for val in line[1:]))
+
+
+class OffsetIndex:
+    BGZF_MAGIC = b"\x1f\x8b\x08\x04"
+    GZIP_MAGIC = b"\x1f\x8b"
+    COPY_SIZE = 65536
+
+    def __init__(self, file_name, create=True):
+        """ Class loads byte-offset index of fastx file, creating (or recreating, if older than file) as needed.
+        Opened file is closed with close(), or by using class as context manager
+
+        :param file_name: (str)     Name of fasta/fastq file, plain or compressed with bgzip
+        :param create: (bool)   Create index if it does not exist or is out of date
+        """
+        self.file_name = file_name
+        self.data_type = BioOps.get_type(file_name)
+        if create and not OffsetIndex.is_indexed(file_name):
+            OffsetIndex.create(file_name)
+        self.entries = OffsetIndex._load_file(OffsetIndex.index_file_name(file_name))
+        self.is_bgzf = OffsetIndex.is_bgzf(file_name)
+        self._handle = None
+
+    @staticmethod
+    def index_file_name(file_name):
+        """ Returns name of index file for fastx file
+
+        :param file_name: (str)
+        :return str:
+        """
+        if BioOps.get_type(file_name) == "fastq":
+            return file_name + IndexExtensions.IDX_FQ_OFFSET_FILE
+        return file_name + IndexExtensions.IDX_FA_OFFSET_FILE
+
+    @staticmethod
+    def is_indexed(file_name):
+        """ Checks if index file exists and is newer than fastx file
+
+        :param file_name: (str)
+        :return bool:
+        """
+        index_file = OffsetIndex.index_file_name(file_name)
+        return os.path.isfile(index_file) and os.path.getmtime(index_file) >= os.path.getmtime(file_name)
+
+    @staticmethod
+    def is_bgzf(file_name):
+        """ Checks if file is compressed with bgzip, which allows random access
+
+        :param file_name: (str)
+        :return bool:
+        """
+        with open(file_name, "rb") as R:
+            header = R.read(18)
+        return header[:4] == OffsetIndex.BGZF_MAGIC and header[12:14] == b"BC"
+
+    @staticmethod
+    def _load_file(index_file):
+        """ Protected method loads index file into dictionary of id: OffsetEntry
+
+        :param index_file: (str)
+        :return Dict[str, OffsetEntry]:
+        """
+        entries = {}
+        with open(index_file, "r") as R:
+            for line in R:
+                entry = OffsetEntry.from_line(line)
+                entries[entry.name] = entry
+        return entries
+
+    @staticmethod
+    def _open(file_name):
+        """ Protected method opens fastx file for reading bytes with random access
+
+        :param file_name: (str)
+        :return file:
+        """
+        if OffsetIndex.is_bgzf(file_name):
+            return bgzf.BgzfReader(file_name, "rb")
+        with open(file_name, "rb") as R:
+            if R.read(2) == OffsetIndex.GZIP_MAGIC:
+                raise ImproperFormatFastxFileError(
+                    "%s is not compressed with bgzip, which is required for random access" % file_name)
+        return open(file_name, "rb")
+
+    @staticmethod
+    def create(file_name):
+        """ Writes byte-offset index for fasta or fastq file
+
+        :param file_name: (str)     Name of fasta/fastq file, plain or compressed with bgzip
+        :return str:    Name of index file
+        """
+        index_file = OffsetIndex.index_file_name(file_name)
+        R = OffsetIndex._open(file_name)
+        lines = OffsetIndex._lines(R, OffsetIndex.is_bgzf(file_name))
+        try:
+            with open(index_file, "w") as W:
+                if BioOps.get_type(file_name) == "fastq":
+                    entries = OffsetIndex._index_fastq(lines)
+                else:
+                    entries = OffsetIndex._index_fasta(lines)
+                for entry in entries:
+                    W.write(entry.to_line())
+        except ImproperFormatFastxFileError:
+            os.remove(index_file)
+            raise
+        finally:
+            R.close()
+        return index_file
+
+    @staticmethod
+    def _lines(R, is_bgzf):
+        """ Protected generator yields (offset, offset of next line, line) for each line in opened file
+
+        :param R: (file)    File opened in binary mode
+        :param is_bgzf: (bool)  File is compressed with bgzip, so offsets are read from file
+        """
+        offset = 0
+        if is_bgzf:
+            offset = R.tell()
+            line = R.readline()
+            while line:
+                next_offset = R.tell()
+                yield offset, next_offset, line
+                offset = next_offset
+                line = R.readline()
+            return
+        for line in R:
+            yield offset, offset + len(line), line
+            offset += len(line)
+
+    @staticmethod
+    def _index_fasta(lines):
+        """ Protected generator yields OffsetEntry for each record in fasta file
+        All sequence lines of a record, except the last, must be the same length
+
+        :param lines: (Iterator[Tuple[int, int, bytes]])    Lines of file, as from _lines
+        """
+        entry = None
+        is_last_line = False
+        for offset, next_offset, line in lines:
+            if line.startswith(b">"):
+                if entry is not None:
+                    yield entry
+                entry = OffsetEntry(OffsetIndex._title_to_id(line), 0, next_offset, 0, 0, -1, offset)
+                is_last_line = False
+                continue
+            if entry is None:
+                continue
+            num_bases = len(line.rstrip(b"\r\n"))
+            if num_bases == 0:
+                is_last_line = True
+                continue
+            if entry.line_bases == 0:
+                entry.offset, entry.line_bases, entry.line_width = offset, num_bases, len(line)
+            elif is_last_line or num_bases > entry.line_bases:
+                raise ImproperFormatFastxFileError("Inconsistent line length in record %s" % entry.name)
+            elif num_bases < entry.line_bases:
+                is_last_line = True
+            entry.length += num_bases
+        if entry is not None:
+            yield entry
+
+    @staticmethod
+    def _index_fastq(lines):
+        """ Protected generator yields OffsetEntry for each record in fastq file
+
+        :param lines: (Iterator[Tuple[int, int, bytes]])    Lines of file, as from _lines
+        """
+        for offset, next_offset, line in lines:
+            if not line.startswith(b"@"):
+                continue
+            entry = OffsetEntry(OffsetIndex._title_to_id(line), 0, next_offset, 0, 0, -1, offset)
+            # Sequence lines, until separator line
+            for offset, next_offset, line in lines:
+                if line.startswith(b"+"):
+                    entry.qual_offset = next_offset
+                    break
+                if entry.line_bases == 0:
+                    entry.offset, entry.line_bases, entry.line_width = offset, len(line.rstrip(b"\r\n")), len(line)
+                entry.length += len(line.rstrip(b"\r\n"))
+            # Quality lines, until same number of scores as bases
+            num_scores = 0
+            while num_scores < entry.length:
+                offset, next_offset, line = next(lines, (None, None, b""))
+                if not line:
+                    raise ImproperFormatFastxFileError("Quality scores missing for record %s" % entry.name)
+                num_scores += len(line.rstrip(b"\r\n"))
+            yield entry
+
+    @staticmethod
+    def _title_to_id(line):
+        """ Protected method returns id from header line
+
+        :param line: (bytes)
+        :return str:
+        """
+        title = line[1:].rstrip(b"\r\n").decode()
+        return title.split(None, 1)[0] if title else title
+
+    def _read(self, offset, num_bytes):
+        """ Protected method reads sequence (or quality scores) at offset, removing newlines
+
+        :param offset: (int)
+        :param num_bytes: (int)
+        :return str:
+        """
+        if self._handle is None:
+            self._handle = OffsetIndex._open(self.file_name)
+        self._handle.seek(offset)
+        return self._handle.read(num_bytes).replace(b"\n", b"").replace(b"\r", b"").decode()
+
+    def get(self, _id):
+        """ Returns record for id, read by seeking to its location in file
+
+        :param _id: (str)
+        :return SeqRecord:
+        """
+        entry = self.entries.get(_id)
+        if entry is None:
+            raise SequenceIdNotFoundError(_id)
+        if self._handle is None:
+            self._handle = OffsetIndex._open(self.file_name)
+        self._handle.seek(entry.header_offset)
+        title = self._handle.readline()[1:].rstrip(b"\r\n").decode()
+        record = SeqRecord(Seq(self._read(entry.offset, entry.num_bytes())), id=_id, description=title)
+        if entry.qual_offset >= 0:
+            record.letter_annotations["phred_quality"] = BioOps.calculate_phred(
+                list(self._read(entry.qual_offset, entry.num_bytes())))
+        return record
+
+    def get_many(self, ids):
+        """ Generator yields records for each id, in order passed
+
+        :param ids: (Iterable[str])
+        """
+        for _id in ids:
+            yield self.get(_id)
+
+    def keys(self):
+        return self.entries.keys()
+
+    def close(self):
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def __contains__(self, _id):
+        return _id in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @staticmethod
+    def bgzip(file_name, out_file=None):
+        """ Compresses file with bgzip (block gzip), allowing random access to compressed records
+        Files compressed with gzip are recompressed
+
+        :param file_name: (str)     Name of file
+        :param out_file: (str)  Name of output file, default is file_name with .gz extension
+        :return str:    Name of compressed file
+        """
+        out_file = out_file or (file_name if file_name.endswith(".gz") else file_name + ".gz")
+        tmp_file = out_file + ".tmp"
+        with open(file_name, "rb") as R:
+            is_gzip = R.read(2) == OffsetIndex.GZIP_MAGIC
+        R = (gzip.open(file_name, "rb") if is_gzip else open(file_name, "rb"))
+        W = bgzf.BgzfWriter(tmp_file, "wb")
+        try:
+            shutil.copyfileobj(R, W, OffsetIndex.COPY_SIZE)
+        finally:
+            R.close()
+            W.close()
+        os.replace(tmp_file, out_file)
+        return out_file
@@ -8,6 +8,8 @@ Script holds superclass from which all user-created classes will inherit
 
 
 class Record:
+    # Project directory, against which relative locations are resolved. Set for each mapped class by Registry
+    project_dir = ""
 
     def __init__(self):
         self._id = None
@@ -17,18 +19,46 @@ class Record:
     def __del__(self):
         self.clear_temp()
 
-    def full_path(self):
+    def full_path(self, dict listings=None):
         """ Method returns full path of bio storage location
+        Callers resolving many records may pass a dict that is filled with a listing of each location,
+        so each location is listed once and no files are stat'd. Keep it only for the duration of one call
 
+        :param listings: (Dict[str, Set[str]])  Location: names of files in location
         :return str:
         """
         cdef str file_path = None
-        if os.path.isfile(self.location + "/" + self._id):
-            file_path = self.location + "/" + self._id
-        elif os.path.isfile(self.location + "/" + self._id + ".gz"):
-            file_path = self.location + "/" + self._id + ".gz"
+        cdef str location = os.path.join(self.project_dir, self.location)
+        cdef set names
+        if listings is not None:
+            names = listings.get(location)
+            if names is None:
+                names = Record._list_location(location)
+                listings[location] = names
+            if self._id in names:
+                file_path = location + "/" + self._id
+            elif self._id + ".gz" in names:
+                file_path = location + "/" + self._id + ".gz"
+        elif os.path.isfile(location + "/" + self._id):
+            file_path = location + "/" + self._id
+        elif os.path.isfile(location + "/" + self._id + ".gz"):
+            file_path = location + "/" + self._id + ".gz"
         return file_path
 
+    @staticmethod
+    def _list_location(str location):
+        """ Protected method returns names of files in location, or empty set if it is not a directory
+
+        :param location: (str)
+        :return Set[str]:
+        """
+        cdef object entry
+        try:
+            with os.scandir(location) as entries:
+                return {entry.name for entry in entries if entry.is_file()}
+        except (FileNotFoundError, NotADirectoryError):
+            return set()
+
     def __repr__(self):
         """
 
@@ -89,13 +119,15 @@ class Record:
         summary_string += ("-" * (longest_key + 30) + "\n")
         return summary_string
 
-    def write_temp(self):
+    def write_temp(self, dict listings=None):
         """ Method writes file contents to temporary file and stores file name as instance attribute
 
+        :param listings: (Dict[str, Set[str]])  Listing snapshot shared by callers handling many records, see full_path
         """
         cdef str filename = self._id + ".tmp." + self.data_type
+        cdef str path = self.full_path(listings)
         cdef object W = open(filename, "wb")
-        with open(self.full_path(), "rb") as R:
+        with open(path, "rb") as R:
             W.write(R.read())
         W.close()
         self.temp_filename = filename
@@ -108,11 +140,34 @@ class Record:
             os.remove(self.temp_filename)
             self.temp_filename = None
 
-    def records(self):
+    def records(self, dict listings=None):
         """ Method returns contents of record's file as a list of BioPython SeqRecord objects
+        Use iter_records or record_batches for large files
 
+        :param listings: (Dict[str, Set[str]])  Listing snapshot shared by callers handling many records, see full_path
         :return List[SeqRecord]
         """
-        cdef str data_type = BioOps.get_type(self.full_path())
+        cdef str path = self.full_path(listings)
         # Parses large file if needed (chunk at 10000 lines)
-        return BioOps.parse_large(self.full_path(), data_type)
+        return BioOps.parse_large(path, BioOps.get_type(path))
+
+    def iter_records(self, bint tuples=False, dict listings=None):
+        """ Method yields contents of record's file one record at a time, reading gzip files transparently
+
+        :param tuples: (bool)   Yield (id, description, sequence) tuples instead of SeqRecord objects
+        :param listings: (Dict[str, Set[str]])  Listing snapshot shared by callers handling many records, see full_path
+        :return Iterator[SeqRecord]
+        """
+        cdef str path = self.full_path(listings)
+        return BioOps.iter_records(path, BioOps.get_type(path), tuples)
+
+    def record_batches(self, int batch_size=10000, bint tuples=False, dict listings=None):
+        """ Method yields contents of record's file as lists of at most batch_size records
+
+        :param batch_size: (int)    Number of records per batch
+        :param tuples: (bool)   Yield (id, description, sequence) tuples instead of SeqRecord objects
+        :param listings: (Dict[str, Set[str]])  Listing snapshot shared by callers handling many records, see full_path
+        :return Iterator[List[SeqRecord]]
+        """
+        cdef str path = self.full_path(listings)
+        return BioOps.iter_batches(path, BioOps.get_type(path), batch_size, tuples)
@@ -1,7 +1,9 @@
 import os
-from sqlalchemy import create_engine
+from contextlib import contextmanager
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, create_session
 from sqlalchemy.ext.declarative import declarative_base
+from BioMetaDB.Models.sqlite_profile import SQLiteProfile
 
 """ Class for handling Bsse schema requests, gathering metadata and session info, etc.
 
@@ -15,6 +17,10 @@ class BaseData:
 
     """
     Base = declarative_base()
+    # Engines are created once per database file
+    engines = {}
+    # PRAGMA settings applied to each new connection, by database
+    profiles = {}
 
     @staticmethod
     def get_uri(basedir, db_name):
@@ -31,8 +37,7 @@ class BaseData:
         :param basedir: (str) Base directory of database folder
         :param db_name: (str) Name of database to create. Should reference from child class DBNames
         """
-        SQLALCHEMY_DATABASE_URI = BaseData.get_uri(basedir, db_name)
-        engine = create_engine(SQLALCHEMY_DATABASE_URI)
+        engine = BaseData.get_engine(basedir, db_name)
         # Creates all tables in database
         BaseData.Base.metadata.create_all(engine)
 
@@ -44,8 +49,7 @@ class BaseData:
         :param db_name: (str) Name of database for which to create session
         :return Object:
         """
-        SQLALCHEMY_DATABASE_URI = BaseData.get_uri(basedir, db_name)
-        engine = create_engine(SQLALCHEMY_DATABASE_URI)
+        engine = BaseData.get_engine(basedir, db_name)
         # Returns session for CRUD operations on database
         return sessionmaker(bind=engine)()
 
@@ -60,14 +64,69 @@ class BaseData:
         return create_session(bind=e, autocommit=False, autoflush=True)
 
     @staticmethod
-    def get_engine(basedir, db_name):
-        """ Returns session variable
+    @contextmanager
+    def transaction(engine):
+        """ Context manager yields connection in a transaction that is committed on exit, or rolled back on error.
+        pysqlite does not begin transactions before DDL, so transaction is begun explicitly and also covers
+        schema and index changes
+
+        :param engine: (Engine)
+        :return Connection:
+        """
+        conn = engine.connect()
+        dbapi_conn = conn.connection.connection
+        isolation_level = dbapi_conn.isolation_level
+        dbapi_conn.isolation_level = None
+        trans = conn.begin()
+        try:
+            conn.execute("BEGIN")
+            yield conn
+            trans.commit()
+        except Exception:
+            trans.rollback()
+            raise
+        finally:
+            dbapi_conn.isolation_level = isolation_level
+            conn.close()
+
+    @staticmethod
+    def get_engine(basedir, db_name, profile=None):
+        """ Returns engine for database, creating it on first request
+        PRAGMA settings of the current profile are applied to each new connection
 
         :param basedir: (str) Base directory of database folder
         :param db_name: (str) Name of database for which to create session
+        :param profile: (Dict[str, str])  PRAGMA settings, as from SQLiteProfile.get, used for connections opened
+                                            from now on. Built-in default profile is used if never passed
         :return Object:
         """
-        SQLALCHEMY_DATABASE_URI = BaseData.get_uri(basedir, db_name)
-        engine = create_engine(SQLALCHEMY_DATABASE_URI)
-        # Returns session for CRUD operations on database
-        return engine
+        SQLALCHEMY_DATABASE_URI = BaseData.get_uri(os.path.abspath(basedir), db_name)
+        if SQLALCHEMY_DATABASE_URI not in BaseData.engines.keys():
+            engine = create_engine(SQLALCHEMY_DATABASE_URI)
+            event.listen(engine, "connect", BaseData._profile_listener(SQLALCHEMY_DATABASE_URI))
+            BaseData.profiles[SQLALCHEMY_DATABASE_URI] = SQLiteProfile.get()
+            BaseData.engines[SQLALCHEMY_DATABASE_URI] = engine
+        if profile is not None:
+            BaseData.profiles[SQLALCHEMY_DATABASE_URI] = profile
+        return BaseData.engines[SQLALCHEMY_DATABASE_URI]
+
+    @staticmethod
+    def get_profile(basedir, db_name):
+        """ Returns PRAGMA settings used for connections opened from now on, or None if engine was not yet created
+
+        :param basedir: (str) Base directory of database folder
+        :param db_name: (str) Name of database
+        :return Optional[Dict[str, str]]:
+        """
+        return BaseData.profiles.get(BaseData.get_uri(os.path.abspath(basedir), db_name))
+
+    @staticmethod
+    def _profile_listener(uri):
+        """ Protected method returns connect event handler that applies current profile of database
+
+        :param uri: (str)
+        :return Callable:
+        """
+        def on_connect(dbapi_conn, connection_record):
+            SQLiteProfile.apply(dbapi_conn, BaseData.profiles[uri])
+        return on_connect
@@ -0,0 +1,104 @@
+import os
+from sqlalchemy import MetaData, Table
+from sqlalchemy.orm import mapper
+from BioMetaDB.Models.models import BaseData
+from BioMetaDB.Models.functions import Record
+from BioMetaDB.Config.config_manager import ConfigManager
+from BioMetaDB.Models.sqlite_profile import SQLiteProfile
+
+"""
+Script holds Registry, a process-wide cache of reflected tables and mapped record classes.
+Entries are keyed by database file and schema version, so changes to a table's schema are never served from cache
+
+"""
+
+
+class Registry:
+    """ Class caches reflected Table objects and mapped classes for the lifetime of the process.
+    Engines are cached per database file by BaseData.get_engine
+
+    """
+    tables = {}
+    classes = {}
+
+    @staticmethod
+    def schema_version(engine):
+        """ Returns SQLite schema version, which is incremented on every schema change
+
+        :param engine: (Engine)
+        :return int:
+        """
+        return engine.execute("PRAGMA schema_version").scalar()
+
+    @staticmethod
+    def _key(table_name, engine):
+        """ Protected method returns cache key for table
+
+        :param table_name: (str)
+        :param engine: (Engine)
+        :return Tuple[str, int, str]:
+        """
+        return str(engine.url), Registry.schema_version(engine), table_name
+
+    @staticmethod
+    def project_dir(engine):
+        """ Returns project directory of database, against which record locations are resolved
+
+        :param engine: (Engine)
+        :return str:
+        """
+        return os.path.dirname(os.path.dirname(os.path.abspath(engine.url.database)))
+
+    @staticmethod
+    def get_table(table_name, engine):
+        """ Returns Table for table_name, reflecting only this table on first request
+
+        :param table_name: (str)
+        :param engine: (Engine)
+        :return Table:
+        """
+        key = Registry._key(table_name, engine)
+        if key not in Registry.tables.keys():
+            Registry.tables[key] = Table(table_name, MetaData(bind=engine), autoload=True)
+        return Registry.tables[key]
+
+    @staticmethod
+    def get_class(table_name, engine):
+        """ Returns Record subclass mapped to table_name, generating on first request
+
+        :param table_name: (str)
+        :param engine: (Engine)
+        :return type:
+        """
+        key = Registry._key(table_name, engine)
+        if key not in Registry.classes.keys():
+            UserClass = type(table_name, (Record,), {"project_dir": Registry.project_dir(engine)})
+            # Map to SQL orm
+            mapper(UserClass, Registry.get_table(table_name, engine))
+            Registry.classes[key] = UserClass
+        return Registry.classes[key]
+
+    @staticmethod
+    def load_table_metadata(config, table_name):
+        """ Returns session, mapped class, and ConfigManager for table in project
+
+        :param config: (Config)     Loaded config file
+        :param table_name: (str)
+        :return Tuple[Session, type, ConfigManager]:
+        """
+        cfg = ConfigManager(config, table_name)
+        engine = BaseData.get_engine(cfg.db_dir, cfg.db_name + ".db", cfg.sqlite_profile(SQLiteProfile.READ))
+        return BaseData.get_session_from_engine(engine), Registry.get_class(table_name, engine), cfg
+
+    @staticmethod
+    def invalidate(engine=None):
+        """ Removes cached tables and classes for database, or for all databases if engine is not passed
+        To be called after operations that change schema (UPDATE, REMOVECOL, REMOVE)
+
+        :param engine: (Engine)
+        :return:
+        """
+        for cache in (Registry.tables, Registry.classes):
+            for key in list(cache.keys()):
+                if engine is None or key[0] == str(engine.url):
+                    del cache[key]
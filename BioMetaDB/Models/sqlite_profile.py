@@ -0,0 +1,96 @@
+import sqlite3
+
+"""
+Script holds SQLiteProfile, which determines the PRAGMA settings applied to each connection to a project database
+Profiles are read from the project config file, with built-in values used for any settings that are not present
+
+"""
+
+
+class SQLiteProfile:
+    DEFAULT = "default"
+    # Used while loading data with INIT, CREATE, and UPDATE
+    BULK = "bulk"
+    # Used by SUMMARIZE and get_table
+    READ = "read"
+    SECTION = "SQLITE"
+    # page_size is set first, as it only has an effect before the database file is written
+    PRAGMAS = ("page_size", "journal_mode", "synchronous", "cache_size", "mmap_size", "temp_store")
+    PROFILES = {
+        DEFAULT: {
+            "page_size": "4096",
+            "journal_mode": "WAL",
+            "synchronous": "NORMAL",
+            # Negative values are in KiB
+            "cache_size": "-65536",
+            "mmap_size": "268435456",
+            "temp_store": "MEMORY",
+        },
+        BULK: {
+            "synchronous": "OFF",
+            "cache_size": "-262144",
+        },
+        READ: {
+            "cache_size": "-131072",
+            "mmap_size": "1073741824",
+        },
+    }
+
+    @staticmethod
+    def section_name(name):
+        """ Returns name of config file section holding settings for profile
+
+        :param name: (str)  Name of profile
+        :return str:
+        """
+        if name == SQLiteProfile.DEFAULT:
+            return SQLiteProfile.SECTION
+        return "%s.%s" % (SQLiteProfile.SECTION, name)
+
+    @staticmethod
+    def get(config=None, name=DEFAULT):
+        """ Returns PRAGMA settings for profile. Built-in values are overridden by the [SQLITE] section of the config
+        file, and then by the section for the profile (e.g. [SQLITE.bulk])
+
+        :param config: (Config)     Loaded config file, or None to use built-in values
+        :param name: (str)  Name of profile
+        :return Dict[str, str]:
+        """
+        pragmas = dict(SQLiteProfile.PROFILES[SQLiteProfile.DEFAULT])
+        pragmas.update(SQLiteProfile.PROFILES.get(name, {}))
+        if config is not None:
+            for section in (SQLiteProfile.section_name(SQLiteProfile.DEFAULT), SQLiteProfile.section_name(name)):
+                if config.has_section(section):
+                    pragmas.update({key: value for key, value in config[section].items()
+                                    if key in SQLiteProfile.PRAGMAS})
+        return pragmas
+
+    @staticmethod
+    def defaults():
+        """ Returns built-in settings of each profile, by config file section, for writing to new config files
+
+        :return Dict[str, Dict[str, str]]:
+        """
+        return {SQLiteProfile.section_name(name): dict(pragmas) for name, pragmas in SQLiteProfile.PROFILES.items()}
+
+    @staticmethod
+    def apply(dbapi_conn, pragmas):
+        """ Sets PRAGMA values on new DB-API connection
+
+        :param dbapi_conn: (sqlite3.Connection)
+        :param pragmas: (Dict[str, str])
+        :return:
+        """
+        cursor = dbapi_conn.cursor()
+        try:
+            for pragma in SQLiteProfile.PRAGMAS:
+                if pragma not in pragmas:
+                    continue
+                try:
+                    cursor.execute("PRAGMA %s = %s" % (pragma, pragmas[pragma]))
+                except sqlite3.OperationalError:
+                    # Journal mode cannot be changed while other connections are open, and is kept in database file
+                    if pragma != "journal_mode":
+                        raise
+        finally:
+            cursor.close()
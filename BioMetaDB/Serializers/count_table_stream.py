@@ -0,0 +1,294 @@
+from array import array
+
+"""
+Script holds CountTableStream, which reads count tables in fixed-size batches of rows.
+Each batch is stored by column, with values parsed once into typed arrays
+
+"""
+
+
+class ColumnBatch:
+    """ Single column of a RowBatch, parsed into a typed array with a null mask
+
+    """
+    typecodes = {
+        int:    "q",
+        float:  "d",
+        bool:   "b",
+    }
+    # Types to try, in order, when a value cannot be parsed as the requested type
+    widen_to = {
+        bool:   str,
+        int:    float,
+        float:  str,
+    }
+    null_values = ("", "None")
+    __slots__ = ("py_type", "values", "nulls")
+
+    @staticmethod
+    def wider(py_type, other):
+        """ Returns the wider of two types, where other is wider if py_type widens to it
+
+        :param py_type: (type)
+        :param other: (type)
+        :return type:
+        """
+        _type = py_type
+        while _type in ColumnBatch.widen_to.keys():
+            _type = ColumnBatch.widen_to[_type]
+            if _type == other:
+                return other
+        return py_type
+
+    def __init__(self, py_type, raw_values):
+        """ Parses list of raw strings into typed storage.
+        Values that cannot be parsed as py_type widen the column (int -> float -> str, bool -> str)
+
+        :param py_type: (type)  int, float, bool, or str
+        :param raw_values: (List[str])  Values as read from file
+        """
+        self.nulls = bytearray(len(raw_values))
+        self.py_type = py_type if py_type in ColumnBatch.widen_to.keys() else str
+        self.values = None
+        while self.values is None:
+            try:
+                self.values = self._parse(raw_values)
+            except ValueError:
+                self.py_type = ColumnBatch.widen_to[self.py_type]
+
+    def _parse(self, raw_values):
+        """ Protected method parses values into array (or list for str)
+
+        :param raw_values: (List[str])
+        :return array|list:
+        """
+        i = 0
+        if self.py_type == str:
+            values = []
+            for value in raw_values:
+                if value in ColumnBatch.null_values:
+                    self.nulls[i] = 1
+                    values.append(None)
+                else:
+                    values.append(value)
+                i += 1
+            return values
+        values = array(ColumnBatch.typecodes[self.py_type])
+        for value in raw_values:
+            if value in ColumnBatch.null_values:
+                self.nulls[i] = 1
+                values.append(0)
+            else:
+                values.append(ColumnBatch._convert(self.py_type, value))
+            i += 1
+        return values
+
+    @staticmethod
+    def _convert(py_type, value):
+        """ Protected method converts single string to numeric/boolean storage value
+
+        :param py_type: (type)
+        :param value: (str)
+        :return:
+        """
+        if py_type == bool:
+            if value == "True":
+                return 1
+            elif value == "False":
+                return 0
+            raise ValueError
+        return py_type(value)
+
+    def get(self, i):
+        """ Returns value at index as python object, or None if null
+
+        :param i: (int)
+        :return:
+        """
+        if self.nulls[i]:
+            return None
+        if self.py_type == bool:
+            return bool(self.values[i])
+        return self.values[i]
+
+    def __len__(self):
+        return len(self.nulls)
+
+    def __iter__(self):
+        for i in range(len(self.nulls)):
+            yield self.get(i)
+
+
+class RowBatch:
+    """ Fixed-size batch of rows from a count table, stored by column
+
+    """
+    __slots__ = ("ids", "header", "columns")
+
+    def __init__(self, ids, header, columns):
+        """
+
+        :param ids: (List[str])     Record ids, in file order
+        :param header: (List[str])  Column names
+        :param columns: (List[ColumnBatch])     Parsed columns, aligned with header
+        """
+        self.ids = ids
+        self.header = header
+        self.columns = columns
+
+    def row(self, i):
+        """ Returns values of row at index
+
+        :param i: (int)
+        :return List[object]:
+        """
+        return [column.get(i) for column in self.columns]
+
+    def rows(self):
+        """ Generator yields (id, values) for each row in batch
+
+        :return:
+        """
+        for i in range(len(self.ids)):
+            yield self.ids[i], self.row(i)
+
+    def __len__(self):
+        return len(self.ids)
+
+
+class CountTableStream:
+    BATCH_SIZE = 10000
+
+    def __init__(self, file_name, batch_size=None):
+        """ Class reads count tables in batches, keeping at most batch_size rows in memory.
+        Header is read on creation, same as CountTable
+
+        :param file_name: (str)     count table output (from KEGG workflow)
+        :param batch_size: (int)    Number of rows per batch
+        """
+        self.file_name = file_name
+        self.batch_size = batch_size or CountTableStream.BATCH_SIZE
+        self.header = self._read_header()
+        self._sample = None
+        self._sample_size = 0
+        # Column name: type, for columns with values that did not fit the type passed to batches
+        self.widened = {}
+
+    def _read_header(self):
+        """ Protected method reads header line, removing empty tabs that may exist on header line
+
+        :return List[str]:
+        """
+        with open(self.file_name, "rb") as R:
+            return [val for val in R.readline().decode().rstrip("\r\n").split("\t")[1:] if val != ""]
+
+    def raw_batches(self):
+        """ Generator yields (ids, rows) for each batch, with rows as lists of unparsed strings
+        padded/truncated to length of header
+
+        :return:
+        """
+        header_len = len(self.header)
+        ids = []
+        rows = []
+        with open(self.file_name, "rb") as R:
+            R.readline()
+            for _line in R:
+                # ID/key is first item on line
+                line = _line.decode().rstrip("\r\n").split("\t")
+                if line[0] == "":
+                    continue
+                ids.append(line[0])
+                line = line[1:header_len + 1]
+                if len(line) < header_len:
+                    line.extend("" for _ in range(header_len - len(line)))
+                rows.append(line)
+                if len(ids) == self.batch_size:
+                    yield ids, rows
+                    ids = []
+                    rows = []
+        if ids:
+            yield ids, rows
+
+    def sample(self, sample_size=None):
+        """ Returns unparsed rows from start of file, used for type inference
+
+        :param sample_size: (int)   Number of rows to return, default is one batch
+        :return List[List[str]]:
+        """
+        sample_size = sample_size or self.batch_size
+        if self._sample is None or self._sample_size < sample_size:
+            self._sample = []
+            self._sample_size = sample_size
+            batches = self.raw_batches()
+            try:
+                for ids, rows in batches:
+                    self._sample.extend(rows)
+                    if len(self._sample) >= sample_size:
+                        break
+            finally:
+                batches.close()
+        return self._sample[:sample_size]
+
+    def batches(self, types):
+        """ Generator yields RowBatch objects with each column parsed into its type
+        Columns with values that do not fit their type are widened, recorded in widened, and parsed as the
+        wider type in later batches
+
+        :param types: (Dict[str, type])     Column name: python type, as from TypeMapper.
+                                            Columns not present are parsed as str
+        :return:
+        """
+        column_types = [types.get(head, str) for head in self.header]
+        self.widened = {}
+        for ids, rows in self.raw_batches():
+            columns = [ColumnBatch(column_types[i], [row[i] for row in rows]) for i in range(len(self.header))]
+            for i in range(len(self.header)):
+                if columns[i].py_type != column_types[i]:
+                    column_types[i] = ColumnBatch.wider(column_types[i], columns[i].py_type)
+                    self.widened[self.header[i]] = column_types[i]
+            yield RowBatch(ids, self.header, columns)
+
+
+class UpdateDataStream(CountTableStream):
+    def __init__(self, update_data, batch_size=None):
+        """ Class reads an in-memory UpdateData object in batches, in the same way that CountTableStream reads
+        a count table, so that it can be loaded without writing it to file
+
+        :param update_data: (UpdateData)
+        :param batch_size: (int)    Number of rows per batch
+        """
+        self.update_data = update_data
+        CountTableStream.__init__(self, None, batch_size)
+
+    def _read_header(self):
+        """ Protected method returns names of columns set for any record
+
+        :return List[str]:
+        """
+        return sorted(self.update_data.keys())
+
+    def raw_batches(self):
+        """ Generator yields (ids, rows) for each batch, with values as strings, as they would be written to file
+        Values that are not set, or are None, are written as "None". Only one batch is converted at a time
+
+        :return:
+        """
+        ids = self.update_data.ids
+        for start in range(0, len(ids), self.batch_size):
+            batch_ids = ids[start: start + self.batch_size]
+            values = [[UpdateDataStream._to_string(value)
+                       for value in self.update_data.getcol(head, None, start, start + self.batch_size)]
+                      for head in self.header]
+            yield batch_ids, [[column[i] for column in values] for i in range(len(batch_ids))]
+
+    @staticmethod
+    def _to_string(value):
+        """ Protected method returns value as it would be read from file
+
+        :param value:
+        :return str:
+        """
+        if value is None or value == "":
+            return "None"
+        return str(value)
@@ -51,6 +51,9 @@ cdef class FixFile:
             @       RECORD:    <RECORD_ID>:  <TABLE_NAME>
             @       BAD_LOCATION    DELETE
             @
+            @       RECORD:    <RECORD_ID>:  <TABLE_NAME>
+            @       BAD_CHECKSUM    NONE
+            @
             @
             @       FILE:    <FILE_ID>:  <TABLE_NAME>
             @       BAD_RECORD    NONE
@@ -60,6 +63,7 @@ cdef class FixFile:
             @       PROJECT INVALID_PATH:   working_dir path stored in config file is invalid
             @       RECORD  BAD_TYPE:       data type for record could not be determined
             @       RECORD  BAD_LOCATION:       stored file path for record does not exist
+            @       RECORD  BAD_CHECKSUM:       file contents do not match checksum stored when file was added to project store
             @       FILE    BAD_RECORD:     file exists in project directory with no assigned database id
             @
             @   For each issue, default actions are presented. The following fixes are available:
@@ -74,6 +78,9 @@ cdef class FixFile:
             @       RECORD:    <RECORD_ID>: <TABLE_NAME>
             @       BAD_LOCATION    FILE    /path/to/data_file.fna
             @
+            @       RECORD:    <RECORD_ID>: <TABLE_NAME>
+            @       BAD_CHECKSUM    FILE    /path/to/data_file.fna
+            @
             @
             @       FILE:    <FILE_ID>: <TABLE_NAME>
             @       BAD_RECORD    RECORD    record_id_in_database
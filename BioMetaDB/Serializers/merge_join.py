@@ -0,0 +1,233 @@
+import os
+import heapq
+import tempfile
+from itertools import groupby
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor
+
+"""
+Script holds MergeJoiner, which joins tsv files on their ID column using bounded memory
+Each input is read as a stream. Inputs that are not sorted by ID are sorted in chunks that are spilled to temporary files,
+and all sorted runs are combined with a k-way merge, so only one chunk of rows is held in memory at a time
+
+"""
+
+
+class MergeJoiner:
+    CHUNK_SIZE = 500000
+    WRITE_BATCH = 10000
+    # Most runs opened at once. Past this, runs are merged in passes into larger temporary runs
+    MAX_RUNS = 256
+    NA_REP = "None"
+
+    def __init__(self, combine=False, chunk_size=None, tmp_dir=None, workers=1):
+        """ Class joins tsv files, each with a header line and IDs in the first column
+
+        :param combine: (bool)  Join values of an ID/column found more than once with ",", otherwise the last value is kept
+        :param chunk_size: (int)    Number of rows sorted in memory before spilling to a temporary file
+        :param tmp_dir: (str)   Directory for temporary files, default is the system's
+        :param workers: (int)   Number of input files prepared at once, in separate processes
+        """
+        self.combine = combine
+        self.chunk_size = chunk_size or MergeJoiner.CHUNK_SIZE
+        self.tmp_dir = tmp_dir
+        self.workers = workers
+
+    @staticmethod
+    def read_header(tsv_file_path):
+        """ Returns column names of tsv file, not including ID column
+
+        :param tsv_file_path: (str)
+        :return List[str]:
+        """
+        with open(tsv_file_path, "r") as R:
+            return R.readline().rstrip("\r\n").split("\t")[1:]
+
+    @staticmethod
+    def join_headers(headers):
+        """ Returns column names of all files, in order of first appearance
+
+        :param headers: (Iterable[List[str]])
+        :return List[str]:
+        """
+        return list(dict.fromkeys(head for header in headers for head in header))
+
+    def join(self, tsv_file_paths, out_tsv_path):
+        """ Writes rows of all files, joined on ID and sorted by ID, to out_tsv_path.
+        Columns are in order of first appearance, and values not present in any file are written as None
+
+        :param tsv_file_paths: (List[str])
+        :param out_tsv_path: (str)
+        :return int:    Number of rows written
+        """
+        for tsv_file_path in tsv_file_paths:
+            assert os.path.exists(tsv_file_path), "%s does not exist" % tsv_file_path
+        headers = [MergeJoiner.read_header(tsv_file_path) for tsv_file_path in tsv_file_paths]
+        header = MergeJoiner.join_headers(headers)
+        positions = {head: i for i, head in enumerate(header)}
+        jobs = [(tsv_file_path, self.chunk_size, self.tmp_dir) for tsv_file_path in tsv_file_paths]
+        if self.workers > 1 and len(jobs) > 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                file_runs = list(executor.map(MergeJoiner._sorted_runs, *zip(*jobs)))
+        else:
+            file_runs = [MergeJoiner._sorted_runs(*job) for job in jobs]
+        # Runs are listed in file order, and merge keeps that order for equal IDs
+        runs = [(path, [positions[head] for head in file_header], not is_spilled, is_spilled)
+                for (paths, is_spilled), file_header in zip(file_runs, headers) for path in paths]
+        try:
+            while len(runs) > MergeJoiner.MAX_RUNS:
+                runs = self._merge_pass(runs)
+            return self._write(heapq.merge(*[MergeJoiner._read_run(*run[:3]) for run in runs], key=itemgetter(0)),
+                               header, out_tsv_path)
+        finally:
+            for path, _, _, is_temporary in runs:
+                if is_temporary:
+                    os.remove(path)
+
+    def _merge_pass(self, runs):
+        """ Protected method merges each group of MAX_RUNS consecutive runs into a single temporary run,
+        removing temporary runs that were merged. Merged runs hold (column index, value) pairs of the joined header
+
+        :param runs: (List[Tuple[str, List[int], bool, bool]])  Path, column positions, has header, is temporary
+        :return List[Tuple[str, List[int], bool, bool]]:
+        """
+        merged = []
+        try:
+            for i in range(0, len(runs), MergeJoiner.MAX_RUNS):
+                group = runs[i: i + MergeJoiner.MAX_RUNS]
+                fd, path = tempfile.mkstemp(prefix="mergejoin", suffix=".tsv", dir=self.tmp_dir)
+                merged.append((path, None, False, True))
+                lines = []
+                with os.fdopen(fd, "w") as W:
+                    for _id, cells in heapq.merge(*[MergeJoiner._read_run(*run[:3]) for run in group],
+                                                  key=itemgetter(0)):
+                        lines.append("\t".join([_id] + ["%i:%s" % cell for cell in cells]) + "\n")
+                        if len(lines) >= MergeJoiner.WRITE_BATCH:
+                            W.writelines(lines)
+                            lines = []
+                    W.writelines(lines)
+        except BaseException:
+            for path, _, _, _ in merged:
+                os.remove(path)
+            raise
+        for path, _, _, is_temporary in runs:
+            if is_temporary:
+                os.remove(path)
+        return merged
+
+    def _write(self, rows, header, out_tsv_path):
+        """ Protected method combines rows with equal IDs and writes them in batches
+
+        :param rows: (Iterable[Tuple[str, List[Tuple[int, str]]]])  ID and (column index, value) pairs, sorted by ID
+        :param header: (List[str])
+        :param out_tsv_path: (str)
+        :return int:    Number of rows written
+        """
+        num_columns = len(header)
+        lines = []
+        written = 0
+        with open(out_tsv_path, "w") as W:
+            W.write("\t".join(["ID"] + header) + "\n")
+            for _id, group in groupby(rows, key=itemgetter(0)):
+                values = [None] * num_columns
+                for _, cells in group:
+                    for i, value in cells:
+                        if self.combine and values[i] is not None:
+                            values[i] += "," + value
+                        else:
+                            values[i] = value
+                lines.append("\t".join([_id] + [MergeJoiner.NA_REP if value is None else value
+                                                for value in values]) + "\n")
+                if len(lines) >= MergeJoiner.WRITE_BATCH:
+                    W.writelines(lines)
+                    written += len(lines)
+                    lines = []
+            W.writelines(lines)
+        return written + len(lines)
+
+    @staticmethod
+    def _read_run(path, positions, has_header):
+        """ Protected method yields ID and (column index, value) pairs for each row of sorted tsv file
+
+        :param path: (str)  Sorted tsv file, or temporary file written by _sorted_runs
+        :param positions: (List[int])   Index in joined header of each column of file, None for runs written by
+            _merge_pass, whose values are stored with their index
+        :param has_header: (bool)   Skip first line of file
+        :return:
+        """
+        with open(path, "r") as R:
+            if has_header:
+                R.readline()
+            for _line in R:
+                line = _line.rstrip("\r\n").split("\t")
+                if line[0] == "":
+                    continue
+                if positions is None:
+                    yield line[0], [(int(cell[:cell.index(":")]), cell[cell.index(":") + 1:]) for cell in line[1:]]
+                else:
+                    yield line[0], list(zip(positions, line[1:len(positions) + 1]))
+
+    @staticmethod
+    def _is_sorted(tsv_file_path):
+        """ Protected method checks if rows of tsv file are sorted by ID
+
+        :param tsv_file_path: (str)
+        :return bool:
+        """
+        previous = ""
+        with open(tsv_file_path, "r") as R:
+            R.readline()
+            for _line in R:
+                _id = _line.split("\t", 1)[0].rstrip("\r\n")
+                if _id == "":
+                    continue
+                if _id < previous:
+                    return False
+                previous = _id
+        return True
+
+    @staticmethod
+    def _sorted_runs(tsv_file_path, chunk_size, tmp_dir):
+        """ Protected method returns sorted runs of tsv file. Sorted files are used as they are,
+        otherwise chunks of chunk_size rows are sorted by ID and written to temporary files
+
+        :param tsv_file_path: (str)
+        :param chunk_size: (int)
+        :param tmp_dir: (str)
+        :return Tuple[List[str], bool]:     Paths of runs, and whether they are temporary files
+        """
+        if MergeJoiner._is_sorted(tsv_file_path):
+            return [tsv_file_path], False
+        paths = []
+        chunk = []
+        try:
+            with open(tsv_file_path, "r") as R:
+                R.readline()
+                for _line in R:
+                    if _line.split("\t", 1)[0].rstrip("\r\n") == "":
+                        continue
+                    chunk.append(_line if _line.endswith("\n") else _line + "\n")
+                    if len(chunk) >= chunk_size:
+                        paths.append(MergeJoiner._spill(chunk, tmp_dir))
+                        chunk = []
+            if chunk:
+                paths.append(MergeJoiner._spill(chunk, tmp_dir))
+        except BaseException:
+            for path in paths:
+                os.remove(path)
+            raise
+        return paths, True
+
+    @staticmethod
+    def _spill(chunk, tmp_dir):
+        """ Protected method sorts lines by ID, keeping file order for equal IDs, and writes them to temporary file
+
+        :param chunk: (List[str])
+        :param tmp_dir: (str)
+        :return str:    Path to temporary file
+        """
+        chunk.sort(key=lambda _line: _line.split("\t", 1)[0].rstrip("\r\n"))
+        fd, path = tempfile.mkstemp(prefix="mergejoin", suffix=".tsv", dir=tmp_dir)
+        with os.fdopen(fd, "w") as W:
+            W.writelines(chunk)
+        return path
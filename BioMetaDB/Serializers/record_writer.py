@@ -0,0 +1,110 @@
+import os
+import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from BioMetaDB.Accessories.bio_ops import BioOps
+
+"""
+Script holds RecordWriter, which copies the data files of records to an output directory, adding an annotation to
+each header line. Sequence lines are copied in blocks, gzip files are decompressed, and files are written in parallel
+
+"""
+
+
+class RecordWriter:
+    BLOCK_SIZE = 1048576
+    FASTA_HEADER = re.compile(rb"^(>[^\r\n]*)", re.M)
+
+    def __init__(self, workers=None):
+        """ RecordWriter writes files using a pool of threads. File reads, writes, and decompression release the GIL
+
+        :param workers: (int)   Number of files written at once, default is ThreadPoolExecutor's default
+        """
+        self.workers = workers or None
+
+    def write(self, jobs):
+        """ Writes each (source file, output file, annotation, data type) job in parallel
+
+        :param jobs: (Iterable[Tuple[str, str, str, str]])
+        :return int:    Number of files written
+        """
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            return sum(1 for _ in executor.map(lambda job: RecordWriter.write_file(*job), jobs))
+
+    @staticmethod
+    def write_file(source, out_file, annotation, data_type):
+        """ Copies source file to out_file, appending annotation to each header line.
+        Files without an annotation, or that are not fasta/fastq, are copied without changes
+
+        :param source: (str)    Path to data file, may be gzipped
+        :param out_file: (str)  Path to uncompressed output file
+        :param annotation: (str)    Text appended to headers, separated by a space
+        :param data_type: (str)     fasta or fastq
+        :return str:    out_file
+        """
+        annotation = annotation.encode()
+        with BioOps.open_file(source, "rb") as R, open(out_file, "wb") as W:
+            if annotation == b"" or data_type not in ("fasta", "fastq"):
+                shutil.copyfileobj(R, W, RecordWriter.BLOCK_SIZE)
+            elif data_type == "fasta":
+                RecordWriter._write_fasta(R, W, annotation)
+            else:
+                RecordWriter._write_fastq(R, W, annotation)
+        return out_file
+
+    @staticmethod
+    def _write_fasta(R, W, annotation):
+        """ Protected method copies fasta file in blocks, rewriting header lines within each block
+        Partial lines at the end of a block are carried over to the next block, so headers are never split
+
+        :param R: (file)    Source opened in binary mode
+        :param W: (file)    Output opened in binary mode
+        :param annotation: (bytes)
+        :return:
+        """
+        replacement = rb"\1 " + annotation.replace(b"\\", b"\\\\")
+        carry = b""
+        block = R.read(RecordWriter.BLOCK_SIZE)
+        while block:
+            block = carry + block
+            end = block.rfind(b"\n") + 1
+            if end == 0 and not block.startswith(b">"):
+                # Part of a sequence line longer than a block, which holds no header
+                end = len(block)
+            carry = block[end:]
+            W.write(RecordWriter.FASTA_HEADER.sub(replacement, block[:end]))
+            block = R.read(RecordWriter.BLOCK_SIZE)
+        if carry:
+            W.write(RecordWriter.FASTA_HEADER.sub(replacement, carry))
+
+    @staticmethod
+    def _write_fastq(R, W, annotation):
+        """ Protected method copies fastq file, rewriting the first line of each four-line record
+
+        :param R: (file)    Source opened in binary mode
+        :param W: (file)    Output opened in binary mode
+        :param annotation: (bytes)
+        :return:
+        """
+        lines = []
+        for i, line in enumerate(R):
+            if i % 4 == 0:
+                stripped = line.rstrip(b"\r\n")
+                line = stripped + b" " + annotation + line[len(stripped):]
+            lines.append(line)
+            if len(lines) >= 4096:
+                W.writelines(lines)
+                lines = []
+        W.writelines(lines)
+
+    @staticmethod
+    def out_file_name(output_dir, _id):
+        """ Returns name of output file for record, which is never compressed
+
+        :param output_dir: (str)
+        :param _id: (str)   Record id
+        :return str:
+        """
+        if _id.endswith(".gz"):
+            _id = _id[:-3]
+        return os.path.join(output_dir, _id)
@@ -1,48 +1,37 @@
 # cython: language_level=3
 import os
+from BioMetaDB.Serializers.merge_join import MergeJoiner
+
+
 class TSVJoiner:
-    def __init__(self, str tsv_file_path = ""):
-        self.header = set()
-        self.data = {}
+    def __init__(self, str tsv_file_path = "", int workers = 1):
+        """ Class joins tsv files on their ID column. Files are read when written, using MergeJoiner,
+        so only headers are held in memory
+
+        :param tsv_file_path: (str)     Optional first file to join
+        :param workers: (int)   Number of files prepared at once
+        """
+        self.header = []
+        self.files = []
+        self.workers = workers
 
         if os.path.exists(tsv_file_path):
             self.read_tsv(tsv_file_path)
 
-    def _join_header(self, list header):
-        cdef str _h
-        for _h in header:
-            self.header.add(_h)
-
     def read_tsv(self, str tsv_file_path):
+        """ Adds file to join, with its columns added to header in order
+
+        :param tsv_file_path: (str)
+        :return:
+        """
         assert os.path.exists(tsv_file_path), "%s does not exist" % tsv_file_path
-        cdef object R = open(tsv_file_path, "r")
-        header = next(R).rstrip("\r\n").split("\t")
-        cdef int header_len = len(header)
-        data = None
-        cdef str _line
-        self._join_header(header[1:])
-        for _line in R:
-            line = _line.rstrip("\r\n").split("\t")
-            data = self.data.get(line[0], None)
-            if data is None:
-                self.data[line[0]] = {}
-            for i in range(1,header_len):
-                self.data[line[0]][header[i]] = line[i]
-        R.close()
+        self.files.append(tsv_file_path)
+        self.header = MergeJoiner.join_headers([self.header, MergeJoiner.read_header(tsv_file_path)])
 
     def write_tsv(self, str out_tsv_path):
-        W = open(out_tsv_path, "w")
-        header_list = list(self.header)
-        cdef str head
-        cdef str _id
-        _out = ""
-        W.write("ID\t")
-        for head in header_list:
-            _out += head + "\t"
-        W.write(_out[:-1] + "\n")
-        for _id in self.data.keys():
-            _out = _id + "\t"
-            for head in header_list:
-                _out += self.data[_id].get(head, "None") + "\t"
-            W.write(_out[:-1] + "\n")
-        W.close()
+        """ Writes joined files, sorted by ID. Values in later files replace those in earlier files
+
+        :param out_tsv_path: (str)
+        :return int:    Number of rows written
+        """
+        return MergeJoiner(workers=self.workers).join(self.files, out_tsv_path)
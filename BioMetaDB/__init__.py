@@ -1,5 +1,5 @@
-from sqlalchemy.orm import mapper
 from BioMetaDB.Models.models import BaseData
+from BioMetaDB.Models.registry import Registry
 from BioMetaDB.Models.functions import Record
 from BioMetaDB.Config.config_manager import ConfigKeys
 from BioMetaDB.DataStructures.record_list import RecordList
@@ -21,15 +21,8 @@ def get_table(config_path, table_name=None, alias=None):
     cfg, config_path = ConfigManager.confirm_config_set(config_path)
     if alias:
         table_name = ConfigManager.get_name_by_alias(alias, cfg)
-    config = ConfigManager(cfg, table_name)
-    # Get session to return
-    engine = BaseData.get_engine(config.db_dir, config.db_name + ".db")
-    sess = BaseData.get_session_from_engine(engine)
-    # Generate table class and name based on presence of alias
-    TableClass = ClassManager.get_class_orm(table_name, engine)
-    UserClass = type(table_name, (Record,), {})
-    # Map to SQL orm
-    mapper(UserClass, TableClass)
+    # Get session to return, mapped class is loaded once per table
+    sess, UserClass, config = Registry.load_table_metadata(cfg, table_name)
     return RecordList(sess, UserClass, config)
 
 